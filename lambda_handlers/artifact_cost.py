@@ -1,13 +1,14 @@
 """Lambda handler for GET /artifact/{artifact_type}/{id}/cost."""
 
-import json
 from time import perf_counter
 from typing import Any, Dict
 
 from lambda_handlers.utils import (
+    ARTIFACT_TYPES,
     create_response,
     list_all_artifacts_from_s3,
     log_event,
+    log_invocation,
 )
 
 
@@ -27,12 +28,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     artifact_id = None
 
     try:
-        log_event(
-            "info",
-            f"artifact_cost invoked: {json.dumps(event)}",
-            event=event,
-            context=context,
-        )
+        log_invocation("artifact_cost", event, context)
 
         if event.get("httpMethod") == "OPTIONS":
             latency = perf_counter() - start_time
@@ -50,7 +46,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         artifact_type = path_params.get("artifact_type")
         artifact_id = path_params.get("id")
 
-        if not artifact_type or artifact_type not in ["model", "dataset", "code"]:
+        if not artifact_type or artifact_type not in ARTIFACT_TYPES:
             latency = perf_counter() - start_time
             log_event(
                 "warning",
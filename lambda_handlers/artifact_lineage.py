@@ -5,9 +5,11 @@ from time import perf_counter
 from typing import Any, Dict, List, Set
 
 from lambda_handlers.utils import (
+    json_loads,
     create_response,
     list_all_artifacts_from_s3,
     log_event,
+    log_invocation,
 )
 
 
@@ -33,7 +35,7 @@ def _extract_base_models(artifact_data: Dict[str, Any]) -> List[str]:
         rating = artifact_data.get("rating", {})
         if isinstance(rating, str):
             try:
-                rating = json.loads(rating)
+                rating = json_loads(rating)
             except (json.JSONDecodeError, TypeError):
                 rating = {}
         base_model = rating.get("base_model")
@@ -197,12 +199,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     artifact_id = None
 
     try:
-        log_event(
-            "info",
-            f"artifact_lineage invoked: {json.dumps(event)}",
-            event=event,
-            context=context,
-        )
+        log_invocation("artifact_lineage", event, context)
 
         if event.get("httpMethod") == "OPTIONS":
             latency = perf_counter() - start_time
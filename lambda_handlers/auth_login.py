@@ -4,7 +4,12 @@ import json
 from time import perf_counter
 from typing import Any, Dict
 
-from lambda_handlers.utils import create_response, handle_cors_preflight, log_event
+from lambda_handlers.utils import (
+    create_response,
+    handle_cors_preflight,
+    json_loads,
+    log_event,
+)
 from src.auth.exceptions import AuthError
 from src.auth.service import get_default_auth_service
 
@@ -20,7 +25,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict:
     try:
         # Body arrives as a JSON string from API Gateway; normalize to a dict.
         body_str = event.get("body", "{}")
-        body = json.loads(body_str) if isinstance(body_str, str) else body_str
+        body = json_loads(body_str) if isinstance(body_str, str) else body_str
     except json.JSONDecodeError:
         latency = perf_counter() - start_time
         log_event(
@@ -8,6 +8,7 @@ from lambda_handlers.utils import (
     create_response,
     get_header,
     handle_cors_preflight,
+    json_loads,
     log_event,
 )
 from src.auth.exceptions import AuthError, InvalidTokenError
@@ -40,7 +41,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict:
     try:
         # Convert JSON body to a dictionary for field extraction.
         body_str = event.get("body", "{}")
-        body = json.loads(body_str) if isinstance(body_str, str) else body_str
+        body = json_loads(body_str) if isinstance(body_str, str) else body_str
     except json.JSONDecodeError:
         latency = perf_counter() - start_time
         log_event(
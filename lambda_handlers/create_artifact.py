@@ -6,23 +6,26 @@ Registers a new artifact and evaluates it.
 
 import json
 from time import perf_counter
-import logging
 import os
 from typing import Dict, Any
 
 from lambda_handlers.utils import (
+    json_loads,
+    ARTIFACT_TYPES,
     create_response,
     evaluate_model,
     artifact_exists_in_s3,
     save_artifact_to_s3,
     MIN_NET_SCORE_THRESHOLD,
     log_event,
+    log_invocation,
     is_valid_artifact_url,
     upload_hf_files_to_s3,
     store_simple_zip,
 )
 from src.artifact_utils import generate_artifact_id
-from src.artifact_store import S3ArtifactStore
+from src.artifact_store import get_artifact_store
+from src.license_compatibility import normalize_license_string
 
 
 def handler(event: Dict[str, Any], context: Any) -> Dict:
@@ -40,12 +43,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict:
     artifact_id = None
 
     try:
-        log_event(
-            "info",
-            f"create_artifact invoked: {json.dumps(event)}",
-            event=event,
-            context=context,
-        )
+        log_invocation("create_artifact", event, context)
 
         # Handle OPTIONS preflight
         if event.get('httpMethod') == 'OPTIONS':
@@ -62,7 +60,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict:
 
         # Parse path parameter
         artifact_type = event.get('pathParameters', {}).get('artifact_type')
-        if not artifact_type or artifact_type not in ['model', 'dataset', 'code']:
+        if not artifact_type or artifact_type not in ARTIFACT_TYPES:
             latency = perf_counter() - start_time
             log_event(
                 "warning",
@@ -80,7 +78,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict:
         # Parse request body
         body_str = event.get('body', '{}')
         try:
-            body = json.loads(body_str) if isinstance(body_str, str) else body_str
+            body = json_loads(body_str) if isinstance(body_str, str) else body_str
         except json.JSONDecodeError:
             latency = perf_counter() - start_time
             log_event(
@@ -161,7 +159,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict:
             try:
                 # Create artifact store for tree_score metric
                 bucket_name = os.environ.get('ARTIFACTS_BUCKET')
-                artifact_store = S3ArtifactStore(bucket_name) if bucket_name else None
+                artifact_store = get_artifact_store() if bucket_name else None
 
                 rating = evaluate_model(url, artifact_store=artifact_store)
 
@@ -295,8 +293,12 @@ def handler(event: Dict[str, Any], context: Any) -> Dict:
         }
 
         # Add license to metadata if available (for models)
+        license_normalized = None
         if artifact_type == 'model' and 'license_str' in locals() and license_str:
             artifact_data["metadata"]["license"] = license_str
+            if isinstance(license_str, str):
+                # Normalized once at ingest so license checks can skip it
+                license_normalized = normalize_license_string(license_str)
 
         storage_data = {
             "url": url,
@@ -305,6 +307,9 @@ def handler(event: Dict[str, Any], context: Any) -> Dict:
             "data": artifact_data.get("data", {}),
             "type": artifact_type,
         }
+        if license_normalized:
+            # Stored outside metadata, which is returned verbatim by the API
+            storage_data["license_normalized"] = license_normalized
 
         # Add base_model to artifact data if present (for lineage tracking)
         if base_model is not None:
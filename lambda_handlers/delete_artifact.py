@@ -1,19 +1,30 @@
 """Lambda handler for DELETE /artifacts/{artifact_type}/{id}."""
 
-import json
 import os
 from time import perf_counter
 from typing import Any, Dict
 
-import boto3
 from botocore.exceptions import ClientError
+from botocore.session import get_session
 
 from lambda_handlers.utils import (
+    ARTIFACT_TYPES,
     create_response,
     load_artifact_from_s3,
     log_event,
+    log_invocation,
+    remove_artifact_from_name_index,
 )
 
+# Created on the first delete and reused by later warm invocations
+_S3_CLIENT: Dict[str, Any] = {"client": None}
+
+
+def _get_s3_client() -> Any:
+    if _S3_CLIENT["client"] is None:
+        _S3_CLIENT["client"] = get_session().create_client("s3")
+    return _S3_CLIENT["client"]
+
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """Delete a single artifact by ID.
@@ -34,12 +45,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     artifact_id = None
 
     try:
-        log_event(
-            "info",
-            f"delete_artifact invoked: {json.dumps(event)}",
-            event=event,
-            context=context,
-        )
+        log_invocation("delete_artifact", event, context)
 
         # Handle OPTIONS preflight
         if event.get("httpMethod") == "OPTIONS":
@@ -60,7 +66,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         artifact_id = path_params.get("id")
 
         # Validate artifact_type
-        if not artifact_type or artifact_type not in ["model", "dataset", "code"]:
+        if not artifact_type or artifact_type not in ARTIFACT_TYPES:
             latency = perf_counter() - start_time
             log_event(
                 "warning",
@@ -151,10 +157,11 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             )
 
         try:
-            s3_client = boto3.client("s3")
+            s3_client = _get_s3_client()
             s3_key = f"artifacts/{artifact_id}.json"
 
             s3_client.delete_object(Bucket=bucket_name, Key=s3_key)
+            remove_artifact_from_name_index(artifact_id)
 
             latency = perf_counter() - start_time
             log_event(
@@ -13,8 +13,51 @@ from lambda_handlers.utils import (
     BUCKET_NAME,
     s3_client,
     ClientError,
+    CORS_HEADERS,
 )
 
+# Response headers for the zip payload; constant, so built once at cold start.
+_DOWNLOAD_HEADERS: Dict[str, str] = {
+    "Content-Type": "application/zip",
+    "Content-Disposition": "attachment; filename=\"data.zip\"",
+    **CORS_HEADERS,
+}
+
+# Read size for streaming the zip out of S3
+_READ_CHUNK_SIZE = 1 << 20
+
+
+def _read_object_body(obj: Dict[str, Any]) -> bytearray:
+    """
+    Read an S3 get_object body into a single buffer sized from ContentLength.
+
+    Chunks are copied straight into a preallocated bytearray, avoiding the
+    intermediate full-size bytes object that Body.read() would build.
+    """
+    body = obj["Body"]
+    size = int(obj.get("ContentLength") or 0)
+    if not size:
+        # Unknown length: fall back to a single read
+        return bytearray(body.read())
+
+    buf = bytearray(size)
+    view = memoryview(buf)
+    offset = 0
+    for chunk in body.iter_chunks(chunk_size=_READ_CHUNK_SIZE):
+        end = offset + len(chunk)
+        if end > size:
+            # Body longer than advertised; append the remainder
+            view.release()
+            buf[offset:] = chunk
+            buf.extend(body.read())
+            return buf
+        view[offset:end] = chunk
+        offset = end
+    view.release()
+    if offset < size:
+        del buf[offset:]
+    return buf
+
 
 def handler(event: Dict[str, Any], context: Any) -> Dict:
     """
@@ -61,7 +104,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict:
 
     try:
         obj = s3_client.get_object(Bucket=BUCKET_NAME, Key=key)
-        data = obj["Body"].read()
+        data = _read_object_body(obj)
     except Exception as e:
         # Try to extract structured info if it's a botocore ClientError
         code = None
@@ -96,12 +139,6 @@ def handler(event: Dict[str, Any], context: Any) -> Dict:
     return {
         "statusCode": 200,
         "isBase64Encoded": True,
-        "headers": {
-            "Content-Type": "application/zip",
-            "Content-Disposition": "attachment; filename=\"data.zip\"",
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Headers": "Content-Type,X-Authorization",
-            "Access-Control-Allow-Methods": "GET,POST,PUT,DELETE,OPTIONS",
-        },
+        "headers": _DOWNLOAD_HEADERS,
         "body": b64,
     }
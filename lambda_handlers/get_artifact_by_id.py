@@ -1,13 +1,14 @@
 """Lambda handler for GET /artifact/{artifact_type}/{id}."""
 
-import json
 from time import perf_counter
 from typing import Any, Dict
 
 from lambda_handlers.utils import (
+    ARTIFACT_TYPES,
     create_response,
-    list_all_artifacts_from_s3,
+    load_artifact_from_s3,
     log_event,
+    log_invocation,
 )
 
 
@@ -18,12 +19,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     artifact_id = None
 
     try:
-        log_event(
-            "info",
-            f"get_artifact_by_id invoked: {json.dumps(event)}",
-            event=event,
-            context=context,
-        )
+        log_invocation("get_artifact_by_id", event, context)
 
         if event.get("httpMethod") == "OPTIONS":
             latency = perf_counter() - start_time
@@ -41,7 +37,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         artifact_type = path_params.get("artifact_type")
         artifact_id = path_params.get("id")
 
-        if not artifact_type or artifact_type not in ["model", "dataset", "code"]:
+        if not artifact_type or artifact_type not in ARTIFACT_TYPES:
             latency = perf_counter() - start_time
             log_event(
                 "warning",
@@ -77,9 +73,8 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 },
             )
 
-        all_artifacts = list_all_artifacts_from_s3()
-
-        artifact_data = all_artifacts.get(artifact_id)
+        # Point read of the single object instead of listing the whole bucket
+        artifact_data = load_artifact_from_s3(artifact_id)
         if not artifact_data:
             latency = perf_counter() - start_time
             log_event(
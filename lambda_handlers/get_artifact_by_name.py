@@ -4,60 +4,42 @@ Lambda handler for GET /artifact/byName/{name}
 Returns metadata for all artifacts matching the provided name.
 """
 
-import json
-import logging
 from time import perf_counter
 from typing import Dict, Any
 
 from lambda_handlers.utils import (
     create_response,
-    list_all_artifacts_from_s3,
+    load_name_index,
     log_event,
-)
-
-# Configure logging for Lambda (outputs to CloudWatch Logs)
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(levelname)s %(message)s'
+    log_invocation,
+    name_index_ids_by_name,
 )
 
 
-def handler(event: Dict[str, Any], context: Any) -> Dict:
-    """
-    Lambda handler for GET /artifact/byName/{name}
+def _handle_options(event: Dict[str, Any], context: Any, start_time: float) -> Dict:
+    """Answer a CORS preflight without logging the event."""
+    latency = perf_counter() - start_time
+    log_event(
+        "info",
+        "Handled OPTIONS preflight for get_artifact_by_name",
+        event=event,
+        context=context,
+        latency=latency,
+        status=200,
+    )
+    return create_response(200, {})
 
-    Returns metadata for all artifacts matching the provided name.
 
-    API Gateway Event Structure:
-    - event['pathParameters']['name'] - Artifact name to search for
-    - event['headers']['X-Authorization'] - Auth token (optional)
-    """
-    start_time = perf_counter()
+def _handle_get_by_name(event: Dict[str, Any], context: Any, start_time: float) -> Dict:
+    """Return metadata for every artifact whose name matches, ignoring case."""
     artifact_name = None
 
     try:
-        log_event(
-            "info",
-            f"get_artifact_by_name invoked: {json.dumps(event)}",
-            event=event,
-            context=context,
-        )
-
-        # Handle OPTIONS preflight
-        if event.get('httpMethod') == 'OPTIONS':
-            latency = perf_counter() - start_time
-            log_event(
-                "info",
-                "Handled OPTIONS preflight for get_artifact_by_name",
-                event=event,
-                context=context,
-                latency=latency,
-                status=200,
-            )
-            return create_response(200, {})
+        log_invocation("get_artifact_by_name", event, context)
 
         # Parse path parameter
-        name = event.get('pathParameters', {}).get('name')
+        path_params = event.get('pathParameters') or {}
+        name = path_params.get('name')
         artifact_name = name
         if not name:
             latency = perf_counter() - start_time
@@ -74,16 +56,12 @@ def handler(event: Dict[str, Any], context: Any) -> Dict:
                 "error": "There is missing field(s) in the artifact_name or it is formed improperly, or is invalid."
             })
 
-        # Search for artifacts with matching name in S3
-        all_artifacts = list_all_artifacts_from_s3()
-        matching_artifacts = []
-        for artifact_id, artifact_data in all_artifacts.items():
-            artifact_metadata = artifact_data.get("metadata", {})
-            artifact_name = artifact_metadata.get("name", "")
-
-            # Case-insensitive comparison
-            if artifact_name.lower() == name.lower():
-                matching_artifacts.append(artifact_metadata)
+        # Case-insensitive match via the lowercase-name lookup
+        name_index = load_name_index()
+        matching_artifacts = [
+            name_index["artifacts"][artifact_id]
+            for artifact_id in name_index_ids_by_name(name_index).get(name.lower(), ())
+        ]
 
         # Return 404 if no matches found
         if not matching_artifacts:
@@ -126,3 +104,25 @@ def handler(event: Dict[str, Any], context: Any) -> Dict:
             exc_info=True,
         )
         return create_response(500, {"error": f"Internal server error: {str(e)}"})
+
+
+# Per-method handlers. HTTP API (payload v2) events carry no httpMethod, so
+# anything not listed here falls through to the lookup itself.
+_DISPATCH = {
+    "OPTIONS": _handle_options,
+}
+
+
+def handler(event: Dict[str, Any], context: Any) -> Dict:
+    """
+    Lambda handler for GET /artifact/byName/{name}
+
+    Returns metadata for all artifacts matching the provided name.
+
+    API Gateway Event Structure:
+    - event['pathParameters']['name'] - Artifact name to search for
+    - event['headers']['X-Authorization'] - Auth token (optional)
+    """
+    start_time = perf_counter()
+    method = event.get('httpMethod') or ''
+    return _DISPATCH.get(method, _handle_get_by_name)(event, context, start_time)
@@ -9,6 +9,60 @@ from datetime import datetime, timedelta, timezone
 from typing import Any, Dict
 from lambda_handlers.utils import BUCKET_NAME, create_response, handle_cors_preflight, s3_client, log_event
 
+# Health probes arrive far more often than artifacts change; reuse the
+# artifact count for this many seconds before listing the bucket again.
+ARTIFACT_COUNT_TTL_SECONDS = 30.0
+_ARTIFACT_COUNT_CACHE: Dict[str, Any] = {"ts": None, "count": 0}
+
+# Time window for recent metrics (60 minutes)
+WINDOW_MINUTES = 60
+_WINDOW = timedelta(minutes=WINDOW_MINUTES)
+
+# Fields that never change between probes
+_BASE_BODY: Dict[str, Any] = {
+    "status": "healthy",
+    "service": "acme-package-registry",
+    "window_minutes": WINDOW_MINUTES,
+}
+
+
+def _utc_timestamp(moment: datetime) -> str:
+    """Format an aware UTC datetime as ISO-8601 with a trailing Z."""
+    return moment.isoformat(timespec="seconds").replace("+00:00", "Z")
+
+
+def _count_artifacts() -> int:
+    """Return the number of stored artifacts, cached for ARTIFACT_COUNT_TTL_SECONDS.
+
+    Lists only the top level of artifacts/ (Delimiter="/") so per-artifact
+    zip/model files are not enumerated, and pages through the listing since a
+    single list_objects_v2 call stops at 1000 keys. Returns 0 when S3 is not
+    configured.
+    """
+    if not s3_client or not BUCKET_NAME:
+        return 0
+
+    now = perf_counter()
+    cached_ts = _ARTIFACT_COUNT_CACHE["ts"]
+    if cached_ts is not None and now - cached_ts < ARTIFACT_COUNT_TTL_SECONDS:
+        return _ARTIFACT_COUNT_CACHE["count"]
+
+    count = 0
+    paginator = s3_client.get_paginator("list_objects_v2")
+    for page in paginator.paginate(
+        Bucket=BUCKET_NAME,
+        Prefix="artifacts/",
+        Delimiter="/",
+        PaginationConfig={"PageSize": 1000},
+    ):
+        count += sum(
+            1 for obj in page.get("Contents", []) if obj["Key"].endswith(".json")
+        )
+
+    _ARTIFACT_COUNT_CACHE["ts"] = now
+    _ARTIFACT_COUNT_CACHE["count"] = count
+    return count
+
 
 def handler(event: Dict[str, Any], context: Any) -> Dict:
     """
@@ -43,10 +97,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict:
     artifact_count = 0
     if s3_client and BUCKET_NAME:
         try:
-            response = s3_client.list_objects_v2(
-                Bucket=BUCKET_NAME, Prefix="artifacts/"
-            )
-            artifact_count = response.get("KeyCount", 0)
+            artifact_count = _count_artifacts()
         except Exception as e:
             latency = perf_counter() - start_time
             log_event(
@@ -69,18 +120,14 @@ def handler(event: Dict[str, Any], context: Any) -> Dict:
         status=200,
     )
 
-    # Time window for recent metrics (60 minutes)
-    window_minutes = 60
     now = datetime.now(timezone.utc)
-    window_start = now - timedelta(minutes=window_minutes)
+    now_str = _utc_timestamp(now)
 
     body = {
-        "status": "healthy",
-        "service": "acme-package-registry",
-        "timestamp": now.isoformat() + "Z",
-        "window_minutes": window_minutes,
-        "window_start": window_start.isoformat() + "Z",
-        "window_end": now.isoformat() + "Z",
+        **_BASE_BODY,
+        "timestamp": now_str,
+        "window_start": _utc_timestamp(now - _WINDOW),
+        "window_end": now_str,
         "artifacts_count": artifact_count,
     }
 
@@ -4,18 +4,21 @@ Lambda handler for GET /health/live
 Simple health check endpoint. Returns only whether the service is available.
 """
 
-import json
 from typing import Dict, Any
 from lambda_handlers.utils import handle_cors_preflight
-	
+
+# The liveness response never changes; serialized once at cold start
+_UP_RESPONSE: Dict[str, Any] = {
+    "statusCode": 200,
+    "body": '{"status": "UP"}',
+}
+
+
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Simple liveness check. If endpoint is reachable and returns 200, the service is considered live.
     """
-    if event.get("httpMethod", "") == "OPTIONS":
+    if event.get("httpMethod") == "OPTIONS":
         return handle_cors_preflight(event)
-    
-    return {
-        "statusCode": 200,
-        "body": json.dumps({"status": "UP"})
-    }
+
+    return _UP_RESPONSE
@@ -6,21 +6,33 @@ Checks license compatibility between an artifact and a GitHub repository.
 
 import json
 from time import perf_counter
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 from lambda_handlers.utils import (
     create_response,
+    json_loads,
     load_artifact_from_s3,
     log_event,
+    log_invocation,
 )
 from src.license_compatibility import (
     check_license_compatibility,
-    fetch_github_license,
+    fetch_github_repo_license,
     normalize_license_string,
+    parse_github_url,
     GitHubAPIError,
     LicenseNotFoundError,
 )
 
+# The compatibility verdict is the only 200 body, so both responses are built
+# once; the Lambda runtime only serializes the returned dict.
+_RESP_TRUE = create_response(200, True)
+_RESP_FALSE = create_response(200, False)
+
+# Shared read-only default for artifacts stored without metadata
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
@@ -43,12 +55,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     artifact_id = None
 
     try:
-        log_event(
-            "info",
-            f"license_check invoked: {json.dumps(event)}",
-            event=event,
-            context=context,
-        )
+        log_invocation("license_check", event, context)
 
         # Handle OPTIONS preflight for CORS
         if event.get("httpMethod") == "OPTIONS":
@@ -84,7 +91,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         body_str = event.get("body", "{}")
         try:
             body = (
-                json.loads(body_str) if isinstance(body_str, str) else body_str
+                json_loads(body_str) if isinstance(body_str, str) else body_str
             )
         except json.JSONDecodeError:
             latency = perf_counter() - start_time
@@ -99,8 +106,8 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             )
             return create_response(400, {"error": "Invalid JSON in request body"})
 
-        github_url = body.get("github_url", "").strip()
-        if not github_url:
+        github_url = body.get("github_url")
+        if not isinstance(github_url, str) or not github_url:
             latency = perf_counter() - start_time
             log_event(
                 "warning",
@@ -115,8 +122,9 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 400, {"error": "Missing required field: github_url"}
             )
 
-        # Validate GitHub URL format
-        if not github_url.startswith("https://github.com/"):
+        # Validate GitHub URL format; parsed once and reused for the lookup
+        repo_ref = parse_github_url(github_url)
+        if repo_ref is None:
             latency = perf_counter() - start_time
             log_event(
                 "warning",
@@ -149,9 +157,8 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             return create_response(404, {"error": "Artifact does not exist."})
 
         # Verify it's a model (endpoint is /artifact/model/{id}/license-check)
-        artifact_type = artifact.get("metadata", {}).get("type") or artifact.get(
-            "type"
-        )
+        metadata = artifact.get("metadata") or _EMPTY
+        artifact_type = metadata.get("type") or artifact.get("type")
         if artifact_type != "model":
             latency = perf_counter() - start_time
             log_event(
@@ -169,7 +176,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             )
 
         # Extract artifact license from metadata
-        artifact_license_raw = artifact.get("metadata", {}).get("license")
+        artifact_license_raw = metadata.get("license")
 
         if not artifact_license_raw:
             # If artifact has no license, consider it incompatible
@@ -183,10 +190,12 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 latency=latency,
                 status=200,
             )
-            return create_response(200, False)
+            return _RESP_FALSE
 
-        # Normalize artifact license
-        artifact_license = normalize_license_string(artifact_license_raw)
+        # Normalize artifact license (precomputed at ingest for newer artifacts)
+        artifact_license = artifact.get("license_normalized")
+        if not artifact_license:
+            artifact_license = normalize_license_string(artifact_license_raw)
         if not artifact_license:
             # Failed to normalize license
             latency = perf_counter() - start_time
@@ -199,11 +208,11 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 latency=latency,
                 status=200,
             )
-            return create_response(200, False)
+            return _RESP_FALSE
 
         # Fetch GitHub repository license
         try:
-            github_license = fetch_github_license(github_url)
+            github_license = fetch_github_repo_license(*repo_ref)
         except LicenseNotFoundError as e:
             # GitHub repo has no license - incompatible
             latency = perf_counter() - start_time
@@ -216,7 +225,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 latency=latency,
                 status=200,
             )
-            return create_response(200, False)
+            return _RESP_FALSE
         except GitHubAPIError as e:
             error_msg = str(e).lower()
             if "404" in error_msg or "not found" in error_msg:
@@ -267,7 +276,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             latency=latency,
             status=200,
         )
-        return create_response(200, is_compatible)
+        return _RESP_TRUE if is_compatible else _RESP_FALSE
 
     except Exception as e:
         latency = perf_counter() - start_time
@@ -1,17 +1,41 @@
 """Lambda handler for POST /artifacts.
 
 Returns paginated metadata for artifacts that match the supplied queries.
+Matches are resolved from the name index, so no artifact objects are read.
 """
 
+import heapq
 import json
 import os
-from time import perf_counter
-from typing import Any, Dict, Iterable, List, Optional, Sequence
-
-from lambda_handlers.utils import create_response, list_all_artifacts_from_s3, log_event
+from typing import Any, Dict, List, Optional
+
+from lambda_handlers.utils import (
+    collect_name_index_matches,
+    json_dumps,
+    json_loads,
+    load_name_index,
+    log_invocation,
+    TimedLog,
+    validate_artifact_queries,
+)
 
 PAGE_SIZE = int(os.getenv("ARTIFACTS_PAGE_SIZE", "50"))
 MAX_RESULTS = int(os.getenv("ARTIFACTS_MAX_RESULTS", "250"))
+# Upper bound on queries per request, checked before any are validated
+MAX_QUERIES = int(os.getenv("ARTIFACTS_MAX_QUERIES", "100"))
+# Bodies larger than this are rejected with 413 before any JSON parsing
+MAX_BODY_BYTES = int(os.getenv("LIST_ARTIFACTS_MAX_BODY_BYTES", str(64 * 1024)))
+
+# Fixed error bodies, encoded once (create_response passes strings through)
+_INVALID_QUERY_BODY = json_dumps(
+    {
+        "error": (
+            "There is missing field(s) in the artifact_query or it is formed"
+            " improperly, or is invalid."
+        )
+    }
+)
+_TOO_MANY_RESULTS_BODY = json_dumps({"error": "Too many artifacts returned."})
 
 
 def _normalize_offset(value: Optional[str]) -> Optional[int]:
@@ -26,208 +50,118 @@ def _normalize_offset(value: Optional[str]) -> Optional[int]:
     return offset if offset >= 0 else None
 
 
-def _matches_query(metadata: Dict[str, Any], query: Dict[str, Any]) -> bool:
-    name_query = query.get("name")
-    if not isinstance(name_query, str) or not name_query:
-        return False
-
-    artifact_name = str(metadata.get("name", ""))
-    if name_query != "*" and artifact_name.lower() != name_query.lower():
-        return False
-
-    types_filter = query.get("types")
-    # If types is provided and non-empty, filter by types
-    # If types is empty or not provided, match all types
-    if types_filter:  # Non-empty list
-        if metadata.get("type") not in types_filter:
-            return False
+def _sorted_page(
+    matches: Dict[str, Dict[str, Any]], names_lc: Dict[str, str], offset: int
+) -> List[Dict[str, Any]]:
+    """Return one page of matches in (name, id) order.
 
-    return True
+    Only the first offset + PAGE_SIZE entries are ordered (partial sort), and
+    names were lowercased when the index entry was written.
+    """
+    if offset >= len(matches):
+        return []
+    # Compare prebuilt (name, id) tuples directly instead of calling a key per id
+    keyed = ((names_lc.get(artifact_id, ""), artifact_id) for artifact_id in matches)
+    ordered = heapq.nsmallest(offset + PAGE_SIZE, keyed)
+    return [matches[artifact_id] for _, artifact_id in ordered[offset:]]
 
 
-def _collect_matches(
-    artifacts: Iterable[Dict[str, Any]], queries: Sequence[Dict[str, Any]]
-) -> List[Dict[str, Any]]:
-    results: Dict[str, Dict[str, Any]] = {}
+def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """Handle POST /artifacts requests."""
 
-    for query in queries:
-        if not isinstance(query, dict):
-            continue
-        name_query = query.get("name")
-        if not isinstance(name_query, str) or not name_query:
-            continue
+    with TimedLog(event, context) as timed:
+        try:
+            log_invocation("list_artifacts", event, context)
 
-        for artifact in artifacts:
-            metadata = artifact.get("metadata", {})
-            artifact_id = metadata.get("id")
-            if not artifact_id:
-                continue
+            if event.get("httpMethod") == "OPTIONS":
+                return timed.respond(
+                    200, {}, "Handled OPTIONS preflight for list_artifacts"
+                )
 
-            if _matches_query(metadata, query):
-                results[artifact_id] = metadata
+            query_params = event.get("queryStringParameters") or {}
+            offset_param = query_params.get("offset")
+            offset = _normalize_offset(offset_param)
+            if offset is None:
+                return timed.respond(
+                    400,
+                    {"error": "Invalid offset parameter."},
+                    "Invalid offset parameter supplied",
+                    level="warning",
+                    error_code="invalid_offset",
+                )
 
-    return sorted(
-        results.values(), key=lambda item: (str(item.get("name", "")).lower(), str(item.get("id", "")))
-    )
+            body_content = event.get("body", "[]")
+            if body_content is None:
+                body_content = "[]"
+            elif (
+                isinstance(body_content, (str, bytes))
+                and len(body_content) > MAX_BODY_BYTES
+            ):
+                return timed.respond(
+                    413,
+                    {"error": "Payload too large."},
+                    "Request body exceeds MAX_BODY_BYTES",
+                    level="warning",
+                    error_code="payload_too_large",
+                )
 
+            try:
+                queries = (
+                    json_loads(body_content)
+                    if isinstance(body_content, str)
+                    else body_content
+                )
+            except json.JSONDecodeError:
+                return timed.respond(
+                    400,
+                    _INVALID_QUERY_BODY,
+                    "Invalid JSON payload for list_artifacts",
+                    level="warning",
+                    error_code="invalid_payload",
+                )
 
-def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
-    """Handle POST /artifacts requests."""
+            invalid = validate_artifact_queries(queries, MAX_QUERIES)
+            if invalid is not None:
+                error_code, message = invalid
+                return timed.respond(
+                    400,
+                    _INVALID_QUERY_BODY,
+                    message,
+                    level="warning",
+                    error_code=error_code,
+                )
 
-    start_time = perf_counter()
+            name_index = load_name_index()
+            matches = collect_name_index_matches(name_index, queries, MAX_RESULTS)
 
-    try:
-        log_event(
-            "info",
-            f"list_artifacts invoked: {json.dumps(event)}",
-            event=event,
-            context=context,
-        )
+            if matches is None:
+                return timed.respond(
+                    413,
+                    _TOO_MANY_RESULTS_BODY,
+                    "Artifact query exceeded max results",
+                    level="warning",
+                    error_code="too_many_results",
+                )
 
-        if event.get("httpMethod") == "OPTIONS":
-            latency = perf_counter() - start_time
-            log_event(
-                "info",
-                "Handled OPTIONS preflight for list_artifacts",
-                event=event,
-                context=context,
-                latency=latency,
-                status=200,
-            )
-            return create_response(200, {})
-
-        offset_param = event.get("queryStringParameters", {}).get("offset") if event.get("queryStringParameters") else None
-        offset = _normalize_offset(offset_param)
-        if offset is None:
-            latency = perf_counter() - start_time
-            log_event(
-                "warning",
-                "Invalid offset parameter supplied",
-                event=event,
-                context=context,
-                latency=latency,
-                status=400,
-                error_code="invalid_offset",
-            )
-            return create_response(400, {"error": "Invalid offset parameter."})
+            page = _sorted_page(matches, name_index["name_lc"], offset)
+            headers: Dict[str, str] = {}
 
-        body_content = event.get("body", "[]")
-        if body_content is None:
-            body_content = "[]"
+            next_offset = offset + len(page)
+            if next_offset < len(matches):
+                headers["offset"] = str(next_offset)
 
-        try:
-            queries = json.loads(body_content) if isinstance(body_content, str) else body_content
-        except json.JSONDecodeError:
-            latency = perf_counter() - start_time
-            log_event(
-                "warning",
-                "Invalid JSON payload for list_artifacts",
-                event=event,
-                context=context,
-                latency=latency,
-                status=400,
-                error_code="invalid_payload",
+            return timed.respond(
+                200,
+                page,
+                f"Returning {len(page)} artifact(s) for list_artifacts",
+                headers=headers if headers else None,
             )
-            return create_response(400, {"error": "There is missing field(s) in the artifact_query or it is formed improperly, or is invalid."})
-
-        if not isinstance(queries, list) or not queries:
-            latency = perf_counter() - start_time
-            log_event(
-                "warning",
-                "Artifact queries missing or not a list",
-                event=event,
-                context=context,
-                latency=latency,
-                status=400,
-                error_code="invalid_query",
-            )
-            return create_response(400, {"error": "There is missing field(s) in the artifact_query or it is formed improperly, or is invalid."})
-
-        for query in queries:
-            if not isinstance(query, dict) or not isinstance(query.get("name"), str) or not query.get("name"):
-                latency = perf_counter() - start_time
-                log_event(
-                    "warning",
-                    "Invalid artifact query entry",
-                    event=event,
-                    context=context,
-                    latency=latency,
-                    status=400,
-                    error_code="invalid_query_entry",
-                )
-                return create_response(400, {"error": "There is missing field(s) in the artifact_query or it is formed improperly, or is invalid."})
-            if "types" in query:
-                types_value = query["types"]
-                if not isinstance(types_value, list):
-                    latency = perf_counter() - start_time
-                    log_event(
-                        "warning",
-                        "Invalid artifact types filter - not a list",
-                        event=event,
-                        context=context,
-                        latency=latency,
-                        status=400,
-                        error_code="invalid_types_filter",
-                    )
-                    return create_response(400, {"error": "There is missing field(s) in the artifact_query or it is formed improperly, or is invalid."})
-                # Only validate contents if types list is non-empty
-                if types_value and not all(isinstance(item, str) and item for item in types_value):
-                    latency = perf_counter() - start_time
-                    log_event(
-                        "warning",
-                        "Invalid artifact types filter - invalid type values",
-                        event=event,
-                        context=context,
-                        latency=latency,
-                        status=400,
-                        error_code="invalid_types_filter",
-                    )
-                    return create_response(400, {"error": "There is missing field(s) in the artifact_query or it is formed improperly, or is invalid."})
-
-        artifacts_map = list_all_artifacts_from_s3()
-        matches = _collect_matches(artifacts_map.values(), queries)
-
-        if len(matches) > MAX_RESULTS:
-            latency = perf_counter() - start_time
-            log_event(
-                "warning",
-                "Artifact query exceeded max results",
-                event=event,
-                context=context,
-                latency=latency,
-                status=413,
-                error_code="too_many_results",
+        except Exception as exc:  # pragma: no cover - guard against unexpected failures
+            return timed.respond(
+                500,
+                {"error": f"Internal server error: {str(exc)}"},
+                f"Unexpected error in list_artifacts: {exc}",
+                level="error",
+                error_code="unexpected_error",
+                exc_info=True,
             )
-            return create_response(413, {"error": "Too many artifacts returned."})
-
-        page = matches[offset : offset + PAGE_SIZE]
-        headers: Dict[str, str] = {}
-
-        next_offset = offset + len(page)
-        if next_offset < len(matches):
-            headers["offset"] = str(next_offset)
-
-        latency = perf_counter() - start_time
-        log_event(
-            "info",
-            f"Returning {len(page)} artifact(s) for list_artifacts",
-            event=event,
-            context=context,
-            latency=latency,
-            status=200,
-        )
-        return create_response(200, page, headers=headers if headers else None)
-    except Exception as exc:  # pragma: no cover - guard against unexpected failures
-        latency = perf_counter() - start_time
-        log_event(
-            "error",
-            f"Unexpected error in list_artifacts: {exc}",
-            event=event,
-            context=context,
-            latency=latency,
-            status=500,
-            error_code="unexpected_error",
-            exc_info=True,
-        )
-        return create_response(500, {"error": f"Internal server error: {str(exc)}"})
-
@@ -17,18 +17,24 @@ Expected artifact shape (best-effort, all optional):
 }
 """
 
-import json
-import logging
+import heapq
 import math
 import os
-from statistics import median
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
-from lambda_handlers.utils import create_response, list_all_artifacts_from_s3
-
-logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+from lambda_handlers.utils import (
+    create_response,
+    list_all_artifacts_from_s3,
+    log_invocation,
+    logger,
+)
 
+try:
+    # Bit-parallel C implementation; same distances as the DP below
+    from rapidfuzz.distance import Levenshtein as _rf_levenshtein
+except ImportError:
+    _rf_levenshtein = None
 
 # -----------------------------
 # Config via environment
@@ -37,33 +43,65 @@ AUDIT_SCORE_THRESHOLD = float(os.getenv("AUDIT_SCORE_THRESHOLD", "0.60"))
 MAX_AUDIT_RESULTS = int(os.getenv("MAX_AUDIT_RESULTS", "200"))
 # Comma-separated list of canonical/popular package names to compare against.
 # Example: "requests,numpy,pandas,tensorflow,torch,flask,react,express"
-TOP_PACKAGE_NAMES = [x.strip() for x in os.getenv("TOP_PACKAGE_NAMES", "").split(",") if x.strip()]
+TOP_PACKAGE_NAMES = tuple(
+    x.strip() for x in os.getenv("TOP_PACKAGE_NAMES", "").split(",") if x.strip()
+)
+
+# Similarities memoized per (lowercased name, TOP_PACKAGE_NAMES); warm
+# containers re-score only names they have not seen yet.
+SIMILARITY_CACHE_SIZE = int(os.getenv("AUDIT_SIMILARITY_CACHE_SIZE", "8192"))
 
 # If true, limit audit to artifacts where metadata.type == "code"
 AUDIT_CODE_ONLY = os.getenv("AUDIT_CODE_ONLY", "true").lower() in ("1", "true", "yes")
 
+# Scored rows keyed by artifact id -> (artifact dict, top names, row). The
+# listing hands back the same dict while an artifact's ETag is unchanged, so a
+# row is recomputed only for new or modified artifacts (or new top names).
+_AUDIT_ROWS: Dict[
+    str, Tuple[dict, Tuple[str, ...], Optional[Tuple[float, Dict[str, Any]]]]
+] = {}
+
 
 # -----------------------------
 # Utilities
 # -----------------------------
 
 def _levenshtein(a: str, b: str) -> int:
-    """Simple Levenshtein distance (O(len(a)*len(b)))."""
+    """Levenshtein distance; pure-Python O(len(a)*len(b)) without rapidfuzz."""
+    if _rf_levenshtein is not None:
+        return _rf_levenshtein.distance(a, b)
     if a == b:
         return 0
+
+    # A shared prefix/suffix never changes the distance, and typosquats share most
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end_a, end_b = len(a), len(b)
+    while end_a > start and end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    a, b = a[start:end_a], b[start:end_b]
     if not a:
         return len(b)
     if not b:
         return len(a)
+
+    # Two reused rows over the shorter string; explicit compares instead of min()
+    if len(a) < len(b):
+        a, b = b, a
     prev = list(range(len(b) + 1))
+    cur = [0] * (len(b) + 1)
     for i, ca in enumerate(a, 1):
-        cur = [i]
+        cur[0] = left = i
         for j, cb in enumerate(b, 1):
-            ins = cur[j - 1] + 1
-            dele = prev[j] + 1
-            sub = prev[j - 1] + (ca != cb)
-            cur.append(min(ins, dele, sub))
-        prev = cur
+            best = prev[j - 1] + (ca != cb)
+            if prev[j] + 1 < best:
+                best = prev[j] + 1
+            if left + 1 < best:
+                best = left + 1
+            cur[j] = left = best
+        prev, cur = cur, prev
     return prev[-1]
 
 
@@ -84,15 +122,14 @@ def _spike_factor(ts: List[int]) -> float:
     """
     Compute spike factor = max(ts) / (median(ts)+1).
     Higher means a sharper spike relative to baseline (bot-like bursts).
+    Max and median both come from a single sort of the (~30 point) series.
     """
     if not ts:
         return 0.0
-    try:
-        m = median(ts)
-    except Exception:
-        m = 0
-    denom = (m if m is not None else 0) + 1
-    return (max(ts) if ts else 0) / denom
+    ordered = sorted(ts)
+    mid = len(ordered) // 2
+    m = ordered[mid] if len(ordered) % 2 else (ordered[mid - 1] + ordered[mid]) / 2
+    return ordered[-1] / (m + 1)
 
 
 def _suspicion_score(
@@ -154,9 +191,83 @@ def _suspicion_score(
 
 
 def _best_similarity_to_top(name: str) -> float:
+    """Highest similarity of `name` to any top package name.
+
+    Returns 0.0 if no top package names are configured.
+    """
     if not TOP_PACKAGE_NAMES:
         return 0.0
-    return max((_normalized_similarity(name, base) for base in TOP_PACKAGE_NAMES), default=0.0)
+    return _similarity_to_names((name or "").strip().lower(), TOP_PACKAGE_NAMES)
+
+
+@lru_cache(maxsize=SIMILARITY_CACHE_SIZE)
+def _similarity_to_names(name_lc: str, top_names: Tuple[str, ...]) -> float:
+    """
+    Best similarity of `name_lc` to any of `top_names`.
+
+    The edit distance is at least the length difference, so similarity is at
+    most 1 - gap / longer length. Candidates are tried in order of that bound
+    and the scan stops once the bound cannot beat the best score so far.
+    """
+    bounded = []
+    for base in top_names:
+        base_lc = base.strip().lower()
+        longest = max(len(name_lc), len(base_lc))
+        bound = 1.0 - abs(len(name_lc) - len(base_lc)) / longest if longest else 1.0
+        bounded.append((bound, base_lc))
+    bounded.sort(key=lambda item: item[0], reverse=True)
+
+    best = 0.0
+    for bound, base_lc in bounded:
+        if bound <= best:
+            break
+        best = max(best, _normalized_similarity(name_lc, base_lc))
+    return best
+
+
+def _audit_row(art: Dict[str, Any]) -> Optional[Tuple[float, Dict[str, Any]]]:
+    """
+    Score one artifact; returns (score, response entry), or None if it has no
+    id or name. Independent of the request's threshold, limit and types.
+    """
+    md = art.get("metadata") or {}
+    aid = md.get("id")
+    name = (md.get("name") or "").strip()
+    if not aid or not name:
+        return None
+
+    metrics = art.get("metrics") or {}
+    search_hits = metrics.get("search_hits_30d")
+    downloads = metrics.get("downloads_30d")
+    ts = metrics.get("downloads_timeseries_30d") or []
+    if not isinstance(ts, list):
+        ts = []
+
+    sim = _best_similarity_to_top(name)
+    spike = _spike_factor([int(x) for x in ts if isinstance(x, (int, float))])
+
+    score, reasons = _suspicion_score(
+        name=name,
+        search_hits_30d=search_hits,
+        downloads_30d=downloads,
+        spike=spike,
+        best_name_sim=sim,
+    )
+
+    return score, {
+        "id": aid,
+        "name": name,
+        "type": md.get("type"),
+        "version": md.get("version"),
+        "score": round(score, 3),
+        "reasons": reasons,
+        "metrics": {
+            "search_hits_30d": search_hits,
+            "downloads_30d": downloads,
+            "spike_factor": round(spike, 3),
+            "similarity_to_top": round(sim, 3),
+        },
+    }
 
 
 # -----------------------------
@@ -175,7 +286,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     Returns: 200 with list of suspicious packages sorted by score desc.
     """
     try:
-        logger.info(f"PackageConfusionAudit invoked: {json.dumps(event)}")
+        log_invocation("PackageConfusionAudit", event, context)
 
         # CORS preflight
         if event.get("httpMethod") == "OPTIONS":
@@ -211,56 +322,35 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             allowed_types = {"code"} if AUDIT_CODE_ONLY else None
 
         artifacts_map = list_all_artifacts_from_s3()
-        suspicious: List[Dict[str, Any]] = []
+        for artifact_key in set(_AUDIT_ROWS) - artifacts_map.keys():
+            del _AUDIT_ROWS[artifact_key]
 
-        for art in artifacts_map.values():
+        suspicious: List[Dict[str, Any]] = []
+        for artifact_key, art in artifacts_map.items():
             md = art.get("metadata") or {}
-            aid = md.get("id")
-            name = (md.get("name") or "").strip()
-            atype = md.get("type")
-
-            if not aid or not name:
-                continue
-            if allowed_types is not None and atype not in allowed_types:
+            if allowed_types is not None and md.get("type") not in allowed_types:
                 continue
 
-            metrics = art.get("metrics") or {}
-            search_hits = metrics.get("search_hits_30d")
-            downloads = metrics.get("downloads_30d")
-            ts = metrics.get("downloads_timeseries_30d") or []
-            if not isinstance(ts, list):
-                ts = []
-
-            sim = _best_similarity_to_top(name)
-            spike = _spike_factor([int(x) for x in ts if isinstance(x, (int, float))])
-
-            score, reasons = _suspicion_score(
-                name=name,
-                search_hits_30d=search_hits,
-                downloads_30d=downloads,
-                spike=spike,
-                best_name_sim=sim,
-            )
+            cached = _AUDIT_ROWS.get(artifact_key)
+            if (
+                cached is None
+                or cached[0] is not art
+                or cached[1] is not TOP_PACKAGE_NAMES
+            ):
+                cached = (art, TOP_PACKAGE_NAMES, _audit_row(art))
+                _AUDIT_ROWS[artifact_key] = cached
+
+            row = cached[2]
+            if row is not None and row[0] >= threshold:
+                suspicious.append(row[1])
 
-            if score >= threshold:
-                suspicious.append({
-                    "id": aid,
-                    "name": name,
-                    "type": atype,
-                    "version": md.get("version"),
-                    "score": round(score, 3),
-                    "reasons": reasons,
-                    "metrics": {
-                        "search_hits_30d": search_hits,
-                        "downloads_30d": downloads,
-                        "spike_factor": round(spike, 3),
-                        "similarity_to_top": round(sim, 3),
-                    },
-                })
-
-        suspicious.sort(key=lambda x: x["score"], reverse=True)
         if limit and limit > 0:
-            suspicious = suspicious[: min(limit, MAX_AUDIT_RESULTS)]
+            # Same result as a stable descending sort + slice, without sorting every row
+            suspicious = heapq.nlargest(
+                min(limit, MAX_AUDIT_RESULTS), suspicious, key=lambda x: x["score"]
+            )
+        else:
+            suspicious.sort(key=lambda x: x["score"], reverse=True)
 
         return create_response(200, suspicious)
 
@@ -4,18 +4,95 @@ Lambda handler for GET /artifact/model/{id}/rate
 Returns the rating for a registered model artifact.
 """
 
-import json
-from time import perf_counter
-from typing import Dict, Any
+import os
+import re
+from time import monotonic
+from typing import Any, Dict, Tuple
 
 from lambda_handlers.utils import (
-    create_response,
+    TimedLog,
     evaluate_model,
-    load_artifact_from_s3,
+    json_dumps,
+    json_loads,
+    load_artifact_with_etag,
     save_artifact_to_s3,
     log_event,
+    log_invocation,
 )
 
+# Artifact ids are uuid strings; anything else cannot name a stored artifact
+_VALID_ARTIFACT_ID = re.compile(r"[A-Za-z0-9_-]+").fullmatch
+
+# Stored ratings served by this container: artifact id -> (ETag, rating).
+# Every request still revalidates with a conditional GET, so updates and
+# deletes from other containers are seen at once; an unchanged artifact is
+# just not downloaded and parsed again.
+RATING_LOOKUP_MAX_ENTRIES = 1024
+
+# Copy of those ratings in Lambda's /tmp, which outlives the module when an
+# execution environment is re-initialized, so a fresh init starts from it.
+# Entries are revalidated by ETag like any other. Empty disables the copy.
+RATING_LOCAL_PATH = os.getenv("RATING_LOCAL_PATH", "/tmp/stored_ratings.json")
+
+# The copy is rewritten whole, so writes are batched: only after the ratings
+# changed, and at most once per RATING_LOCAL_SAVE_INTERVAL seconds unless
+# RATING_LOCAL_SAVE_CHANGES changes have piled up since the last write
+RATING_LOCAL_SAVE_INTERVAL = float(os.getenv("RATING_LOCAL_SAVE_INTERVAL", "30"))
+RATING_LOCAL_SAVE_CHANGES = int(os.getenv("RATING_LOCAL_SAVE_CHANGES", "64"))
+_LOCAL_SAVE_STATE: Dict[str, float] = {"changes": 0, "saved_at": float("-inf")}
+
+
+def _load_local_ratings() -> Dict[str, Tuple[str, Any]]:
+    """Read the ratings left in /tmp by a previous init, if any."""
+    if not RATING_LOCAL_PATH:
+        return {}
+    try:
+        with open(RATING_LOCAL_PATH, "rb") as f:
+            saved = json_loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(saved, dict):
+        return {}
+    return {
+        artifact_id: (entry[0], entry[1])
+        for artifact_id, entry in saved.items()
+        if isinstance(entry, list) and len(entry) == 2 and isinstance(entry[0], str)
+    }
+
+
+def _save_local_ratings() -> None:
+    """Write the ratings to /tmp atomically (temp file + rename)."""
+    if not RATING_LOCAL_PATH:
+        return
+    tmp_path = f"{RATING_LOCAL_PATH}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json_dumps(_STORED_RATINGS))
+        os.replace(tmp_path, RATING_LOCAL_PATH)
+        _LOCAL_SAVE_STATE["changes"] = 0
+        _LOCAL_SAVE_STATE["saved_at"] = monotonic()
+    except OSError as e:
+        log_event(
+            "warning",
+            f"Could not write local rating copy: {e}",
+            event=None,
+            context=None,
+            error_code="rating_local_write_failed",
+        )
+
+
+def _note_ratings_changed() -> None:
+    """Record a change to the stored ratings and write the /tmp copy when due."""
+    _LOCAL_SAVE_STATE["changes"] += 1
+    if (
+        _LOCAL_SAVE_STATE["changes"] >= RATING_LOCAL_SAVE_CHANGES
+        or monotonic() - _LOCAL_SAVE_STATE["saved_at"] >= RATING_LOCAL_SAVE_INTERVAL
+    ):
+        _save_local_ratings()
+
+
+_STORED_RATINGS: Dict[str, Tuple[str, Any]] = _load_local_ratings()
+
 
 def handler(event: Dict[str, Any], context: Any) -> Dict:
     """
@@ -27,129 +104,115 @@ def handler(event: Dict[str, Any], context: Any) -> Dict:
     - event['pathParameters']['id'] - Artifact ID
     - event['headers']['X-Authorization'] - Auth token (optional)
     """
-    start_time = perf_counter()
     artifact_id = None
 
-    try:
-        log_event(
-            "info",
-            f"rate_artifact invoked: {json.dumps(event)}",
-            event=event,
-            context=context,
-        )
+    with TimedLog(event, context) as timed:
+        try:
+            # Answer CORS preflights before logging the invocation
+            if event.get('httpMethod') == 'OPTIONS':
+                return timed.respond(
+                    200, {}, "Handled OPTIONS preflight for rate_artifact"
+                )
 
-        # Handle OPTIONS preflight
-        if event.get('httpMethod') == 'OPTIONS':
-            latency = perf_counter() - start_time
-            log_event(
-                "info",
-                "Handled OPTIONS preflight for rate_artifact",
-                event=event,
-                context=context,
-                latency=latency,
-                status=200,
-            )
-            return create_response(200, {})
-
-        # Parse path parameter
-        artifact_id = event.get('pathParameters', {}).get('id')
-        if not artifact_id:
-            latency = perf_counter() - start_time
-            log_event(
-                "warning",
-                "Missing artifact_id in rate_artifact",
-                event=event,
-                context=context,
-                latency=latency,
-                status=400,
-                error_code="missing_artifact_id",
-            )
-            return create_response(400, {
-                "error": "There is missing field(s) in the artifact_id or it is formed improperly, or is invalid."
-            })
-
-        # Load artifact from S3
-        artifact = load_artifact_from_s3(artifact_id)
-        if not artifact:
-            latency = perf_counter() - start_time
-            log_event(
-                "warning",
-                "Artifact not found for rating",
-                event=event,
-                context=context,
-                model_id=artifact_id,
-                latency=latency,
-                status=404,
-                error_code="artifact_not_found",
-            )
-            return create_response(404, {"error": "Artifact does not exist."})
-
-        # Verify it's a model
-        if artifact.get("type") != "model":
-            latency = perf_counter() - start_time
-            log_event(
-                "warning",
-                "Attempted to rate non-model artifact",
-                event=event,
-                context=context,
-                model_id=artifact_id,
-                latency=latency,
-                status=400,
-                error_code="invalid_artifact_type",
+            log_invocation("rate_artifact", event, context)
+
+            # Parse path parameter
+            artifact_id = event.get('pathParameters', {}).get('id')
+            if not isinstance(artifact_id, str) or not _VALID_ARTIFACT_ID(artifact_id):
+                return timed.respond(
+                    400,
+                    {
+                        "error": (
+                            "There is missing field(s) in the artifact_id or it"
+                            " is formed improperly, or is invalid."
+                        )
+                    },
+                    "Missing or malformed artifact_id in rate_artifact",
+                    level="warning",
+                    error_code="missing_artifact_id",
+                )
+
+            # Load artifact from S3, unless the rating served last is still current
+            cached = _STORED_RATINGS.get(artifact_id)
+            artifact, etag = load_artifact_with_etag(
+                artifact_id, cached[0] if cached else None
             )
-            return create_response(400, {
-                "error": f"Artifact {artifact_id} is not a model"
-            })
-
-        # Get cached rating or re-evaluate
-        rating = artifact.get("rating")
-        if not rating:
-            url = artifact.get("url")
-            try:
-                rating = evaluate_model(url, event=event, context=context)
-                # Update S3 with new rating
-                artifact["rating"] = rating
-                save_artifact_to_s3(artifact_id, artifact)
-            except Exception as e:
-                latency = perf_counter() - start_time
-                log_event(
-                    "error",
-                    f"Error evaluating artifact {artifact_id}: {e}",
-                    event=event,
-                    context=context,
+            if cached is not None and artifact is None and etag == cached[0]:
+                return timed.respond(
+                    200,
+                    cached[1],
+                    f"Returning unchanged rating for artifact {artifact_id}",
                     model_id=artifact_id,
-                    latency=latency,
-                    status=500,
-                    error_code="model_evaluation_failed",
-                    exc_info=True,
                 )
-                return create_response(500, {
-                    "error": "The artifact rating system encountered an error while computing at least one metric."
-                })
+            if _STORED_RATINGS.pop(artifact_id, None) is not None:
+                _note_ratings_changed()
 
-        latency = perf_counter() - start_time
-        log_event(
-            "info",
-            f"Returning rating for artifact {artifact_id}",
-            event=event,
-            context=context,
-            model_id=artifact_id,
-            latency=latency,
-            status=200,
-        )
-        return create_response(200, rating)
+            if not artifact:
+                return timed.respond(
+                    404,
+                    {"error": "Artifact does not exist."},
+                    "Artifact not found for rating",
+                    level="warning",
+                    error_code="artifact_not_found",
+                    model_id=artifact_id,
+                )
 
-    except Exception as e:
-        latency = perf_counter() - start_time
-        log_event(
-            "error",
-            f"Unexpected error in rate_artifact: {e}",
-            event=event,
-            context=context,
-            model_id=artifact_id,
-            latency=latency,
-            status=500,
-            error_code="unexpected_error",
-            exc_info=True,
-        )
-        return create_response(500, {"error": f"Internal server error: {str(e)}"})
+            # Verify it's a model
+            if artifact.get("type") != "model":
+                return timed.respond(
+                    400,
+                    {"error": f"Artifact {artifact_id} is not a model"},
+                    "Attempted to rate non-model artifact",
+                    level="warning",
+                    error_code="invalid_artifact_type",
+                    model_id=artifact_id,
+                )
+
+            # Get cached rating or re-evaluate
+            rating = artifact.get("rating")
+            if not rating:
+                url = artifact.get("url")
+                try:
+                    rating = evaluate_model(url, event=event, context=context)
+                    # Update S3 with new rating
+                    artifact["rating"] = rating
+                    save_artifact_to_s3(artifact_id, artifact)
+                except Exception as e:
+                    return timed.respond(
+                        500,
+                        {
+                            "error": (
+                                "The artifact rating system encountered an error"
+                                " while computing at least one metric."
+                            )
+                        },
+                        f"Error evaluating artifact {artifact_id}: {e}",
+                        level="error",
+                        error_code="model_evaluation_failed",
+                        model_id=artifact_id,
+                        exc_info=True,
+                    )
+            elif etag:
+                # A rating saved above has a new ETag; it is cached on the next read
+                _STORED_RATINGS[artifact_id] = (etag, rating)
+                if len(_STORED_RATINGS) > RATING_LOOKUP_MAX_ENTRIES:
+                    del _STORED_RATINGS[next(iter(_STORED_RATINGS))]
+                _note_ratings_changed()
+
+            return timed.respond(
+                200,
+                rating,
+                f"Returning rating for artifact {artifact_id}",
+                model_id=artifact_id,
+            )
+
+        except Exception as e:
+            return timed.respond(
+                500,
+                {"error": f"Internal server error: {str(e)}"},
+                f"Unexpected error in rate_artifact: {e}",
+                level="error",
+                error_code="unexpected_error",
+                model_id=artifact_id,
+                exc_info=True,
+            )
@@ -7,10 +7,23 @@ Returns matching artifact *metadata* entries (id, name, type).
 
 import json
 import re
+from functools import lru_cache
 from time import perf_counter
 from typing import Any, Dict, Iterable, List
 
-from lambda_handlers.utils import create_response, list_all_artifacts_from_s3, log_event
+from lambda_handlers.utils import (
+    create_response,
+    json_loads,
+    load_name_index,
+    log_event,
+    log_invocation,
+)
+
+try:
+    # Linear-time engine: no catastrophic backtracking on user patterns
+    import re2
+except ImportError:
+    re2 = None
 
 
 # Regex complexity limits
@@ -18,6 +31,33 @@ MAX_PATTERN_LENGTH = 200
 MAX_QUANTIFIER_VALUE = 1000
 MAX_NESTING_DEPTH = 3
 
+# Bounded execution: cap the text handed to the engine and the total time
+# spent matching, since a single search cannot be interrupted in Lambda
+MAX_SEARCH_TEXT_LENGTH = 8192
+MATCH_TIME_BUDGET_SECONDS = 2.0
+
+# Compiled patterns kept across warm invocations (clients repeat patterns)
+COMPILED_PATTERN_CACHE_SIZE = 256
+
+
+# Guardrail meta-patterns for _check_regex_complexity, compiled once per container
+# Nested quantifiers such as (a+)+, (a*)*, (a+b)*, (a{1,3})+ in a single scan:
+# a quantified group containing either a */+/? anywhere or ending in {n,m}
+_NESTED_QUANTIFIER = re.compile(r'\([^)]*(?:[*+?][^)]*|\{[^}]+\})\)[*+?{]')
+# Bounded repeats a{n} / a{n,} / a{n,m}
+_QUANTIFIER_RANGE = re.compile(r'\{(\d+)(?:,(\d*))?\}')
+# Quantified alternation groups such as (a|aa)*
+_QUANTIFIED_ALTERNATION = re.compile(r'\([^)]*\|[^)]*\)[*+{]')
+_QUANTIFIED_ALTERNATION_GROUP = re.compile(r'\(([^)]*\|[^)]*)\)[*+{]')
+
+# Patterns with no metacharacters at all: matched with a substring test
+_PURE_LITERAL = re.compile(r'^[^.^$*+?()\[\]{}|\\]+$')
+
+# Characters that are always literal in a pattern (outside a character class)
+_LITERAL_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-/:@ "
+)
+
 
 class UnsafeRegexError(Exception):
     """Raised when regex pattern is deemed unsafe due to complexity."""
@@ -51,23 +91,20 @@ def _check_regex_complexity(pattern: str) -> None:
             f"Pattern too long ({len(pattern)} chars, max {MAX_PATTERN_LENGTH})"
         )
 
+    # Checks 2, 4 and 5 only look at groups; a pattern without "(" passes them
+    # (one C-level scan instead of two regex searches and a per-character loop)
+    has_group = '(' in pattern
+
     # Check 2: Detect nested quantifiers - common cause of catastrophic backtracking
     # Patterns like (a+)+, (a*)*, (a+)*, ((a)+)+, etc.
-    nested_quantifier_patterns = [
-        r'\([^)]*[*+?]\)[*+?{]',  # (...)+ or (...)* or (...)?
-        r'\([^)]*\{[^}]+\}\)[*+?{]',  # (...{n,m})+ patterns
-        r'\([^)]*[*+?][^)]*\)[*+?{]',  # Multiple quantifiers in group
-    ]
-
-    for check_pattern in nested_quantifier_patterns:
-        if re.search(check_pattern, pattern):
-            raise UnsafeRegexError(
-                "Nested quantifiers detected - potential catastrophic backtracking"
-            )
+    if has_group and _NESTED_QUANTIFIER.search(pattern):
+        raise UnsafeRegexError(
+            "Nested quantifiers detected - potential catastrophic backtracking"
+        )
 
     # Check 3: Detect large quantifier ranges
     # Patterns like a{1,99999} or a{9999,}
-    quantifier_ranges = re.findall(r'\{(\d+)(?:,(\d*))?\}', pattern)
+    quantifier_ranges = _QUANTIFIER_RANGE.findall(pattern) if '{' in pattern else ()
     for min_val, max_val in quantifier_ranges:
         min_int = int(min_val) if min_val else 0
         max_int = int(max_val) if max_val else min_int
@@ -81,13 +118,16 @@ def _check_regex_complexity(pattern: str) -> None:
                 f"Quantifier maximum too large ({max_int}, max {MAX_QUANTIFIER_VALUE})"
             )
 
+    if not has_group:
+        return
+
     # Check 4: Detect overlapping alternations with quantifiers
     # Patterns like (a|aa)*, (ab|abc)+, etc.
     # This is a simplified check - looks for alternation groups followed by quantifiers
-    if re.search(r'\([^)]*\|[^)]*\)[*+{]', pattern):
+    if _QUANTIFIED_ALTERNATION.search(pattern):
         # Further check if alternations might overlap
         # Extract the alternation group
-        alt_groups = re.findall(r'\(([^)]*\|[^)]*)\)[*+{]', pattern)
+        alt_groups = _QUANTIFIED_ALTERNATION_GROUP.findall(pattern)
         for group in alt_groups:
             alternatives = group.split('|')
             # Check if any alternative is a prefix of another
@@ -99,9 +139,12 @@ def _check_regex_complexity(pattern: str) -> None:
                             "potential catastrophic backtracking"
                         )
 
-    # Check 5: Detect excessive nesting depth
+    # Check 5: Detect excessive nesting depth, and quantified groups that
+    # contain a quantifier at any depth (e.g. ((a+))+), which check 2 misses
     max_depth = 0
     current_depth = 0
+    # One flag per open group: does it contain a quantifier?
+    group_has_quantifier: List[bool] = []
     i = 0
     length = len(pattern)
     while i < length:
@@ -110,11 +153,36 @@ def _check_regex_complexity(pattern: str) -> None:
             # Skip the next character, as it is escaped
             i += 2
             continue
+        if char == '[':
+            # Skip the character class; its contents are literal here
+            i += 1
+            if i < length and pattern[i] == '^':
+                i += 1
+            if i < length and pattern[i] == ']':
+                i += 1
+            while i < length and pattern[i] != ']':
+                i += 2 if pattern[i] == '\\' else 1
+            i += 1
+            continue
         if char == '(':
             current_depth += 1
             max_depth = max(max_depth, current_depth)
+            group_has_quantifier.append(False)
+            if pattern.startswith('?', i + 1):
+                # Group modifier such as (?: or (?P<name>, not a quantifier
+                i += 2
+                continue
         elif char == ')':
             current_depth -= 1
+            inner = group_has_quantifier.pop() if group_has_quantifier else False
+            if inner and i + 1 < length and pattern[i + 1] in '*+?{':
+                raise UnsafeRegexError(
+                    "Nested quantifiers detected - potential catastrophic backtracking"
+                )
+            if inner and group_has_quantifier:
+                group_has_quantifier[-1] = True
+        elif char in '*+?{' and group_has_quantifier:
+            group_has_quantifier[-1] = True
         i += 1
 
     if max_depth > MAX_NESTING_DEPTH:
@@ -123,8 +191,126 @@ def _check_regex_complexity(pattern: str) -> None:
         )
 
 
+def _anchored_literal_prefix(pattern: str) -> str:
+    """
+    Return the literal text every match must start with, or "" if unknown.
+
+    Only handles the simple, common shape ``^literal...``; anything that could
+    change the meaning of the anchor or the prefix (alternation, inline flags)
+    disables the prefilter. The result is lowercased for comparison against
+    lowercased names.
+    """
+    if not pattern.startswith("^") or "|" in pattern or "(?" in pattern:
+        return ""
+
+    prefix_chars: List[str] = []
+    for char in pattern[1:]:
+        if char in _LITERAL_CHARS:
+            prefix_chars.append(char)
+            continue
+        if char in "?*{" and prefix_chars:
+            # The preceding character is optional
+            prefix_chars.pop()
+        break
+    return "".join(prefix_chars).lower()
+
+
+def _required_literal(pattern: str) -> str:
+    """
+    Return the longest literal substring every match must contain, or "".
+
+    Only text outside groups and character classes is considered, and a
+    character followed by ``?``, ``*`` or ``{`` is dropped as optional.
+    Alternation and inline flags disable the prefilter. The result is
+    lowercased for comparison against lowercased names.
+    """
+    if "|" in pattern or "(?" in pattern:
+        return ""
+
+    best = ""
+    run: List[str] = []
+    depth = 0
+    i = 0
+    length = len(pattern)
+    while i < length:
+        char = pattern[i]
+        if depth == 0 and char in _LITERAL_CHARS:
+            run.append(char)
+            i += 1
+            continue
+
+        if char in "?*{" and run:
+            # The preceding character is optional
+            run.pop()
+        if len(run) > len(best):
+            best = "".join(run)
+        run = []
+
+        if char == "\\":
+            i += 2
+            continue
+        if char == "[":
+            # Skip the class, where "]" first (or after "^") is literal
+            i += 1
+            if i < length and pattern[i] == "^":
+                i += 1
+            if i < length and pattern[i] == "]":
+                i += 1
+            while i < length and pattern[i] != "]":
+                i += 2 if pattern[i] == "\\" else 1
+        elif char == "{":
+            # Repeat counts are not part of the name
+            while i < length and pattern[i] != "}":
+                i += 1
+        elif char == "(":
+            depth += 1
+        elif char == ")" and depth:
+            depth -= 1
+        i += 1
+
+    if len(run) > len(best):
+        best = "".join(run)
+    return best.lower()
+
+
+@lru_cache(maxsize=COMPILED_PATTERN_CACHE_SIZE)
+def _compile_search_pattern(regex_pattern: str) -> Any:
+    """
+    Compile a case-insensitive search pattern, preferring RE2 when available.
+
+    Results are memoized per container; rejected patterns raise and are not
+    cached.
+
+    RE2 matches in linear time, so the backtracking heuristics are not needed
+    for it. Patterns RE2 cannot express (backreferences, lookaround, very large
+    repeats) fall back to Python's ``re`` behind _check_regex_complexity.
+
+    Raises:
+        ValueError: If regex pattern is invalid
+        UnsafeRegexError: If regex pattern is too complex/dangerous
+    """
+    if len(regex_pattern) > MAX_PATTERN_LENGTH:
+        raise UnsafeRegexError(
+            f"Pattern too long ({len(regex_pattern)} chars, max {MAX_PATTERN_LENGTH})"
+        )
+
+    if re2 is not None:
+        try:
+            return re2.compile("(?i)" + regex_pattern)
+        except re2.error:
+            pass
+
+    # Check complexity before compiling with the backtracking engine
+    _check_regex_complexity(regex_pattern)
+
+    try:
+        return re.compile(regex_pattern, re.IGNORECASE)
+    except re.error as e:
+        raise ValueError(f"Invalid regex pattern: {e}")
+
+
 def _search_artifacts_by_regex(
-    artifacts: Iterable[Dict[str, Any]],
+    entries: Iterable[Dict[str, Any]],
     regex_pattern: str,
 ) -> List[Dict[str, Any]]:
     """
@@ -135,7 +321,8 @@ def _search_artifacts_by_regex(
     only artifact names.
 
     Args:
-        artifacts: Iterable of artifact dictionaries
+        entries: Iterable of artifact metadata dicts ({"name", "id", "type"}),
+            one per artifact id
         regex_pattern: Regular expression pattern to match
 
     Returns:
@@ -145,81 +332,94 @@ def _search_artifacts_by_regex(
         ValueError: If regex pattern is invalid
         UnsafeRegexError: If regex pattern is too complex/dangerous
     """
-    # Check complexity before compiling
-    _check_regex_complexity(regex_pattern)
+    pattern = _compile_search_pattern(regex_pattern)
 
-    try:
-        pattern = re.compile(regex_pattern, re.IGNORECASE)
-    except re.error as e:
-        raise ValueError(f"Invalid regex pattern: {e}")
+    # Cheap startswith() and substring rejection before running the regex
+    # engine. Only applied to ASCII names, where IGNORECASE equivalence is
+    # exactly lower().
+    prefix = _anchored_literal_prefix(regex_pattern)
 
-    results_by_id: Dict[str, Dict[str, Any]] = {}
+    # Pure ASCII literals skip the engine entirely for ASCII names
+    literal = None
+    if regex_pattern.isascii() and _PURE_LITERAL.match(regex_pattern):
+        literal = regex_pattern.lower()
+    required = _required_literal(regex_pattern) if literal is None else ""
 
-    for artifact in artifacts:
-        md = artifact.get("metadata", {}) or {}
-        artifact_id = str(md.get("id", "") or "")
-        artifact_name = str(md.get("name", "") or "")
-        artifact_type = md.get("type")
+    # Entries come from the name index, keyed by id, so ids are already unique
+    results: List[Dict[str, Any]] = []
+    # Only time spent in the engine counts, not iterating the entries
+    match_seconds = 0.0
 
-        if not artifact_name or not artifact_id:
-            continue
+    for md in entries:
+        raw_id = md.get("id")
+        artifact_name = md.get("name")
 
-        # Search artifact name
-        if pattern.search(artifact_name):
-            results_by_id[artifact_id] = {
+        if not artifact_name or not raw_id:
+            continue
+        if type(artifact_name) is not str:
+            artifact_name = str(artifact_name)
+
+        if (prefix or required) and artifact_name.isascii():
+            name_lc = artifact_name.lower()
+            if not name_lc.startswith(prefix) or required not in name_lc:
+                continue
+
+        # Search artifact name, capped before it reaches the engine (names are
+        # almost always short, so only oversized ones pay for the slice)
+        if len(artifact_name) > MAX_SEARCH_TEXT_LENGTH:
+            searchable_text = artifact_name[:MAX_SEARCH_TEXT_LENGTH]
+        else:
+            searchable_text = artifact_name
+        match_start = perf_counter()
+        if literal is not None and searchable_text.isascii():
+            matched = literal in searchable_text.lower()
+        else:
+            matched = pattern.search(searchable_text)
+        match_seconds += perf_counter() - match_start
+        if matched:
+            # Only matches pay for building the result entry
+            results.append({
                 "name": artifact_name,
-                "id": artifact_id,
-                "type": artifact_type
-            }
-
-    return sorted(
-        results_by_id.values(),
-        key=lambda m: str(m.get("name", "")).lower()
-    )
-
+                "id": str(raw_id),
+                "type": md.get("type")
+            })
 
-def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
-    """
-    Lambda handler for POST /artifact/byRegEx
+        if match_seconds > MATCH_TIME_BUDGET_SECONDS:
+            raise UnsafeRegexError(
+                f"Regex search exceeded {MATCH_TIME_BUDGET_SECONDS}s time budget"
+            )
 
-    Request body (JSON):
-    {
-      "regex": "<required regex pattern>"
-    }
+    results.sort(key=lambda m: m["name"].lower())
+    return results
+
+
+def _handle_options(
+    event: Dict[str, Any], context: Any, start_time: float
+) -> Dict[str, Any]:
+    """Answer a CORS preflight without logging the event."""
+    latency = perf_counter() - start_time
+    log_event(
+        "info",
+        "Handled OPTIONS preflight for search_artifacts",
+        event=event,
+        context=context,
+        latency=latency,
+        status=200,
+    )
+    return create_response(200, {})
 
-    Response: Array of matching artifact metadata
-    [
-      {"name": "...", "id": "...", "type": "..."},
-      ...
-    ]
-    """
-    start_time = perf_counter()
 
+def _handle_post_by_regex(
+    event: Dict[str, Any], context: Any, start_time: float
+) -> Dict[str, Any]:
+    """Validate the request body and run the regex search."""
     try:
-        log_event(
-            "info",
-            f"search_artifacts (byRegEx) invoked: {json.dumps(event)}",
-            event=event,
-            context=context,
-        )
-
-        # CORS preflight
-        if event.get("httpMethod") == "OPTIONS":
-            latency = perf_counter() - start_time
-            log_event(
-                "info",
-                "Handled OPTIONS preflight for search_artifacts",
-                event=event,
-                context=context,
-                latency=latency,
-                status=200,
-            )
-            return create_response(200, {})
+        log_invocation("search_artifacts (byRegEx)", event, context)
 
         # Parse JSON body
         raw = event.get("body", "{}")
         try:
-            body = json.loads(raw) if isinstance(raw, str) else raw
+            body = json_loads(raw) if isinstance(raw, str) else raw
         except json.JSONDecodeError:
             latency = perf_counter() - start_time
             log_event(
@@ -252,13 +452,11 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 "error": "There is missing field(s) in the artifact_regex or it is formed improperly, or is invalid"
             })
 
-        # Load artifacts from S3
-        artifacts_map = list_all_artifacts_from_s3()
-
-        # Execute search with complexity protection
+        # Execute search with complexity protection over the name index's
+        # metadata, so no artifact objects are read
         try:
             results = _search_artifacts_by_regex(
-                artifacts_map.values(),
+                load_name_index()["artifacts"].values(),
                 regex_pattern=regex_pattern,
             )
         except UnsafeRegexError as e:
@@ -330,3 +528,30 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             exc_info=True,
         )
         return create_response(500, {"error": f"Internal server error: {str(exc)}"})
+
+
+# Per-method handlers. HTTP API (payload v2) events carry no httpMethod, so
+# anything not listed here falls through to the search itself.
+_DISPATCH = {
+    "OPTIONS": _handle_options,
+}
+
+
+def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    Lambda handler for POST /artifact/byRegEx
+
+    Request body (JSON):
+    {
+      "regex": "<required regex pattern>"
+    }
+
+    Response: Array of matching artifact metadata
+    [
+      {"name": "...", "id": "...", "type": "..."},
+      ...
+    ]
+    """
+    start_time = perf_counter()
+    method = event.get("httpMethod") or ""
+    return _DISPATCH.get(method, _handle_post_by_regex)(event, context, start_time)
@@ -7,12 +7,21 @@ Returns the list of implementation tracks planned by the student.
 from time import perf_counter
 from typing import Any, Dict
 
-from lambda_handlers.utils import create_response, handle_cors_preflight, log_event
+from lambda_handlers.utils import (
+    create_response,
+    handle_cors_preflight,
+    json_dumps,
+    log_event,
+)
 
 
 # List of tracks planned for implementation
 PLANNED_TRACKS = ["Access control track"]
 
+# The body never changes, so it is encoded once at import; create_response
+# passes string bodies through and still builds fresh headers per call
+_TRACKS_BODY = json_dumps({"plannedTracks": PLANNED_TRACKS})
+
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
@@ -56,5 +65,4 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         status=200,
     )
 
-    body = {"plannedTracks": PLANNED_TRACKS}
-    return create_response(200, body)
+    return create_response(200, _TRACKS_BODY)
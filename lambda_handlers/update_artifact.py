@@ -10,16 +10,19 @@ from time import perf_counter
 from typing import Any, Dict
 
 from lambda_handlers.utils import (
+    json_loads,
+    ARTIFACT_TYPES,
     create_response,
     evaluate_model,
     get_header,
     is_valid_artifact_url,
     load_artifact_from_s3,
     log_event,
+    log_invocation,
     save_artifact_to_s3,
     MIN_NET_SCORE_THRESHOLD,
 )
-from src.artifact_store import S3ArtifactStore
+from src.artifact_store import get_artifact_store
 from src.auth import AuthError, InvalidTokenError, get_default_auth_service
 
 
@@ -40,12 +43,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict:
     artifact_id = None
 
     try:
-        log_event(
-            "info",
-            f"update_artifact invoked: {json.dumps(event)}",
-            event=event,
-            context=context,
-        )
+        log_invocation("update_artifact", event, context)
 
         # Handle OPTIONS preflight
         if event.get('httpMethod') == 'OPTIONS':
@@ -66,7 +64,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict:
         artifact_id = path_params.get('id')
 
         # Validate artifact_type
-        if not artifact_type or artifact_type not in ['model', 'dataset', 'code']:
+        if not artifact_type or artifact_type not in ARTIFACT_TYPES:
             latency = perf_counter() - start_time
             log_event(
                 "warning",
@@ -154,7 +152,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict:
         # Parse request body
         body_str = event.get('body', '{}')
         try:
-            body = json.loads(body_str) if isinstance(body_str, str) else body_str
+            body = json_loads(body_str) if isinstance(body_str, str) else body_str
         except json.JSONDecodeError:
             latency = perf_counter() - start_time
             log_event(
@@ -266,7 +264,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict:
             try:
                 # Create artifact store for tree_score metric
                 bucket_name = os.environ.get('ARTIFACTS_BUCKET')
-                artifact_store = S3ArtifactStore(bucket_name) if bucket_name else None
+                artifact_store = get_artifact_store() if bucket_name else None
 
                 # Run full evaluation pipeline
                 rating = evaluate_model(new_url, artifact_store=artifact_store)
@@ -3,21 +3,32 @@ Shared utility functions for Lambda handlers.
 
 Includes S3 operations, response formatting, and model evaluation helpers.
 """
+import copy
 import os
 import json
 import logging
 import re
-import boto3
 import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
+from time import monotonic, perf_counter
 import zipfile
 from huggingface_hub import snapshot_download
 from huggingface_hub.errors import GatedRepoError
 from httpx import HTTPStatusError
 import fnmatch
+from botocore.config import Config
+from botocore.session import get_session
 from botocore.exceptions import ClientError
-from typing import Dict, Any, Optional, Iterable, List, Union
-from src.artifact_store import S3ArtifactStore
+from typing import Dict, Any, Optional, Iterator, List, Sequence, Set, Tuple, Union
+from src.artifact_store import ArtifactStore
+
+try:
+    # Faster JSON encode/decode for request bodies and event logging
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 # Setup environment
 os.environ.setdefault("GIT_LFS_SKIP_SMUDGE", "1")
 os.environ.setdefault("HF_HUB_DISABLE_PROGRESS_BARS", "1")
@@ -88,6 +99,10 @@ def log_event(
     else:
         level_value = level
 
+    # Skip building request metadata for records the logger would discard
+    if not logger.isEnabledFor(level_value):
+        return
+
     request_context = event.get("requestContext", {}) if isinstance(event, dict) else {}
 
     request_id = None
@@ -144,13 +159,170 @@ def log_event(
 
     logger.log(level_value, message, **log_kwargs)
 
+
+def json_dumps(obj: Any) -> str:
+    """Serialize ``obj`` to a JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            # e.g. integers wider than 64 bits, which stdlib json still encodes
+            pass
+    return json.dumps(obj)
+
+
+def json_loads(raw: Union[str, bytes]) -> Any:
+    """Parse a JSON document, using orjson when it is installed.
+
+    Invalid input raises ``json.JSONDecodeError`` (orjson's error subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def log_invocation(handler_name: str, event: Dict[str, Any], context: Any) -> None:
+    """Log a handler invocation.
+
+    The full event is only serialized when DEBUG logging is enabled; at INFO
+    just the request body size is recorded.
+    """
+    body = event.get("body") if isinstance(event, dict) else None
+    log_event(
+        "info",
+        f"{handler_name} invoked",
+        event=event,
+        context=context,
+        extra={"event_size": len(body) if isinstance(body, (str, bytes)) else 0},
+    )
+    if logger.isEnabledFor(logging.DEBUG):
+        log_event(
+            "debug",
+            f"{handler_name} event: {json_dumps(event)}",
+            event=event,
+            context=context,
+        )
+
+
+class TimedLog:
+    """Time one request and log its outcome once, when the ``with`` block exits.
+
+    Handlers ``return timed.respond(...)`` from inside the block; the status,
+    message and error code given there are logged with the request latency.
+    """
+
+    def __init__(self, event: Dict[str, Any], context: Any) -> None:
+        self.event = event
+        self.context = context
+        self.start_time = perf_counter()
+        self._outcome: Optional[Dict[str, Any]] = None
+
+    def __enter__(self) -> "TimedLog":
+        return self
+
+    def respond(
+        self,
+        status: int,
+        body: Any,
+        message: str,
+        *,
+        level: LogLevel = "info",
+        error_code: Optional[str] = None,
+        model_id: Optional[str] = None,
+        headers: Optional[Dict] = None,
+        exc_info: bool = False,
+    ) -> Dict:
+        """Record the outcome to log on exit and build the response."""
+        self._outcome = {
+            "level": level,
+            "message": message,
+            "status": status,
+            "error_code": error_code,
+            "model_id": model_id,
+            # Captured now: the active exception is gone by the time __exit__ runs
+            "exc_info": sys.exc_info() if exc_info else None,
+        }
+        return create_response(status, body, headers=headers)
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._outcome is not None:
+            outcome = self._outcome
+            log_event(
+                outcome["level"],
+                outcome["message"],
+                event=self.event,
+                context=self.context,
+                model_id=outcome["model_id"],
+                latency=perf_counter() - self.start_time,
+                status=outcome["status"],
+                error_code=outcome["error_code"],
+                exc_info=outcome["exc_info"],
+            )
+
+
 # S3 storage for artifacts
 BUCKET_NAME = os.getenv("ARTIFACTS_BUCKET")
 
-s3_client = boto3.client("s3") if BUCKET_NAME else None
+# Concurrent GETs when reading many artifacts; the client's connection pool
+# is sized to match so worker threads do not queue for a connection.
+S3_FETCH_WORKERS = max(1, int(os.getenv("S3_FETCH_CONCURRENCY", "30")))
+
+# Shared by every handler in the container: pooled connections get TCP
+# keepalive so idle sockets survive between warm invocations, and throttling
+# and transient errors are retried with the SDK's standard backoff
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=S3_FETCH_WORKERS,
+    tcp_keepalive=True,
+    retries={"mode": "standard"},
+)
+
+# Built from a botocore session rather than boto3, which would also import
+# s3transfer and the resource layer on every cold start for no caller here
+s3_client = (
+    get_session().create_client("s3", config=S3_CLIENT_CONFIG) if BUCKET_NAME else None
+)
+
+# Worker pool for those GETs, started on first use and kept for the
+# container's lifetime so warm invocations do not spawn threads again
+_S3_FETCH_EXECUTOR: Dict[str, Optional[ThreadPoolExecutor]] = {"executor": None}
 
 MIN_NET_SCORE_THRESHOLD = float(os.getenv("MIN_NET_SCORE", "0.5"))
 
+# Ratings from evaluate_model keyed by canonical URL -> (monotonic time,
+# rating). Only evaluations without an artifact store are cached: with one,
+# tree_score depends on which parents are registered, which can change at
+# any time. A rate retry after a failed save in a warm container within the
+# TTL skips the metrics pipeline. Oldest entries are dropped past
+# RATING_CACHE_MAX_ENTRIES.
+RATING_CACHE_TTL_SECONDS = float(os.getenv("RATING_CACHE_TTL_SECONDS", "900"))
+RATING_CACHE_MAX_ENTRIES = 256
+_RATING_CACHE: Dict[str, Tuple[float, dict]] = {}
+
+# Valid values for the {artifact_type} path parameter, shared by every route
+ARTIFACT_TYPES = frozenset({"model", "dataset", "code"})
+
+# Decoded artifacts/{id}.json documents keyed by S3 key -> (ETag, data). Warm
+# containers re-GET only objects whose ETag in the listing has changed.
+_ARTIFACT_OBJECT_CACHE: Dict[str, Tuple[str, dict]] = {}
+
+# Aggregated {artifact_id: metadata} index; lives outside artifacts/ so the
+# artifact listing never mistakes it for an artifact.
+NAME_INDEX_KEY = "index/name_index.json"
+NAME_INDEX_MAX_RETRIES = 5
+
+# Last name index read by this container, revalidated by ETag on each use
+_NAME_INDEX_CACHE: Dict[str, Any] = {"etag": None, "index": None}
+
+# Lowercased name -> [artifact id] for the index object last passed to
+# name_index_ids_by_name; rebuilt only when load_name_index returns a new one
+_NAME_LOOKUP_CACHE: Dict[str, Any] = {"source": None, "by_name": {}}
+
+# Local copy of the last index (with its ETag) in Lambda's /tmp, which outlives
+# the module when an execution environment is re-initialized. A fresh init
+# seeds _NAME_INDEX_CACHE from it, so its first read is a 304 rather than a
+# full download while the index is unchanged. Empty disables the copy.
+NAME_INDEX_LOCAL_PATH = os.getenv("NAME_INDEX_LOCAL_PATH", "/tmp/name_index.json")
+
 # Files essential to clone/use a model locally
 ESSENTIAL_PATTERNS: List[str] = [
     "*.json",
@@ -417,10 +589,24 @@ def save_artifact_to_s3(artifact_id: str, artifact_data: dict) -> None:
         context=None,
         model_id=artifact_id,
     )
+    _update_name_index(artifact_id, artifact_data.get("metadata", {}))
 
 
 def load_artifact_from_s3(artifact_id: str) -> Optional[dict]:
     """Load artifact data from S3."""
+    return load_artifact_with_etag(artifact_id)[0]
+
+
+def load_artifact_with_etag(
+    artifact_id: str,
+    if_none_match: Optional[str] = None,
+) -> Tuple[Optional[dict], Optional[str]]:
+    """Load artifact data from S3 along with the object's ETag.
+
+    With ``if_none_match``, the GET is conditional: an unchanged object
+    returns ``(None, if_none_match)`` without being downloaded. Missing
+    objects and errors return ``(None, None)``.
+    """
     if not s3_client or not BUCKET_NAME:
         log_event(
             "warning",
@@ -428,16 +614,20 @@ def load_artifact_from_s3(artifact_id: str) -> Optional[dict]:
             event=None,
             context=None,
         )
-        return None
+        return None, None
 
     key = f"artifacts/{artifact_id}.json"
+    kwargs = {"IfNoneMatch": if_none_match} if if_none_match else {}
     try:
-        response = s3_client.get_object(Bucket=BUCKET_NAME, Key=key)
+        response = s3_client.get_object(Bucket=BUCKET_NAME, Key=key, **kwargs)
         data = json.loads(response["Body"].read().decode("utf-8"))
-        return data
+        return data, response.get("ETag")
     except ClientError as e:
-        if e.response['Error']['Code'] == 'NoSuchKey':
-            return None
+        code = e.response['Error']['Code']
+        if code in ("304", "NotModified") and kwargs:
+            return None, if_none_match
+        if code == 'NoSuchKey':
+            return None, None
         log_event(
             "error",
             f"Error loading artifact {artifact_id} from S3: {e}",
@@ -446,7 +636,7 @@ def load_artifact_from_s3(artifact_id: str) -> Optional[dict]:
             model_id=artifact_id,
             error_code="s3_load_failed",
         )
-        return None
+        return None, None
     except Exception as e:
         log_event(
             "error",
@@ -456,7 +646,25 @@ def load_artifact_from_s3(artifact_id: str) -> Optional[dict]:
             model_id=artifact_id,
             error_code="s3_load_failed",
         )
-        return None
+        return None, None
+
+
+def load_artifacts_from_s3(artifact_ids: Sequence[str]) -> Dict[str, dict]:
+    """Load several artifacts concurrently; missing or unreadable ones are left out."""
+    if not s3_client or not BUCKET_NAME:
+        log_event(
+            "warning",
+            "S3 not configured, cannot load",
+            event=None,
+            context=None,
+        )
+        return {}
+    if not artifact_ids:
+        return {}
+
+    keys = [f"artifacts/{artifact_id}.json" for artifact_id in artifact_ids]
+    results = _s3_fetch_executor().map(_fetch_artifact_by_key, keys)
+    return dict(result for result in results if result is not None)
 
 
 def artifact_exists_in_s3(artifact_id: str) -> bool:
@@ -492,8 +700,59 @@ def artifact_exists_in_s3(artifact_id: str) -> bool:
         return False
 
 
-def list_all_artifacts_from_s3() -> Dict[str, dict]:
-    """List all artifacts from S3 (for byName search)."""
+def _s3_fetch_executor() -> ThreadPoolExecutor:
+    executor = _S3_FETCH_EXECUTOR["executor"]
+    if executor is None:
+        executor = ThreadPoolExecutor(
+            max_workers=S3_FETCH_WORKERS, thread_name_prefix="s3-fetch"
+        )
+        _S3_FETCH_EXECUTOR["executor"] = executor
+    return executor
+
+
+def _fetch_artifact_by_key(key: str) -> Optional[Tuple[str, dict]]:
+    """GET and decode one artifacts/{id}.json object; None if missing or unreadable."""
+    assert s3_client is not None  # callers return early when S3 is not configured
+    artifact_id = key.replace("artifacts/", "").replace(".json", "")
+    try:
+        response = s3_client.get_object(Bucket=BUCKET_NAME, Key=key)
+        return artifact_id, json.loads(response["Body"].read().decode("utf-8"))
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'NoSuchKey':
+            return None
+        log_event(
+            "error",
+            f"Error loading artifact {artifact_id} from S3: {e}",
+            event=None,
+            context=None,
+            model_id=artifact_id,
+            error_code="s3_load_failed",
+        )
+        return None
+    except Exception as e:
+        log_event(
+            "error",
+            f"Error loading artifact {artifact_id} from S3: {e}",
+            event=None,
+            context=None,
+            model_id=artifact_id,
+            error_code="s3_load_failed",
+        )
+        return None
+
+
+def iter_all_artifacts_from_s3() -> Iterator[Tuple[str, dict]]:
+    """Yield ``(artifact_id, artifact_data)`` for every stored artifact.
+
+    Artifacts are fetched page by page as the caller consumes them, with the
+    GETs for each listing page issued concurrently on the shared fetch pool.
+    Results keep listing order, and callers can stop early.
+
+    Documents are cached per container and revalidated against the ETag the
+    listing reports, so unchanged artifacts are not downloaded again and
+    writes are still seen immediately. Yielded dicts are shared with the
+    cache and must not be mutated.
+    """
     if not s3_client or not BUCKET_NAME:
         log_event(
             "warning",
@@ -501,45 +760,47 @@ def list_all_artifacts_from_s3() -> Dict[str, dict]:
             event=None,
             context=None,
         )
-        return {}
+        return
 
-    artifacts = {}
     try:
         paginator = s3_client.get_paginator("list_objects_v2")
-        for page in paginator.paginate(Bucket=BUCKET_NAME, Prefix="artifacts/"):
-            if "Contents" not in page:
-                continue
+        # Delimiter keeps per-artifact files (artifacts/{id}/...) out of the listing
+        pages = paginator.paginate(
+            Bucket=BUCKET_NAME, Prefix="artifacts/", Delimiter="/"
+        )
+        cache = _ARTIFACT_OBJECT_CACHE
+        seen_keys = set()
+        executor = _s3_fetch_executor()
+        for page in pages:
+            listed = [
+                (obj["Key"], obj.get("ETag"))
+                for obj in page.get("Contents", [])
+                if obj["Key"].endswith(".json")
+            ]
+            stale_keys = [
+                key for key, etag in listed
+                if etag is None or cache.get(key, (None,))[0] != etag
+            ]
+            fetched = dict(
+                zip(stale_keys, executor.map(_fetch_artifact_by_key, stale_keys))
+            )
 
-            for obj in page["Contents"]:
-                key = obj["Key"]
-                if key.endswith(".json"):
-                    artifact_id = key.replace("artifacts/", "").replace(".json", "")
-                    try:
-                        response = s3_client.get_object(Bucket=BUCKET_NAME, Key=key)
-                        artifact_data = json.loads(response["Body"].read().decode("utf-8"))
-                        artifacts[artifact_id] = artifact_data
-                    except ClientError as e:
-                        if e.response['Error']['Code'] == 'NoSuchKey':
-                            continue
-                        log_event(
-                            "error",
-                            f"Error loading artifact {artifact_id} from S3: {e}",
-                            event=None,
-                            context=None,
-                            model_id=artifact_id,
-                            error_code="s3_load_failed",
-                        )
-                    except Exception as e:
-                        log_event(
-                            "error",
-                            f"Error loading artifact {artifact_id} from S3: {e}",
-                            event=None,
-                            context=None,
-                            model_id=artifact_id,
-                            error_code="s3_load_failed",
-                        )
-
-        return artifacts
+            for key, etag in listed:
+                seen_keys.add(key)
+                if key in fetched:
+                    result = fetched[key]
+                    if result is None:
+                        cache.pop(key, None)
+                        continue
+                    if etag is not None:
+                        cache[key] = (etag, result[1])
+                    yield result
+                else:
+                    yield key[len("artifacts/"):-len(".json")], cache[key][1]
+
+        # Full pass completed: forget artifacts that no longer exist
+        for key in set(cache) - seen_keys:
+            del cache[key]
     except Exception as e:
         log_event(
             "error",
@@ -548,20 +809,32 @@ def list_all_artifacts_from_s3() -> Dict[str, dict]:
             context=None,
             error_code="s3_list_failed",
         )
-        return {}
 
 
-def _chunked_keys(keys: Iterable[Dict[str, str]], size: int = 1000) -> Iterable[List[Dict[str, str]]]:
-    """Yield chunks of S3 object identifiers."""
+def list_all_artifacts_from_s3() -> Dict[str, dict]:
+    """List all artifacts from S3 (for byName search)."""
+    return dict(iter_all_artifacts_from_s3())
+
 
-    chunk: List[Dict[str, str]] = []
-    for key in keys:
-        chunk.append(key)
-        if len(chunk) >= size:
-            yield chunk
-            chunk = []
-    if chunk:
-        yield chunk
+def _delete_key_batch(keys: List[Dict[str, str]]) -> int:
+    """Delete up to 1000 keys in one request; returns how many S3 deleted."""
+    assert s3_client is not None  # callers return early when S3 is not configured
+    response = s3_client.delete_objects(
+        Bucket=BUCKET_NAME,
+        Delete={"Objects": keys, "Quiet": True}
+    )
+    # Quiet mode still reports per-key failures
+    errors = response.get("Errors", [])
+    if errors:
+        log_event(
+            "warning",
+            f"Failed to delete {len(errors)} artifact object(s), first: "
+            f"{errors[0].get('Key')} ({errors[0].get('Code')})",
+            event=None,
+            context=None,
+            error_code="s3_reset_partial",
+        )
+    return len(keys) - len(errors)
 
 
 def delete_all_artifacts_from_s3() -> int:
@@ -581,21 +854,27 @@ def delete_all_artifacts_from_s3() -> int:
         return 0
 
     try:
+        # Drop the name index first so readers rebuild it from what remains
+        s3_client.delete_object(Bucket=BUCKET_NAME, Key=NAME_INDEX_KEY)
+
+        # Each listing page (at most 1000 keys, the delete_objects limit) is
+        # deleted on the shared pool while the next page is being listed
         paginator = s3_client.get_paginator("list_objects_v2")
-        objects_to_delete: List[Dict[str, str]] = []
-        for page in paginator.paginate(Bucket=BUCKET_NAME, Prefix="artifacts/"):
-            for obj in page.get("Contents", []):
-                objects_to_delete.append({"Key": obj["Key"]})
+        executor = _s3_fetch_executor()
+        batches = []
+        pages = paginator.paginate(
+            Bucket=BUCKET_NAME, Prefix="artifacts/", PaginationConfig={"PageSize": 1000}
+        )
+        for page in pages:
+            keys = [{"Key": obj["Key"]} for obj in page.get("Contents", [])]
+            if keys:
+                batches.append(executor.submit(_delete_key_batch, keys))
 
-        delete_count = len(objects_to_delete)
-        if not objects_to_delete:
-            return 0
+        delete_count = sum(batch.result() for batch in batches)
 
-        for chunk in _chunked_keys(objects_to_delete, size=1000):
-            s3_client.delete_objects(
-                Bucket=BUCKET_NAME,
-                Delete={"Objects": chunk, "Quiet": True}
-            )
+        # A reader that found no index while the batches were running may
+        # have rebuilt it from artifacts not yet deleted; drop that copy too
+        s3_client.delete_object(Bucket=BUCKET_NAME, Key=NAME_INDEX_KEY)
 
         log_event(
             "info",
@@ -624,16 +903,383 @@ def delete_all_artifacts_from_s3() -> int:
         raise
 
 
+# --- Name Index Helpers ---
+#
+# The index document has two parallel columns keyed by artifact id:
+#   "artifacts": {id: metadata}         - returned to clients as-is
+#   "name_lc":   {id: lowercased name}  - computed once at write time
+
+def _empty_name_index() -> Dict[str, Dict[str, Any]]:
+    return {"artifacts": {}, "name_lc": {}}
+
+
+def _set_name_index_entry(
+    index: Dict[str, Dict[str, Any]], artifact_id: str, metadata: dict
+) -> None:
+    index["artifacts"][artifact_id] = metadata
+    index["name_lc"][artifact_id] = str(metadata.get("name", "")).lower()
+
+
+def _read_name_index(
+    cached: Optional[Dict[str, Any]] = None,
+) -> Tuple[Optional[Dict[str, Dict[str, Any]]], Optional[str]]:
+    """Fetch the name index object.
+
+    Returns (index, etag), or (None, None) if the index does not exist yet.
+    With ``cached`` ({"etag", "index"}), the GET is conditional and the cached
+    index is returned as-is when S3 reports it unchanged.
+    """
+    assert s3_client is not None  # callers return early when S3 is not configured
+    kwargs = {}
+    if cached and cached["etag"]:
+        kwargs["IfNoneMatch"] = cached["etag"]
+    try:
+        response = s3_client.get_object(
+            Bucket=BUCKET_NAME, Key=NAME_INDEX_KEY, **kwargs
+        )
+    except ClientError as e:
+        code = e.response["Error"]["Code"]
+        if code in ("304", "NotModified") and cached and kwargs:
+            return cached["index"], cached["etag"]
+        if code in ("404", "NoSuchKey"):
+            return None, None
+        raise
+    document = json.loads(response["Body"].read().decode("utf-8"))
+    index = _empty_name_index()
+    index["artifacts"] = document.get("artifacts", {})
+    index["name_lc"] = document.get("name_lc", {})
+    return index, response.get("ETag")
+
+
+def _write_name_index(index: Dict[str, Dict[str, Any]], etag: Optional[str]) -> bool:
+    """Conditionally write the name index.
+
+    Writes only if the object is unchanged since it was read (``etag``) or,
+    when ``etag`` is None, only if it still does not exist. Returns False when
+    another writer got there first.
+    """
+    assert s3_client is not None  # callers return early when S3 is not configured
+    condition = {"IfMatch": etag} if etag else {"IfNoneMatch": "*"}
+    try:
+        s3_client.put_object(
+            Bucket=BUCKET_NAME,
+            Key=NAME_INDEX_KEY,
+            Body=json.dumps(index),
+            ContentType="application/json",
+            **condition,
+        )
+        return True
+    except ClientError as e:
+        if e.response["Error"]["Code"] in (
+            "PreconditionFailed",
+            "ConditionalRequestConflict",
+            "412",
+            "409",
+        ):
+            return False
+        raise
+
+
+def _build_name_index_from_scan() -> Dict[str, Dict[str, Any]]:
+    """Rebuild the index from the stored artifacts (used when it is missing)."""
+    index = _empty_name_index()
+    for artifact_id, artifact_data in list_all_artifacts_from_s3().items():
+        _set_name_index_entry(index, artifact_id, artifact_data.get("metadata", {}))
+    return index
+
+
+def _update_name_index(artifact_id: str, metadata: Optional[dict]) -> None:
+    """Set (or with ``metadata=None`` remove) one entry in the name index.
+
+    Uses optimistic concurrency: read, modify, conditional write, retry on
+    conflict. If the index cannot be updated it is deleted, so the next reader
+    rebuilds it from a full scan rather than serving stale entries.
+    """
+    if not s3_client or not BUCKET_NAME:
+        return
+
+    try:
+        for _ in range(NAME_INDEX_MAX_RETRIES):
+            index, etag = _read_name_index()
+            if index is None:
+                if metadata is None:
+                    # Nothing to remove; the next reader builds it from a scan
+                    return
+                index = _build_name_index_from_scan()
+
+            if metadata is None:
+                if artifact_id not in index["artifacts"]:
+                    return
+                del index["artifacts"][artifact_id]
+                index["name_lc"].pop(artifact_id, None)
+            else:
+                _set_name_index_entry(index, artifact_id, metadata)
+
+            if _write_name_index(index, etag):
+                return
+
+        raise RuntimeError("too many concurrent name index updates")
+    except Exception as e:
+        log_event(
+            "error",
+            f"Error updating name index for {artifact_id}, invalidating it: {e}",
+            event=None,
+            context=None,
+            model_id=artifact_id,
+            error_code="name_index_update_failed",
+        )
+        try:
+            s3_client.delete_object(Bucket=BUCKET_NAME, Key=NAME_INDEX_KEY)
+        except Exception:
+            pass
+
+
+def remove_artifact_from_name_index(artifact_id: str) -> None:
+    """Drop a deleted artifact from the name index."""
+    _update_name_index(artifact_id, None)
+
+
+def _load_local_name_index() -> None:
+    """Seed ``_NAME_INDEX_CACHE`` from the copy left in /tmp, if any."""
+    try:
+        with open(NAME_INDEX_LOCAL_PATH, "rb") as f:
+            saved = json_loads(f.read())
+    except (OSError, ValueError):
+        return
+    if (
+        isinstance(saved, dict)
+        and saved.get("etag")
+        and isinstance(saved.get("index"), dict)
+    ):
+        _NAME_INDEX_CACHE["etag"] = saved["etag"]
+        _NAME_INDEX_CACHE["index"] = saved["index"]
+
+
+def _save_local_name_index(
+    index: Dict[str, Dict[str, Any]], etag: Optional[str]
+) -> None:
+    """Write the index to /tmp atomically (temp file + rename)."""
+    tmp_path = f"{NAME_INDEX_LOCAL_PATH}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json_dumps({"etag": etag, "index": index}))
+        os.replace(tmp_path, NAME_INDEX_LOCAL_PATH)
+    except OSError as e:
+        log_event(
+            "warning",
+            f"Could not write local name index copy: {e}",
+            event=None,
+            context=None,
+            error_code="name_index_local_write_failed",
+        )
+
+
+def load_name_index() -> Dict[str, Dict[str, Any]]:
+    """Return the name index: ``{"artifacts": {id: metadata}, "name_lc": {id: name}}``.
+
+    Reads the single aggregated index object instead of fetching every
+    artifact; falls back to a full scan (and persists the result) if the
+    index has not been built yet. Warm containers keep the last copy and only
+    re-download it when its ETag changes, so writes are seen immediately; a
+    re-initialized container starts from the copy saved in /tmp.
+    The returned dict is shared between calls and must not be mutated.
+    """
+    if not s3_client or not BUCKET_NAME:
+        log_event(
+            "warning",
+            "S3 not configured, returning empty index",
+            event=None,
+            context=None,
+        )
+        return _empty_name_index()
+
+    if _NAME_INDEX_CACHE["index"] is None and NAME_INDEX_LOCAL_PATH:
+        _load_local_name_index()
+
+    try:
+        index, etag = _read_name_index(_NAME_INDEX_CACHE)
+    except Exception as e:
+        log_event(
+            "error",
+            f"Error reading name index, falling back to scan: {e}",
+            event=None,
+            context=None,
+            error_code="name_index_read_failed",
+        )
+        return _build_name_index_from_scan()
+
+    if index is not None:
+        if NAME_INDEX_LOCAL_PATH and index is not _NAME_INDEX_CACHE["index"] and etag:
+            _save_local_name_index(index, etag)
+        _NAME_INDEX_CACHE["etag"] = etag
+        _NAME_INDEX_CACHE["index"] = index
+        return index
+
+    _NAME_INDEX_CACHE["etag"] = None
+    _NAME_INDEX_CACHE["index"] = None
+    index = _build_name_index_from_scan()
+    try:
+        # Only create it if no writer has done so meanwhile
+        _write_name_index(index, None)
+    except Exception as e:
+        log_event(
+            "warning",
+            f"Could not persist rebuilt name index: {e}",
+            event=None,
+            context=None,
+            error_code="name_index_write_failed",
+        )
+    return index
+
+
+def name_index_ids_by_name(
+    name_index: Dict[str, Dict[str, Any]],
+) -> Dict[str, List[str]]:
+    """Group the index's artifact ids by lowercased name.
+
+    Memoized on the index object, which load_name_index only replaces when
+    the stored index's ETag changes, so warm invocations reuse the grouping.
+    The returned dict is shared between calls and must not be mutated.
+    """
+    if _NAME_LOOKUP_CACHE["source"] is not name_index:
+        names_lc = name_index["name_lc"]
+        by_name: Dict[str, List[str]] = {}
+        for artifact_id, artifact_metadata in name_index["artifacts"].items():
+            artifact_name_lc = names_lc.get(artifact_id)
+            if artifact_name_lc is None:
+                # Indexes written before "name_lc" existed
+                artifact_name_lc = str(artifact_metadata.get("name", "")).lower()
+            by_name.setdefault(artifact_name_lc, []).append(artifact_id)
+        _NAME_LOOKUP_CACHE["source"] = name_index
+        _NAME_LOOKUP_CACHE["by_name"] = by_name
+    return _NAME_LOOKUP_CACHE["by_name"]
+
+
+# --- Artifact Query Helpers ---
+#
+# Shared by POST /artifacts and POST /artifacts/detailed, which match the
+# same query list against the name index.
+
+def _query_error(query: Any) -> Optional[Tuple[str, str]]:
+    """Return (error_code, log message) if one query entry is invalid, else None."""
+    name = query.get("name") if isinstance(query, dict) else None
+    if not isinstance(name, str) or not name:
+        return "invalid_query_entry", "Invalid artifact query entry"
+    if "types" in query:
+        types_value = query["types"]
+        if not isinstance(types_value, list):
+            return "invalid_types_filter", "Invalid artifact types filter - not a list"
+        # Only validate contents if types list is non-empty
+        if types_value and not all(
+            isinstance(item, str) and item for item in types_value
+        ):
+            return (
+                "invalid_types_filter",
+                "Invalid artifact types filter - invalid type values",
+            )
+    return None
+
+
+def validate_artifact_queries(
+    queries: Any, max_queries: int
+) -> Optional[Tuple[str, str]]:
+    """Return (error_code, log message) for the first invalid query, or None."""
+    if not isinstance(queries, list) or not queries:
+        return "invalid_query", "Artifact queries missing or not a list"
+    if len(queries) > max_queries:
+        return "too_many_queries", f"Artifact query list exceeds {max_queries} entries"
+
+    for query in queries:
+        invalid = _query_error(query)
+        if invalid is not None:
+            return invalid
+
+    return None
+
+
+def group_artifact_queries(
+    queries: Sequence[Dict[str, Any]],
+) -> Dict[str, Optional[Set[str]]]:
+    """Merge validated queries by lowercased name ("*" kept as-is).
+
+    Each name maps to the union of its queries' types, or None when any of
+    them accepts every type, so each distinct name is looked up only once.
+    """
+    grouped: Dict[str, Optional[Set[str]]] = {}
+    for query in queries:
+        if not isinstance(query, dict):
+            continue
+        name_query = query.get("name")
+        if not isinstance(name_query, str) or not name_query:
+            continue
+
+        name_lc = name_query if name_query == "*" else name_query.lower()
+        types = query.get("types")
+        merged = grouped.get(name_lc)
+        if not types:
+            grouped[name_lc] = None
+        elif name_lc not in grouped:
+            grouped[name_lc] = set(types)
+        elif merged is not None:
+            merged.update(types)
+    return grouped
+
+
+def collect_name_index_matches(
+    name_index: Dict[str, Dict[str, Any]],
+    queries: Sequence[Dict[str, Any]],
+    max_results: int,
+) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Return matching index metadata keyed by id, or None once past max_results.
+
+    Entries whose metadata has no "id" (artifacts stored without metadata)
+    are never returned.
+    """
+    artifacts = name_index["artifacts"]
+    by_name = name_index_ids_by_name(name_index)
+    results: Dict[str, Dict[str, Any]] = {}
+
+    grouped = group_artifact_queries(queries)
+    if "*" in grouped and grouped["*"] is None:
+        # Everything matches, so no other query can add to the result
+        results = {
+            artifact_id: metadata
+            for artifact_id, metadata in artifacts.items()
+            if metadata.get("id")
+        }
+        return results if len(results) <= max_results else None
+
+    for name_lc, types in grouped.items():
+        candidates = artifacts if name_lc == "*" else by_name.get(name_lc, ())
+        for artifact_id in candidates:
+            if artifact_id in results:
+                continue
+            metadata = artifacts[artifact_id]
+            if not metadata.get("id"):
+                continue
+            if types is None or metadata.get("type") in types:
+                results[artifact_id] = metadata
+                if len(results) > max_results:
+                    return None
+
+    return results
+
+
 # --- Response Helpers ---
 
+# Static CORS headers shared by every response; built once per container.
+CORS_HEADERS: Dict[str, str] = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Headers": "Content-Type,X-Authorization",
+    "Access-Control-Allow-Methods": "GET,POST,PUT,DELETE,OPTIONS",
+}
+
+_JSON_HEADERS: Dict[str, str] = {"Content-Type": "application/json", **CORS_HEADERS}
+
+
 def create_response(status_code: int, body: Any, headers: Optional[Dict] = None) -> Dict:
     """Create an API Gateway response."""
-    default_headers = {
-        "Content-Type": "application/json",
-        "Access-Control-Allow-Origin": "*",
-        "Access-Control-Allow-Headers": "Content-Type,X-Authorization",
-        "Access-Control-Allow-Methods": "GET,POST,PUT,DELETE,OPTIONS"
-    }
+    default_headers = dict(_JSON_HEADERS)
 
     if headers:
         default_headers.update(headers)
@@ -641,7 +1287,7 @@ def create_response(status_code: int, body: Any, headers: Optional[Dict] = None)
     return {
         "statusCode": status_code,
         "headers": default_headers,
-        "body": json.dumps(body) if not isinstance(body, str) else body
+        "body": json_dumps(body) if not isinstance(body, str) else body
     }
 
 
@@ -706,11 +1352,16 @@ def evaluate_model(
 
     url: str,
     *,
-    artifact_store: Optional[S3ArtifactStore] = None,
+    artifact_store: Optional[ArtifactStore] = None,
     event: Optional[Dict[str, Any]] = None,
     context: Optional[Any] = None,
 ) -> dict:
-    """Evaluate a model and return rating dict with base_model metadata."""
+    """Evaluate a model and return rating dict with base_model metadata.
+
+    Without an artifact store, results are cached per URL for
+    RATING_CACHE_TTL_SECONDS. Evaluations with a store always run, since
+    tree_score reads the registry.
+    """
     # Lazy import evaluation logic to reduce cold start time for handlers that don't evaluate
     from src.metrics.helpers.pull_model import pull_model_info, canonicalize_hf_url
     from src.orchestrator import calculate_all_metrics
@@ -719,6 +1370,15 @@ def evaluate_model(
 
     url = canonicalize_hf_url(url) if url.startswith("https://huggingface.co/") else url
 
+    cacheable = artifact_store is None
+    cached = _RATING_CACHE.get(url) if cacheable else None
+    if cached is not None and monotonic() - cached[0] < RATING_CACHE_TTL_SECONDS:
+        log_event(
+            "info", f"Using cached rating for {url}", event=event, context=context
+        )
+        # Callers mutate the rating (e.g. pop base_model), so hand out a copy
+        return copy.deepcopy(cached[1])
+
     # Fetch and evaluate
     model_info = pull_model_info(url)
     if not model_info:
@@ -743,7 +1403,13 @@ def evaluate_model(
     if base_model is not None:
         result["base_model"] = base_model
 
-    return convert_to_model_rating(result)
+    rating = convert_to_model_rating(result)
+    if cacheable:
+        _RATING_CACHE.pop(url, None)
+        _RATING_CACHE[url] = (monotonic(), copy.deepcopy(rating))
+        if len(_RATING_CACHE) > RATING_CACHE_MAX_ENTRIES:
+            del _RATING_CACHE[next(iter(_RATING_CACHE))]
+    return rating
 
 
 # --- URL Validation Helpers ---
@@ -12,6 +12,22 @@ from typing import Any, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
+# One S3 client per process, shared by every S3ArtifactStore so per-request
+# stores reuse its credentials and connection pool on warm invocations
+_shared_s3_client = None
+
+
+def _get_shared_s3_client():
+    global _shared_s3_client
+    if _shared_s3_client is None:
+        from botocore.config import Config
+        from botocore.session import get_session
+
+        _shared_s3_client = get_session().create_client(
+            "s3", config=Config(tcp_keepalive=True, retries={"mode": "standard"})
+        )
+    return _shared_s3_client
+
 
 class ArtifactStore(ABC):
     """Abstract base class for artifact storage backends."""
@@ -60,11 +76,9 @@ class S3ArtifactStore(ArtifactStore):
 
     @property
     def s3_client(self):
-        """Lazy-load S3 client to avoid import/connection overhead."""
+        """Lazy-load the process-wide S3 client to avoid import/connection overhead."""
         if self._s3_client is None:
-            import boto3
-
-            self._s3_client = boto3.client("s3")
+            self._s3_client = _get_shared_s3_client()
         return self._s3_client
 
     def get_artifact(self, artifact_id: str) -> Optional[Dict[str, Any]]:
@@ -126,18 +140,26 @@ class NullArtifactStore(ArtifactStore):
         return False
 
 
+# One store per bucket, reused across warm invocations
+_s3_stores: Dict[str, "S3ArtifactStore"] = {}
+
+
 def get_artifact_store() -> ArtifactStore:
     """
     Factory function to get appropriate artifact store for current context.
 
     Returns:
         S3ArtifactStore if ARTIFACTS_BUCKET env var is set (Lambda context),
-        otherwise NullArtifactStore (CLI context)
+        otherwise NullArtifactStore (CLI context). S3 stores are created once
+        per bucket and reused.
     """
     bucket_name = os.environ.get("ARTIFACTS_BUCKET")
     if bucket_name:
-        logger.debug(f"Using S3ArtifactStore with bucket: {bucket_name}")
-        return S3ArtifactStore(bucket_name)
+        store = _s3_stores.get(bucket_name)
+        if store is None:
+            logger.debug(f"Using S3ArtifactStore with bucket: {bucket_name}")
+            store = _s3_stores[bucket_name] = S3ArtifactStore(bucket_name)
+        return store
     else:
         logger.debug("Using NullArtifactStore (no S3 access)")
         return NullArtifactStore()
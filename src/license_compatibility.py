@@ -7,15 +7,30 @@ Provides functionality to:
 - Normalize license strings to SPDX IDs
 """
 
+import http.client
 import json
 import logging
-import re
-import urllib.error
-import urllib.request
-from typing import Optional
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
 
 logger = logging.getLogger(__name__)
 
+# Successful GitHub license lookups, kept for the life of a warm container:
+# "owner/repo" -> (normalized license, ETag, fetched-at monotonic time).
+# Within the TTL the cached value is returned without a request; after it the
+# lookup is revalidated with If-None-Match, and a 304 does not count against
+# the GitHub rate limit.
+GITHUB_LICENSE_CACHE_TTL_SECONDS = 15 * 60
+_GH_LICENSE_CACHE: Dict[str, Tuple[str, Optional[str], float]] = {}
+
+# One kept-alive HTTPS connection to the GitHub API per container, so warm
+# invocations skip the TCP/TLS handshake. Lambda runs one request at a time
+# per container, so the connection is never shared between threads.
+GITHUB_API_HOST = "api.github.com"
+GITHUB_API_TIMEOUT_SECONDS = 10
+_GITHUB_CONNECTION: Dict[str, Optional[http.client.HTTPSConnection]] = {"conn": None}
+
 
 class GitHubAPIError(Exception):
     """Raised when GitHub API request fails."""
@@ -259,6 +274,63 @@ def check_license_compatibility(
     return is_compatible
 
 
+def _github_get(
+    path: str, headers: Dict[str, str]
+) -> Tuple[http.client.HTTPResponse, bytes]:
+    """GET ``path`` from the GitHub API over the shared connection.
+
+    If a reused connection fails (typically closed by the server while idle),
+    the request is retried once on a fresh one; other failures propagate.
+    """
+    conn = _GITHUB_CONNECTION["conn"]
+    reused = conn is not None
+    if conn is None:
+        conn = http.client.HTTPSConnection(
+            GITHUB_API_HOST, timeout=GITHUB_API_TIMEOUT_SECONDS
+        )
+        _GITHUB_CONNECTION["conn"] = conn
+
+    try:
+        conn.request("GET", path, headers=headers)
+        response = conn.getresponse()
+        # Drain the body so the connection can be reused
+        return response, response.read()
+    except (http.client.HTTPException, OSError):
+        conn.close()
+        _GITHUB_CONNECTION["conn"] = None
+        if not reused:
+            raise
+
+    return _github_get(path, headers)
+
+
+def parse_github_url(github_url: str) -> Optional[Tuple[str, str]]:
+    """
+    Parse a GitHub repository URL into (owner, repo).
+
+    Handles formats: https://github.com/owner/repo[/tree/branch][.git]
+
+    Returns:
+        (owner, repo) tuple, or None if the URL is not a GitHub repository URL
+    """
+    if github_url[:1].isspace() or github_url[-1:].isspace():
+        github_url = github_url.strip()
+
+    parts = urlsplit(github_url)
+    if parts.scheme != "https" or parts.netloc.lower() != "github.com":
+        return None
+
+    segments = parts.path.split("/", 3)
+    if len(segments) < 3 or not segments[1] or not segments[2]:
+        return None
+
+    owner, repo = segments[1], segments[2]
+    # Remove .git suffix if present
+    if repo.endswith(".git"):
+        repo = repo[:-4]
+    return (owner, repo) if repo else None
+
+
 def fetch_github_license(github_url: str) -> str:
     """
     Fetch license from GitHub repository using GitHub REST API.
@@ -270,71 +342,78 @@ def fetch_github_license(github_url: str) -> str:
         License SPDX ID (lowercase, e.g., 'mit', 'apache-2.0')
 
     Raises:
+        ValueError: If the URL is not a GitHub repository URL
         GitHubAPIError: If API request fails
         LicenseNotFoundError: If repo has no license
     """
-    # Parse owner/repo from URL
-    # Handle formats: https://github.com/owner/repo[/tree/branch][.git]
-    pattern = r"https://github\.com/([^/]+)/([^/]+)"
-    match = re.match(pattern, github_url)
-    if not match:
+    repo_ref = parse_github_url(github_url)
+    if repo_ref is None:
         raise ValueError(f"Invalid GitHub URL format: {github_url}")
 
-    owner, repo = match.groups()
-    # Remove .git suffix if present
-    repo = repo.replace(".git", "")
+    return fetch_github_repo_license(*repo_ref)
 
-    api_url = f"https://api.github.com/repos/{owner}/{repo}/license"
 
-    logger.info(f"Fetching license from GitHub API: {api_url}")
+def fetch_github_repo_license(owner: str, repo: str) -> str:
+    """
+    Fetch license for an already-parsed GitHub repository.
 
-    try:
-        # GitHub API v3 - use Accept header
-        req = urllib.request.Request(
-            api_url,
-            headers={
-                "Accept": "application/vnd.github.v3+json",
-                "User-Agent": "ACME-Package-Registry",
-            },
-        )
+    Same as fetch_github_license, for callers that have validated the URL
+    with parse_github_url.
+    """
+    cache_key = f"{owner}/{repo}"
+    cached = _GH_LICENSE_CACHE.get(cache_key)
+    now = time.monotonic()
+    if cached is not None and now - cached[2] < GITHUB_LICENSE_CACHE_TTL_SECONDS:
+        logger.info(f"GitHub license cache hit for {cache_key}: {cached[0]}")
+        return cached[0]
 
-        with urllib.request.urlopen(req, timeout=10) as response:
-            data = json.loads(response.read().decode("utf-8"))
+    path = f"/repos/{owner}/{repo}/license"
 
-        # Response structure: {"license": {"spdx_id": "MIT", ...}}
-        license_info = data.get("license", {})
-        spdx_id = license_info.get("spdx_id")
+    logger.info(f"Fetching license from GitHub API: https://{GITHUB_API_HOST}{path}")
 
-        if not spdx_id or spdx_id == "NOASSERTION":
-            raise LicenseNotFoundError(
-                f"No license found for {owner}/{repo}"
-            )
+    # GitHub API v3 - use Accept header
+    headers = {
+        "Accept": "application/vnd.github.v3+json",
+        "User-Agent": "ACME-Package-Registry",
+    }
+    if cached is not None and cached[1]:
+        headers["If-None-Match"] = cached[1]
 
-        # Normalize to lowercase (consistent with existing license.py)
-        normalized = spdx_id.lower()
-        logger.info(
-            f"Fetched license for {owner}/{repo}: {spdx_id} -> {normalized}"
-        )
-        return normalized
-
-    except urllib.error.HTTPError as e:
-        if e.code == 404:
-            raise GitHubAPIError(f"Repository not found: {owner}/{repo}")
-        elif e.code == 403:
-            # Rate limiting
-            raise GitHubAPIError("GitHub API rate limit exceeded (403)")
-        else:
-            raise GitHubAPIError(f"GitHub API error {e.code}: {e.reason}")
-
-    except urllib.error.URLError as e:
-        raise GitHubAPIError(
-            f"Network error accessing GitHub API: {e.reason}"
-        )
+    try:
+        response, raw = _github_get(path, headers)
+    except (http.client.HTTPException, OSError) as e:
+        raise GitHubAPIError(f"Network error accessing GitHub API: {e}")
+
+    if response.status == 304 and cached is not None:
+        logger.info(f"GitHub license not modified for {cache_key}: {cached[0]}")
+        _GH_LICENSE_CACHE[cache_key] = (cached[0], cached[1], now)
+        return cached[0]
+    if response.status == 404:
+        raise GitHubAPIError(f"Repository not found: {owner}/{repo}")
+    if response.status == 403:
+        # Rate limiting
+        raise GitHubAPIError("GitHub API rate limit exceeded (403)")
+    if response.status != 200:
+        raise GitHubAPIError(f"GitHub API error {response.status}: {response.reason}")
 
-    except json.JSONDecodeError as e:
+    try:
+        data = json.loads(raw.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
         raise GitHubAPIError(f"Failed to parse GitHub API response: {e}")
 
-    except Exception as e:
-        raise GitHubAPIError(
-            f"Unexpected error fetching GitHub license: {str(e)}"
+    # Response structure: {"license": {"spdx_id": "MIT", ...}}
+    license_info = data.get("license") if isinstance(data, dict) else None
+    spdx_id = license_info.get("spdx_id") if isinstance(license_info, dict) else None
+
+    if not spdx_id or spdx_id == "NOASSERTION":
+        raise LicenseNotFoundError(
+            f"No license found for {owner}/{repo}"
         )
+
+    # Normalize to lowercase (consistent with existing license.py)
+    normalized = spdx_id.lower()
+    logger.info(
+        f"Fetched license for {owner}/{repo}: {spdx_id} -> {normalized}"
+    )
+    _GH_LICENSE_CACHE[cache_key] = (normalized, response.getheader("ETag"), now)
+    return normalized
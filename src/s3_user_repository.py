@@ -1,5 +1,5 @@
 import json
-import boto3
+from botocore.session import get_session
 from typing import Optional, List
 
 from src.user_management import User, UserRepository
@@ -9,7 +9,7 @@ class S3UserRepository(UserRepository):
     """User repository backed by S3 JSON file."""
 
     def __init__(self, bucket: str, key: str):
-        self.s3 = boto3.client("s3")
+        self.s3 = get_session().create_client("s3")
         self.bucket = bucket
         self.key = key
 
@@ -0,0 +1,24 @@
+"""Tests for src.artifact_store."""
+
+from src import artifact_store
+from src.artifact_store import NullArtifactStore, S3ArtifactStore, get_artifact_store
+
+
+def test_get_artifact_store_reuses_store_per_bucket(monkeypatch):
+    """Test that warm calls get the same S3 store until the bucket changes."""
+    monkeypatch.setattr(artifact_store, "_s3_stores", {})
+    monkeypatch.setenv("ARTIFACTS_BUCKET", "bucket-a")
+
+    store = get_artifact_store()
+    assert isinstance(store, S3ArtifactStore)
+    assert get_artifact_store() is store
+
+    monkeypatch.setenv("ARTIFACTS_BUCKET", "bucket-b")
+    assert get_artifact_store().bucket_name == "bucket-b"
+
+
+def test_get_artifact_store_without_bucket(monkeypatch):
+    """Test that the CLI context falls back to the null store."""
+    monkeypatch.delenv("ARTIFACTS_BUCKET", raising=False)
+
+    assert isinstance(get_artifact_store(), NullArtifactStore)
@@ -1,6 +1,8 @@
 """Tests for delete_artifact Lambda handler."""
 
 import json
+from types import SimpleNamespace
+
 import pytest
 from botocore.exceptions import ClientError
 
@@ -15,14 +17,14 @@ def mock_s3_operations(monkeypatch):
     def mock_load(artifact_id):
         return stored_artifacts.get(artifact_id)
 
-    # Mock boto3.client to return a mock S3 client
+    # Mock the botocore session's create_client to return a mock S3 client
     class MockS3Client:
         def delete_object(self, Bucket, Key):
             deleted_keys.append(Key)
             # Simulate successful deletion (S3 doesn't error if key doesn't exist)
             return {}
 
-    def mock_boto3_client(service_name):
+    def mock_create_client(service_name):
         if service_name == "s3":
             return MockS3Client()
         raise ValueError(f"Unexpected service: {service_name}")
@@ -32,9 +34,10 @@ def mock_s3_operations(monkeypatch):
         mock_load
     )
     monkeypatch.setattr(
-        "lambda_handlers.delete_artifact.boto3.client",
-        mock_boto3_client
+        "lambda_handlers.delete_artifact.get_session",
+        lambda: SimpleNamespace(create_client=mock_create_client)
     )
+    monkeypatch.setattr("lambda_handlers.delete_artifact._S3_CLIENT", {"client": None})
     monkeypatch.setenv("ARTIFACTS_BUCKET", "test-bucket")
 
     return {"stored_artifacts": stored_artifacts, "deleted_keys": deleted_keys}
@@ -59,7 +62,7 @@ def mock_s3_error(monkeypatch):
             }
             raise ClientError(error_response, "DeleteObject")
 
-    def mock_boto3_client(service_name):
+    def mock_create_client(service_name):
         if service_name == "s3":
             return MockS3Client()
         raise ValueError(f"Unexpected service: {service_name}")
@@ -69,9 +72,10 @@ def mock_s3_error(monkeypatch):
         mock_load
     )
     monkeypatch.setattr(
-        "lambda_handlers.delete_artifact.boto3.client",
-        mock_boto3_client
+        "lambda_handlers.delete_artifact.get_session",
+        lambda: SimpleNamespace(create_client=mock_create_client)
     )
+    monkeypatch.setattr("lambda_handlers.delete_artifact._S3_CLIENT", {"client": None})
     monkeypatch.setenv("ARTIFACTS_BUCKET", "test-bucket")
 
     return stored_artifacts
@@ -355,3 +359,17 @@ def test_delete_artifact_with_top_level_type(mock_s3_operations):
     response = handler(event, None)
 
     assert response["statusCode"] == 200
+
+
+def test_delete_reuses_s3_client(mock_s3_operations, monkeypatch):
+    """Test that warm invocations reuse the S3 client created on the first delete."""
+    import lambda_handlers.delete_artifact as delete_artifact
+
+    created = []
+    session = SimpleNamespace(
+        create_client=lambda service_name: created.append(service_name) or object()
+    )
+    monkeypatch.setattr(delete_artifact, "get_session", lambda: session)
+
+    assert delete_artifact._get_s3_client() is delete_artifact._get_s3_client()
+    assert created == ["s3"]
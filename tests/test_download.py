@@ -0,0 +1,71 @@
+"""Tests for download Lambda handler."""
+
+import base64
+
+import pytest
+
+
+class FakeBody:
+    """Minimal stand-in for botocore's StreamingBody."""
+
+    def __init__(self, data):
+        self._data = data
+        self._pos = 0
+
+    def iter_chunks(self, chunk_size=1024):
+        while self._pos < len(self._data):
+            chunk = self._data[self._pos:self._pos + chunk_size]
+            self._pos += len(chunk)
+            yield chunk
+
+    def read(self):
+        rest = self._data[self._pos:]
+        self._pos = len(self._data)
+        return rest
+
+
+@pytest.fixture
+def fake_s3(monkeypatch):
+    """Serve get_object from an in-memory dict of key -> (bytes, ContentLength)."""
+    objects = {}
+
+    class FakeS3:
+        def get_object(self, Bucket, Key):
+            data, length = objects[Key]
+            response = {"Body": FakeBody(data)}
+            if length is not None:
+                response["ContentLength"] = length
+            return response
+
+    monkeypatch.setattr("lambda_handlers.download.s3_client", FakeS3())
+    monkeypatch.setattr("lambda_handlers.download.BUCKET_NAME", "test-bucket")
+    monkeypatch.setattr("lambda_handlers.download._READ_CHUNK_SIZE", 4)
+    return objects
+
+
+@pytest.mark.parametrize("length", [None, 10, 6, 14])
+def test_download_returns_full_body(fake_s3, length):
+    """Test that the zip is returned intact for any ContentLength.
+
+    Covers an absent, exact, short and long ContentLength.
+    """
+    payload = b"0123456789"
+    fake_s3["artifacts/abc/data.zip"] = (payload, length)
+
+    from lambda_handlers.download import handler
+    response = handler(
+        {"httpMethod": "GET", "pathParameters": {"artifact_id": "abc"}}, None
+    )
+
+    assert response["statusCode"] == 200
+    assert response["isBase64Encoded"] is True
+    assert base64.b64decode(response["body"]) == payload
+    assert response["headers"]["Content-Type"] == "application/zip"
+
+
+def test_download_missing_artifact_id():
+    """Test that a missing path parameter returns 400."""
+    from lambda_handlers.download import handler
+    response = handler({"httpMethod": "GET", "pathParameters": {}}, None)
+
+    assert response["statusCode"] == 400
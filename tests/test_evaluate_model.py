@@ -0,0 +1,85 @@
+"""Tests for utils.evaluate_model rating cache."""
+
+import json
+
+import pytest
+
+import lambda_handlers.utils as utils
+import src.orchestrator as orchestrator
+from src.artifact_store import NullArtifactStore
+from src.metrics.helpers import pull_model
+
+URL = "https://huggingface.co/owner/model"
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    """Stub the metrics pipeline, counting evaluations."""
+    calls = []
+
+    def calculate_all_metrics(model_info, url, artifact_store):
+        calls.append((url, artifact_store))
+        return json.dumps({
+            "category": "MODEL",
+            "name": "owner/model",
+            "net_score": 0.9,
+            "net_score_latency": 5,
+        })
+
+    monkeypatch.setattr(
+        pull_model, "pull_model_info", lambda url: {"id": "owner/model"}
+    )
+    monkeypatch.setattr(orchestrator, "calculate_all_metrics", calculate_all_metrics)
+    monkeypatch.setattr(utils, "_RATING_CACHE", {})
+    return calls
+
+
+def test_evaluate_model_reuses_rating_within_ttl(pipeline):
+    """Test that a repeat evaluation is served from the cache as an independent copy."""
+    first = utils.evaluate_model(URL)
+    first["net_score"] = 0.0
+
+    second = utils.evaluate_model(URL)
+
+    assert len(pipeline) == 1
+    assert second["name"] == "model"
+    assert second["net_score"] == 0.9
+
+
+def test_evaluate_model_reevaluates_after_ttl(pipeline, monkeypatch):
+    """Test that expired entries trigger a fresh evaluation."""
+    monkeypatch.setattr(utils, "RATING_CACHE_TTL_SECONDS", 0)
+
+    utils.evaluate_model(URL)
+    utils.evaluate_model(URL)
+
+    assert len(pipeline) == 2
+
+
+def test_evaluate_model_cache_is_bounded(pipeline, monkeypatch):
+    """Test that the oldest rating is dropped once the cache is full."""
+    monkeypatch.setattr(utils, "RATING_CACHE_MAX_ENTRIES", 2)
+
+    for name in ("a", "b", "c"):
+        utils.evaluate_model(f"https://example.com/{name}")
+
+    assert list(utils._RATING_CACHE) == [
+        "https://example.com/b",
+        "https://example.com/c",
+    ]
+
+
+def test_evaluate_model_with_artifact_store_is_not_cached(pipeline):
+    """Test that registry-dependent evaluations always run and leave the cache alone."""
+    store = NullArtifactStore()
+
+    utils.evaluate_model(URL, artifact_store=store)
+    utils.evaluate_model(URL, artifact_store=store)
+
+    assert pipeline == [(URL, store), (URL, store)]
+    assert utils._RATING_CACHE == {}
+
+    utils.evaluate_model(URL)
+    utils.evaluate_model(URL, artifact_store=store)
+
+    assert len(pipeline) == 4
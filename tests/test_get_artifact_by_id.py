@@ -0,0 +1,86 @@
+"""Tests for get_artifact_by_id Lambda handler."""
+
+import json
+import pytest
+
+
+@pytest.fixture
+def stored_artifacts(monkeypatch):
+    """Mock point reads from S3 with in-memory storage."""
+    stored = {}
+    loaded_ids = []
+
+    def mock_load(artifact_id):
+        loaded_ids.append(artifact_id)
+        return stored.get(artifact_id)
+
+    monkeypatch.setattr(
+        "lambda_handlers.get_artifact_by_id.load_artifact_from_s3",
+        mock_load
+    )
+    stored["_loaded_ids"] = loaded_ids
+    return stored
+
+
+def test_get_artifact_returns_envelope(stored_artifacts):
+    """Test that the stored artifact is returned as a metadata/data envelope."""
+    artifact_id = "test-model-id"
+    stored_artifacts[artifact_id] = {
+        "url": "https://huggingface.co/test/model",
+        "metadata": {"name": "model", "id": artifact_id, "type": "model"},
+        "data": {"url": "https://huggingface.co/test/model"},
+        "rating": {"net_score": 0.75},
+        "type": "model"
+    }
+
+    event = {
+        "httpMethod": "GET",
+        "pathParameters": {"artifact_type": "model", "id": artifact_id}
+    }
+
+    from lambda_handlers.get_artifact_by_id import handler
+    response = handler(event, None)
+
+    assert response["statusCode"] == 200
+    body = json.loads(response["body"])
+    assert body == {
+        "metadata": {"name": "model", "id": artifact_id, "type": "model"},
+        "data": {"url": "https://huggingface.co/test/model"},
+    }
+    # Only the requested object is read
+    assert stored_artifacts["_loaded_ids"] == [artifact_id]
+
+
+def test_get_artifact_type_mismatch_returns_404(stored_artifacts):
+    """Test that requesting the wrong artifact type returns 404."""
+    artifact_id = "test-dataset-id"
+    stored_artifacts[artifact_id] = {
+        "metadata": {"name": "dataset", "id": artifact_id, "type": "dataset"},
+        "data": {},
+        "type": "dataset"
+    }
+
+    event = {
+        "httpMethod": "GET",
+        "pathParameters": {"artifact_type": "model", "id": artifact_id}
+    }
+
+    from lambda_handlers.get_artifact_by_id import handler
+    response = handler(event, None)
+
+    assert response["statusCode"] == 404
+
+
+def test_get_artifact_not_found(stored_artifacts):
+    """Test that a missing artifact returns 404."""
+    event = {
+        "httpMethod": "GET",
+        "pathParameters": {"artifact_type": "code", "id": "missing-id"}
+    }
+
+    from lambda_handlers.get_artifact_by_id import handler
+    response = handler(event, None)
+
+    assert response["statusCode"] == 404
+    body = json.loads(response["body"])
+    assert "does not exist" in body["error"]
@@ -0,0 +1,73 @@
+"""Tests for get_artifact_by_name Lambda handler."""
+
+import json
+import pytest
+
+
+@pytest.fixture
+def name_index(monkeypatch):
+    """Mock the aggregated name index with an in-memory dict."""
+    index = {"artifacts": {}, "name_lc": {}}
+    monkeypatch.setattr(
+        "lambda_handlers.get_artifact_by_name.load_name_index",
+        lambda: index
+    )
+    return index
+
+
+def test_get_by_name_case_insensitive(name_index):
+    """Test that every artifact with a matching name is returned, ignoring case."""
+    name_index["artifacts"]["a1"] = {"name": "BERT", "id": "a1", "type": "model"}
+    name_index["artifacts"]["a2"] = {"name": "bert", "id": "a2", "type": "dataset"}
+    name_index["artifacts"]["a3"] = {"name": "gpt", "id": "a3", "type": "model"}
+    name_index["name_lc"].update({"a1": "bert", "a2": "bert", "a3": "gpt"})
+
+    from lambda_handlers.get_artifact_by_name import handler
+    response = handler({"httpMethod": "GET", "pathParameters": {"name": "Bert"}}, None)
+
+    assert response["statusCode"] == 200
+    body = json.loads(response["body"])
+    assert sorted(item["id"] for item in body) == ["a1", "a2"]
+
+
+def test_get_by_name_without_precomputed_name(name_index):
+    """Test that entries lacking a precomputed lowercase name still match."""
+    name_index["artifacts"]["a1"] = {"name": "BERT", "id": "a1", "type": "model"}
+
+    from lambda_handlers.get_artifact_by_name import handler
+    response = handler({"httpMethod": "GET", "pathParameters": {"name": "bert"}}, None)
+
+    assert response["statusCode"] == 200
+    assert [item["id"] for item in json.loads(response["body"])] == ["a1"]
+
+
+def test_get_by_name_reflects_index_changes(name_index, monkeypatch):
+    """Test that the name lookup is rebuilt when a new index is loaded."""
+    from lambda_handlers.get_artifact_by_name import handler
+    event = {"httpMethod": "GET", "pathParameters": {"name": "bert"}}
+    name_index["artifacts"]["a1"] = {"name": "bert", "id": "a1", "type": "model"}
+    assert handler(event, None)["statusCode"] == 200
+
+    monkeypatch.setattr(
+        "lambda_handlers.get_artifact_by_name.load_name_index",
+        lambda: {"artifacts": {}, "name_lc": {}}
+    )
+    assert handler(event, None)["statusCode"] == 404
+
+
+def test_get_by_name_not_found(name_index):
+    """Test that an unknown name returns 404."""
+    from lambda_handlers.get_artifact_by_name import handler
+    response = handler(
+        {"httpMethod": "GET", "pathParameters": {"name": "missing"}}, None
+    )
+
+    assert response["statusCode"] == 404
+
+
+def test_get_by_name_missing_name(name_index):
+    """Test that a missing path parameter returns 400."""
+    from lambda_handlers.get_artifact_by_name import handler
+    response = handler({"httpMethod": "GET", "pathParameters": {}}, None)
+
+    assert response["statusCode"] == 400
@@ -0,0 +1,96 @@
+"""Tests for health_check Lambda handler."""
+
+import json
+
+import pytest
+
+from lambda_handlers import health_check
+
+
+class FakeS3:
+    """Serve paginated top-level listings of artifacts/."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.list_calls = 0
+
+    def get_paginator(self, name):
+        fake = self
+
+        class Paginator:
+            def paginate(self, **kwargs):
+                assert kwargs["Delimiter"] == "/"
+                fake.list_calls += 1
+                return iter(fake.pages)
+
+        return Paginator()
+
+
+@pytest.fixture
+def fake_s3(monkeypatch):
+    s3 = FakeS3([
+        {"Contents": [{"Key": f"artifacts/{i}.json"} for i in range(1000)]},
+        {
+            "Contents": [{"Key": "artifacts/extra.json"}],
+            "CommonPrefixes": [{"Prefix": "artifacts/extra/"}],
+        },
+    ])
+    monkeypatch.setattr(health_check, "s3_client", s3)
+    monkeypatch.setattr(health_check, "BUCKET_NAME", "test-bucket")
+    monkeypatch.setattr(health_check, "_ARTIFACT_COUNT_CACHE", {"ts": None, "count": 0})
+    return s3
+
+
+def test_health_counts_artifacts_across_pages(fake_s3):
+    """Test that the artifact count is not capped at one listing page."""
+    response = health_check.handler({"httpMethod": "GET"}, None)
+
+    assert response["statusCode"] == 200
+    body = json.loads(response["body"])
+    assert body["status"] == "healthy"
+    assert body["artifacts_count"] == 1001
+
+
+def test_health_reuses_cached_count(fake_s3, monkeypatch):
+    """Test that repeated probes within the TTL do not list the bucket again."""
+    health_check.handler({"httpMethod": "GET"}, None)
+    health_check.handler({"httpMethod": "GET"}, None)
+    assert fake_s3.list_calls == 1
+
+    monkeypatch.setattr(health_check, "ARTIFACT_COUNT_TTL_SECONDS", 0.0)
+    health_check.handler({"httpMethod": "GET"}, None)
+    assert fake_s3.list_calls == 2
+
+
+def test_health_timestamps_are_utc_zulu(fake_s3):
+    """Test that timestamps end in a single Z and span the metrics window."""
+    from datetime import datetime
+
+    body = json.loads(health_check.handler({"httpMethod": "GET"}, None)["body"])
+
+    assert body["window_minutes"] == 60
+    for field in ("timestamp", "window_start", "window_end"):
+        assert body[field].endswith("Z") and "+00:00" not in body[field]
+    start = datetime.fromisoformat(body["window_start"].replace("Z", "+00:00"))
+    end = datetime.fromisoformat(body["window_end"].replace("Z", "+00:00"))
+    assert (end - start).total_seconds() == 3600
+
+
+def test_health_live_returns_up():
+    """Test that the liveness probe returns the static UP body."""
+    from lambda_handlers.health_check_live import handler
+
+    response = handler({"httpMethod": "GET"}, None)
+
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"]) == {"status": "UP"}
+
+
+def test_health_live_preflight():
+    """Test that the liveness probe answers CORS preflights."""
+    from lambda_handlers.health_check_live import handler
+
+    response = handler({"httpMethod": "OPTIONS"}, None)
+
+    assert response["statusCode"] == 200
+    assert "Access-Control-Allow-Origin" in response["headers"]
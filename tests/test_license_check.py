@@ -0,0 +1,105 @@
+"""Tests for license_check Lambda handler."""
+
+import json
+
+import pytest
+
+from lambda_handlers import license_check
+from src.license_compatibility import GitHubAPIError, LicenseNotFoundError
+
+
+def _model(license_name):
+    metadata = {"name": "model", "id": "m1", "type": "model"}
+    if license_name is not None:
+        metadata["license"] = license_name
+    return {"metadata": metadata, "type": "model"}
+
+
+@pytest.fixture
+def artifact(monkeypatch):
+    stored = {"m1": _model("MIT")}
+    monkeypatch.setattr(license_check, "load_artifact_from_s3", stored.get)
+    return stored
+
+
+def _check(github_url="https://github.com/owner/repo"):
+    event = {
+        "httpMethod": "POST",
+        "pathParameters": {"id": "m1"},
+        "body": json.dumps({"github_url": github_url}),
+    }
+    return license_check.handler(event, None)
+
+
+@pytest.mark.parametrize(
+    "github_license, expected", [("mit", True), ("agpl-3.0", False)]
+)
+def test_license_check_verdict(artifact, monkeypatch, github_license, expected):
+    """Test that the compatibility verdict is returned as a JSON boolean."""
+    calls = []
+
+    def fake_fetch(owner, repo):
+        calls.append((owner, repo))
+        return github_license
+
+    monkeypatch.setattr(license_check, "fetch_github_repo_license", fake_fetch)
+
+    response = _check("https://github.com/owner/repo.git")
+
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"]) is expected
+    assert calls == [("owner", "repo")]
+
+
+def test_license_check_artifact_without_license(artifact):
+    """Test that an artifact without a license is reported incompatible."""
+    artifact["m1"] = _model(None)
+
+    response = _check()
+
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"]) is False
+
+
+@pytest.mark.parametrize("error, expected_status", [
+    (LicenseNotFoundError("no license"), 200),
+    (GitHubAPIError("Repository not found: owner/repo"), 404),
+    (GitHubAPIError("GitHub API rate limit exceeded (403)"), 502),
+])
+def test_license_check_github_errors(artifact, monkeypatch, error, expected_status):
+    """Test how GitHub lookup failures map to responses."""
+    def fake_fetch(owner, repo):
+        raise error
+
+    monkeypatch.setattr(license_check, "fetch_github_repo_license", fake_fetch)
+
+    assert _check()["statusCode"] == expected_status
+
+
+@pytest.mark.parametrize("github_url", [
+    None,
+    "",
+    42,
+    "https://gitlab.com/owner/repo",
+    "https://github.com/owner",
+])
+def test_license_check_rejects_bad_github_url(artifact, github_url):
+    """Test that missing or non-GitHub URLs return 400."""
+    assert _check(github_url)["statusCode"] == 400
+
+
+def test_license_check_uses_license_normalized_at_ingest(artifact, monkeypatch):
+    """Test that a license normalized at ingest is used without re-normalizing."""
+    artifact["m1"]["license_normalized"] = "mit"
+
+    def fail_normalize(license_str):
+        raise AssertionError("license normalized at request time")
+
+    monkeypatch.setattr(license_check, "normalize_license_string", fail_normalize)
+    monkeypatch.setattr(
+        license_check, "fetch_github_repo_license", lambda owner, repo: "mit"
+    )
+
+    response = _check()
+
+    assert json.loads(response["body"]) is True
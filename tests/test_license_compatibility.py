@@ -0,0 +1,148 @@
+"""Tests for GitHub license lookups in src.license_compatibility."""
+
+import http.client
+import json
+
+import pytest
+
+from src import license_compatibility
+from src.license_compatibility import (
+    GitHubAPIError,
+    LicenseNotFoundError,
+    fetch_github_license,
+    parse_github_url,
+)
+
+REPO_URL = "https://github.com/owner/repo"
+
+
+class FakeResponse:
+    def __init__(self, status, payload=None, etag=None, reason="OK"):
+        self.status = status
+        self.reason = reason
+        self._body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        self._headers = {"ETag": etag} if etag else {}
+
+    def getheader(self, name, default=None):
+        return self._headers.get(name, default)
+
+    def read(self):
+        return self._body
+
+
+class FakeGitHub:
+    """Stands in for http.client.HTTPSConnection, serving queued responses."""
+
+    def __init__(self):
+        self.responses = []
+        self.requests = []  # (connection number, path, headers)
+        self.connections = 0
+        self.drop_next = False
+
+    def connection_class(self):
+        server = self
+
+        class Connection:
+            def __init__(self, host, timeout=None):
+                server.connections += 1
+                self.number = server.connections
+
+            def request(self, method, path, headers=None):
+                if server.drop_next:
+                    server.drop_next = False
+                    raise http.client.RemoteDisconnected("closed")
+                server.requests.append((self.number, path, dict(headers or {})))
+
+            def getresponse(self):
+                return server.responses.pop(0)
+
+            def close(self):
+                pass
+
+        return Connection
+
+
+@pytest.fixture(autouse=True)
+def github(monkeypatch):
+    server = FakeGitHub()
+    monkeypatch.setattr(
+        license_compatibility.http.client,
+        "HTTPSConnection",
+        server.connection_class(),
+    )
+    monkeypatch.setattr(license_compatibility, "_GITHUB_CONNECTION", {"conn": None})
+    monkeypatch.setattr(license_compatibility, "_GH_LICENSE_CACHE", {})
+    return server
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://github.com/owner/repo", ("owner", "repo")),
+    ("https://github.com/owner/repo.git", ("owner", "repo")),
+    ("https://github.com/owner/repo/tree/main/src", ("owner", "repo")),
+    (" https://github.com/owner/repo ", ("owner", "repo")),
+    ("https://github.com/owner", None),
+    ("https://github.com/owner/", None),
+    ("http://github.com/owner/repo", None),
+    ("https://gitlab.com/owner/repo", None),
+    ("https://github.com.evil.example/owner/repo", None),
+    ("not a url", None),
+])
+def test_parse_github_url(url, expected):
+    """Tests parsing of GitHub repository URLs into (owner, repo)."""
+    assert parse_github_url(url) == expected
+
+
+def test_fetch_github_license_cached_within_ttl(github):
+    """Tests that a fresh cached lookup skips the GitHub request."""
+    github.responses.append(
+        FakeResponse(200, {"license": {"spdx_id": "MIT"}}, etag='"abc"')
+    )
+
+    assert fetch_github_license(REPO_URL) == "mit"
+    assert fetch_github_license(REPO_URL + ".git") == "mit"
+    assert [path for _, path, _ in github.requests] == ["/repos/owner/repo/license"]
+
+
+def test_fetch_github_license_revalidates_with_etag(github, monkeypatch):
+    """Tests that a stale entry sends If-None-Match and reuses it on 304."""
+    github.responses.append(
+        FakeResponse(200, {"license": {"spdx_id": "Apache-2.0"}}, etag='"abc"')
+    )
+    assert fetch_github_license(REPO_URL) == "apache-2.0"
+
+    monkeypatch.setattr(license_compatibility, "GITHUB_LICENSE_CACHE_TTL_SECONDS", 0)
+    github.responses.append(FakeResponse(304, reason="Not Modified"))
+
+    assert fetch_github_license(REPO_URL) == "apache-2.0"
+    assert github.requests[-1][2]["If-None-Match"] == '"abc"'
+
+
+def test_fetch_github_license_reuses_connection(github):
+    """Tests that lookups share one connection and survive it being closed."""
+    for spdx in ("MIT", "ISC", "Unlicense"):
+        github.responses.append(FakeResponse(200, {"license": {"spdx_id": spdx}}))
+
+    fetch_github_license("https://github.com/owner/a")
+    fetch_github_license("https://github.com/owner/b")
+    github.drop_next = True
+    assert fetch_github_license("https://github.com/owner/c") == "unlicense"
+
+    assert [number for number, _, _ in github.requests] == [1, 1, 2]
+
+
+def test_fetch_github_license_errors_not_cached(github):
+    """Tests that failed lookups are retried rather than cached."""
+    github.responses.extend([FakeResponse(404, reason="Not Found")] * 2)
+
+    for _ in range(2):
+        with pytest.raises(GitHubAPIError, match="Repository not found"):
+            fetch_github_license(REPO_URL)
+    assert len(github.requests) == 2
+
+
+def test_fetch_github_license_without_license(github):
+    """Tests that a repo without a recognised license raises LicenseNotFoundError."""
+    github.responses.append(FakeResponse(200, {"license": {"spdx_id": "NOASSERTION"}}))
+
+    with pytest.raises(LicenseNotFoundError):
+        fetch_github_license(REPO_URL)
@@ -0,0 +1,257 @@
+"""Tests for list_artifacts and list_artifacts_detailed Lambda handlers."""
+
+import json
+
+import pytest
+
+from lambda_handlers import list_artifacts, list_artifacts_detailed, utils
+
+
+def _artifact(artifact_id, name, artifact_type="model", net_score=0.5):
+    return {
+        "url": f"https://example.com/{name}",
+        "metadata": {"name": name, "id": artifact_id, "type": artifact_type},
+        "rating": {"net_score": net_score},
+    }
+
+
+ARTIFACTS = {
+    "1": _artifact("1", "bert"),
+    "2": _artifact("2", "BERT", "dataset"),
+    "3": _artifact("3", "gpt2"),
+    "4": _artifact("4", "whisper", "code"),
+    "5": {"metadata": {"name": "no-id"}},
+    "6": {"url": "https://example.com/no-metadata"},
+}
+
+
+def _name_index():
+    # Built the way save_artifact_to_s3 writes it, id-less entries included
+    index = utils._empty_name_index()
+    for artifact_id, artifact in ARTIFACTS.items():
+        utils._set_name_index_entry(index, artifact_id, artifact.get("metadata", {}))
+    return index
+
+
+@pytest.fixture
+def stored(monkeypatch):
+    index = _name_index()
+    fetched = []
+
+    def load_artifacts(artifact_ids):
+        fetched.append(list(artifact_ids))
+        return {artifact_id: ARTIFACTS[artifact_id] for artifact_id in artifact_ids}
+
+    for module in (list_artifacts, list_artifacts_detailed):
+        monkeypatch.setattr(module, "load_name_index", lambda: index)
+    monkeypatch.setattr(utils, "_NAME_LOOKUP_CACHE", {"source": None, "by_name": {}})
+    monkeypatch.setattr(
+        list_artifacts_detailed, "load_artifacts_from_s3", load_artifacts
+    )
+    return fetched
+
+
+def test_group_queries_merges_by_name():
+    """Test that queries sharing a name are looked up once with merged types."""
+    grouped = utils.group_artifact_queries([
+        {"name": "BERT", "types": ["model"]},
+        {"name": "bert", "types": ["dataset"]},
+        {"name": "*", "types": ["code"]},
+        {"name": "gpt2", "types": ["model"]},
+        {"name": "GPT2"},
+        {"name": "gpt2", "types": ["code"]},
+    ])
+
+    assert grouped == {"bert": {"model", "dataset"}, "*": {"code"}, "gpt2": None}
+
+
+def _post(module, queries, offset=None):
+    event = {"httpMethod": "POST", "body": json.dumps(queries)}
+    if offset is not None:
+        event["queryStringParameters"] = {"offset": str(offset)}
+    return module.handler(event, None)
+
+
+@pytest.mark.parametrize("queries, expected_ids", [
+    ([{"name": "bert"}], ["1", "2"]),
+    ([{"name": "Bert", "types": ["dataset"]}], ["2"]),
+    ([{"name": "*"}], ["1", "2", "3", "4"]),
+    ([{"name": "*", "types": ["code", "model"]}], ["1", "3", "4"]),
+    ([{"name": "gpt2"}, {"name": "bert", "types": ["model"]}], ["1", "3"]),
+    ([{"name": "bert", "types": ["dataset"]}, {"name": "*"}], ["1", "2", "3", "4"]),
+    ([{"name": "bert"}, {"name": "BERT", "types": ["model"]}], ["1", "2"]),
+    (
+        [{"name": "*", "types": ["model"]}, {"name": "*", "types": ["code"]}],
+        ["1", "3", "4"],
+    ),
+    ([{"name": "missing"}], []),
+])
+def test_list_artifacts_matches(stored, queries, expected_ids):
+    """Test name (case-insensitive), wildcard and type filtering."""
+    response = _post(list_artifacts, queries)
+
+    assert response["statusCode"] == 200
+    assert sorted(item["id"] for item in json.loads(response["body"])) == expected_ids
+
+
+@pytest.mark.parametrize("queries, expected_ids", [
+    ([{"name": "*"}], ["1", "2", "3", "4"]),
+    ([{"name": "no-id"}], []),
+    ([{"name": "no-id"}, {"name": "gpt2"}], ["3"]),
+])
+def test_list_artifacts_skips_artifacts_without_id(stored, queries, expected_ids):
+    """Test that index entries stored without metadata or an id are not listed."""
+    body = json.loads(_post(list_artifacts, queries)["body"])
+
+    assert [item["id"] for item in body] == expected_ids
+
+
+def test_list_artifacts_sorted_and_deduplicated(stored):
+    """Test that overlapping queries return each artifact once, by name then id."""
+    body = json.loads(_post(list_artifacts, [{"name": "*"}, {"name": "bert"}])["body"])
+
+    assert [item["id"] for item in body] == ["1", "2", "3", "4"]
+
+
+def test_list_artifacts_paginates(stored, monkeypatch):
+    """Test that the offset header points at the next page."""
+    monkeypatch.setattr(list_artifacts, "PAGE_SIZE", 3)
+
+    first = _post(list_artifacts, [{"name": "*"}])
+    assert len(json.loads(first["body"])) == 3
+    assert first["headers"]["offset"] == "3"
+
+    second = _post(list_artifacts, [{"name": "*"}], offset=3)
+    assert len(json.loads(second["body"])) == 1
+    assert "offset" not in second["headers"]
+
+
+def test_list_artifacts_too_many_results(stored, monkeypatch):
+    """Test that exceeding MAX_RESULTS returns 413."""
+    monkeypatch.setattr(list_artifacts, "MAX_RESULTS", 2)
+
+    response = _post(list_artifacts, [{"name": "*"}])
+
+    assert response["statusCode"] == 413
+    assert json.loads(response["body"]) == {"error": "Too many artifacts returned."}
+
+
+@pytest.mark.parametrize("body", [
+    "not json",
+    "[]",
+    json.dumps({"name": "bert"}),
+    json.dumps([{"name": ""}]),
+    json.dumps([{"name": "bert", "types": "model"}]),
+    json.dumps([{"name": "bert", "types": [""]}]),
+])
+def test_list_artifacts_rejects_bad_queries(stored, body):
+    """Test that malformed query payloads return 400."""
+    response = list_artifacts.handler({"httpMethod": "POST", "body": body}, None)
+
+    assert response["statusCode"] == 400
+
+
+@pytest.mark.parametrize("module", [list_artifacts, list_artifacts_detailed])
+def test_list_artifacts_rejects_oversized_body(stored, monkeypatch, module):
+    """Test that bodies over MAX_BODY_BYTES return 413 without being parsed."""
+    monkeypatch.setattr(module, "MAX_BODY_BYTES", 16)
+
+    def fail_loads(raw):
+        raise AssertionError("oversized body parsed")
+
+    monkeypatch.setattr(module, "json_loads", fail_loads)
+
+    response = _post(module, [{"name": "*"}, {"name": "bert"}])
+
+    assert response["statusCode"] == 413
+
+
+def test_list_artifacts_rejects_too_many_queries(stored, monkeypatch):
+    """Test that more than MAX_QUERIES queries returns 400."""
+    monkeypatch.setattr(list_artifacts, "MAX_QUERIES", 2)
+
+    assert _post(list_artifacts, [{"name": "bert"}] * 2)["statusCode"] == 200
+    assert _post(list_artifacts, [{"name": "bert"}] * 3)["statusCode"] == 400
+
+
+def test_list_artifacts_rejects_bad_offset(stored):
+    """Test that a negative offset returns 400."""
+    assert _post(list_artifacts, [{"name": "*"}], offset=-1)["statusCode"] == 400
+
+
+def test_list_artifacts_detailed_fetches_only_page(stored, monkeypatch):
+    """Test that only the artifacts on the requested page are read from S3."""
+    monkeypatch.setattr(list_artifacts_detailed, "PAGE_SIZE", 2)
+
+    first = _post(list_artifacts_detailed, [{"name": "*"}])
+    second = _post(list_artifacts_detailed, [{"name": "*"}], offset=2)
+
+    assert [item["metadata"]["id"] for item in json.loads(first["body"])] == ["1", "2"]
+    assert first["headers"]["offset"] == "2"
+    assert [item["metadata"]["id"] for item in json.loads(second["body"])] == ["3", "4"]
+    assert stored == [["1", "2"], ["3", "4"]]
+
+
+def test_list_artifacts_detailed_skips_deleted_artifacts(stored, monkeypatch):
+    """Test that page entries deleted since the index read are left out."""
+    monkeypatch.setattr(utils, "_NAME_LOOKUP_CACHE", {"source": None, "by_name": {}})
+    monkeypatch.setattr(
+        list_artifacts_detailed,
+        "load_artifacts_from_s3",
+        lambda ids: {"3": ARTIFACTS["3"]},
+    )
+
+    body = json.loads(_post(list_artifacts_detailed, [{"name": "*"}])["body"])
+
+    assert [item["metadata"]["id"] for item in body] == ["3"]
+
+
+@pytest.mark.parametrize("queries, expected_ids", [
+    (
+        [{"name": "bert", "types": ["dataset"]}, {"name": "*", "types": ["code"]}],
+        ["2", "4"],
+    ),
+    ([{"name": "BERT"}, {"name": "gpt2", "types": ["dataset"]}], ["1", "2"]),
+])
+def test_list_artifacts_detailed_matches(stored, queries, expected_ids):
+    """Test combined named and wildcard queries in the streaming detailed scan."""
+    body = json.loads(_post(list_artifacts_detailed, queries)["body"])
+
+    assert sorted(item["metadata"]["id"] for item in body) == expected_ids
+
+
+def test_list_artifacts_detailed_includes_scores(stored):
+    """Test that the detailed listing wraps metadata with url and net_score."""
+    body = json.loads(_post(list_artifacts_detailed, [{"name": "gpt2"}])["body"])
+
+    assert body == [{
+        "metadata": {"name": "gpt2", "id": "3", "type": "model"},
+        "data": {"url": "https://example.com/gpt2", "net_score": 0.5},
+    }]
+
+
+def test_list_artifacts_detailed_skips_artifacts_without_metadata(stored):
+    """Test that artifacts stored with empty metadata are left out, not a 500."""
+    response = _post(list_artifacts_detailed, [{"name": "*"}])
+
+    assert response["statusCode"] == 200
+    body = json.loads(response["body"])
+    assert [item["metadata"]["id"] for item in body] == ["1", "2", "3", "4"]
+
+
+def test_list_artifacts_detailed_serializes_missing_stored_metadata(
+    stored, monkeypatch
+):
+    """Test that an indexed artifact stored without metadata still serializes."""
+    monkeypatch.setattr(
+        list_artifacts_detailed,
+        "load_artifacts_from_s3",
+        lambda ids: {"3": {"url": "https://example.com/gpt2", "metadata": {}}},
+    )
+
+    response = _post(list_artifacts_detailed, [{"name": "gpt2"}])
+
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"]) == [
+        {"metadata": {}, "data": {"url": "https://example.com/gpt2", "net_score": None}}
+    ]
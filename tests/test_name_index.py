@@ -0,0 +1,410 @@
+"""Tests for the aggregated S3 name index in lambda_handlers.utils."""
+
+import io
+import json
+
+import pytest
+from botocore.exceptions import ClientError
+
+import lambda_handlers.utils as utils
+
+
+class FakeS3:
+    """In-memory S3 supporting the conditional reads/writes the index relies on."""
+
+    def __init__(self):
+        self.objects = {}  # key -> (bytes, etag)
+        self.gets = []
+        self.max_page_size = 1000  # listing pages never exceed this, like S3
+        self._version = 0
+
+    def _etag(self):
+        self._version += 1
+        return f'"v{self._version}"'
+
+    def get_object(self, Bucket, Key, **kwargs):
+        self.gets.append(Key)
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        body, etag = self.objects[Key]
+        if kwargs.get("IfNoneMatch") == etag:
+            raise ClientError({"Error": {"Code": "304"}}, "GetObject")
+        return {"Body": io.BytesIO(body), "ETag": etag, "ContentLength": len(body)}
+
+    def put_object(
+        self, Bucket, Key, Body, ContentType, IfMatch=None, IfNoneMatch=None
+    ):
+        current = self.objects.get(Key)
+        if IfNoneMatch == "*" and current is not None:
+            raise ClientError({"Error": {"Code": "PreconditionFailed"}}, "PutObject")
+        if IfMatch is not None and (current is None or current[1] != IfMatch):
+            raise ClientError({"Error": {"Code": "PreconditionFailed"}}, "PutObject")
+        data = Body.encode("utf-8") if isinstance(Body, str) else Body
+        self.objects[Key] = (data, self._etag())
+
+    def delete_object(self, Bucket, Key):
+        self.objects.pop(Key, None)
+
+    def delete_objects(self, Bucket, Delete):
+        for obj in Delete["Objects"]:
+            self.objects.pop(obj["Key"], None)
+        return {}
+
+    def get_paginator(self, name):
+        fake = self
+
+        class Paginator:
+            def paginate(
+                self, Bucket, Prefix="", Delimiter=None, PaginationConfig=None
+            ):
+                keys = sorted(k for k in fake.objects if k.startswith(Prefix))
+                if Delimiter:
+                    keys = [k for k in keys if Delimiter not in k[len(Prefix):]]
+                page_size = min(
+                    (PaginationConfig or {}).get("PageSize", 1000),
+                    fake.max_page_size,
+                )
+                for start in range(0, max(len(keys), 1), page_size):
+                    page = keys[start:start + page_size]
+                    yield {
+                        "Contents": [
+                            {"Key": k, "ETag": fake.objects[k][1]} for k in page
+                        ]
+                    }
+
+        return Paginator()
+
+
+@pytest.fixture
+def fake_s3(monkeypatch, tmp_path):
+    s3 = FakeS3()
+    monkeypatch.setattr(
+        utils, "NAME_INDEX_LOCAL_PATH", str(tmp_path / "name_index.json")
+    )
+    monkeypatch.setattr(utils, "s3_client", s3)
+    monkeypatch.setattr(utils, "BUCKET_NAME", "test-bucket")
+    monkeypatch.setattr(utils, "_NAME_INDEX_CACHE", {"etag": None, "index": None})
+    monkeypatch.setattr(utils, "_ARTIFACT_OBJECT_CACHE", {})
+    return s3
+
+
+def _artifact(artifact_id, name, artifact_type="model"):
+    return {
+        "url": f"https://huggingface.co/org/{name}",
+        "metadata": {"name": name, "id": artifact_id, "type": artifact_type},
+        "data": {"url": f"https://huggingface.co/org/{name}"},
+        "type": artifact_type,
+    }
+
+
+def _index_document(fake_s3):
+    body, _ = fake_s3.objects[utils.NAME_INDEX_KEY]
+    return json.loads(body)
+
+
+def _index_entries(fake_s3):
+    return _index_document(fake_s3)["artifacts"]
+
+
+def test_save_maintains_index(fake_s3):
+    """Test that saving artifacts upserts their metadata into the index."""
+    utils.save_artifact_to_s3("a1", _artifact("a1", "bert"))
+    utils.save_artifact_to_s3("a2", _artifact("a2", "gpt"))
+    utils.save_artifact_to_s3("a1", _artifact("a1", "bert-renamed"))
+
+    assert _index_entries(fake_s3) == {
+        "a1": {"name": "bert-renamed", "id": "a1", "type": "model"},
+        "a2": {"name": "gpt", "id": "a2", "type": "model"},
+    }
+
+
+def test_index_stores_lowercase_names(fake_s3):
+    """Test that lowercased names are precomputed at write time, outside metadata."""
+    utils.save_artifact_to_s3("a1", _artifact("a1", "BERT-Base"))
+
+    document = _index_document(fake_s3)
+    assert document["name_lc"] == {"a1": "bert-base"}
+    assert "name_lc" not in document["artifacts"]["a1"]
+
+
+def test_load_name_index_reads_single_object(fake_s3):
+    """Test that a warm index is served without fetching artifacts."""
+    utils.save_artifact_to_s3("a1", _artifact("a1", "bert"))
+    fake_s3.gets.clear()
+
+    index = utils.load_name_index()
+
+    assert index["artifacts"] == {"a1": {"name": "bert", "id": "a1", "type": "model"}}
+    assert fake_s3.gets == [utils.NAME_INDEX_KEY]
+
+
+def test_load_name_index_reuses_unchanged_index(fake_s3):
+    """Test that warm calls revalidate by ETag and reuse the cached index."""
+    utils.save_artifact_to_s3("a1", _artifact("a1", "bert"))
+
+    first = utils.load_name_index()
+    second = utils.load_name_index()
+
+    assert second is first
+
+    utils.save_artifact_to_s3("a2", _artifact("a2", "gpt"))
+    third = utils.load_name_index()
+
+    assert third is not first
+    assert sorted(third["artifacts"]) == ["a1", "a2"]
+
+
+def test_load_name_index_reuses_local_copy_after_reinit(fake_s3, monkeypatch):
+    """Test that a fresh init revalidates the /tmp copy instead of re-downloading."""
+    utils.save_artifact_to_s3("a1", _artifact("a1", "bert"))
+    first = utils.load_name_index()
+
+    # Module state is lost on re-init; /tmp survives
+    monkeypatch.setattr(utils, "_NAME_INDEX_CACHE", {"etag": None, "index": None})
+    real_get = fake_s3.get_object
+    responses = []
+
+    def recording_get(**kwargs):
+        try:
+            response = real_get(**kwargs)
+        except Exception as e:
+            responses.append(e.response["Error"]["Code"])
+            raise
+        responses.append("200")
+        return response
+
+    monkeypatch.setattr(fake_s3, "get_object", recording_get)
+
+    assert utils.load_name_index() == first
+    assert responses == ["304"]
+
+
+def test_load_name_index_ignores_corrupt_local_copy(fake_s3):
+    """Test that an unreadable /tmp copy falls back to a normal read."""
+    utils.save_artifact_to_s3("a1", _artifact("a1", "bert"))
+    with open(utils.NAME_INDEX_LOCAL_PATH, "w") as f:
+        f.write("{truncated")
+
+    assert sorted(utils.load_name_index()["artifacts"]) == ["a1"]
+
+
+def test_load_name_index_rebuilds_missing_index(fake_s3):
+    """Test that a missing index is rebuilt from the artifacts and persisted."""
+    fake_s3.objects["artifacts/a1.json"] = (
+        json.dumps(_artifact("a1", "bert")).encode(),
+        '"x"',
+    )
+
+    index = utils.load_name_index()
+
+    assert index["artifacts"] == {"a1": {"name": "bert", "id": "a1", "type": "model"}}
+    assert index["name_lc"] == {"a1": "bert"}
+    assert _index_document(fake_s3) == index
+
+
+def test_iter_all_artifacts_skips_nested_files(fake_s3):
+    """Test that artifact listings stream records and ignore per-artifact files."""
+    fake_s3.objects["artifacts/a1.json"] = (
+        json.dumps(_artifact("a1", "bert")).encode(),
+        '"x"',
+    )
+    fake_s3.objects["artifacts/a1/data.zip"] = (b"zip", '"y"')
+    fake_s3.objects["artifacts/a1/config.json"] = (b"{}", '"z"')
+
+    artifacts = utils.iter_all_artifacts_from_s3()
+
+    assert next(artifacts) == ("a1", _artifact("a1", "bert"))
+    assert list(artifacts) == []
+    assert utils.list_all_artifacts_from_s3() == {"a1": _artifact("a1", "bert")}
+
+
+def test_listing_refetches_only_changed_artifacts(fake_s3):
+    """Test that warm listings reuse cached documents until their ETag changes."""
+    for artifact_id in ("a1", "a2"):
+        fake_s3.objects[f"artifacts/{artifact_id}.json"] = (
+            json.dumps(_artifact(artifact_id, artifact_id)).encode(), f'"{artifact_id}"'
+        )
+
+    assert sorted(utils.list_all_artifacts_from_s3()) == ["a1", "a2"]
+    fake_s3.gets.clear()
+    assert sorted(utils.list_all_artifacts_from_s3()) == ["a1", "a2"]
+    assert fake_s3.gets == []
+
+    fake_s3.objects["artifacts/a2.json"] = (
+        json.dumps(_artifact("a2", "renamed")).encode(),
+        '"a2-v2"',
+    )
+    del fake_s3.objects["artifacts/a1.json"]
+    listed = utils.list_all_artifacts_from_s3()
+
+    assert fake_s3.gets == ["artifacts/a2.json"]
+    assert listed == {"a2": _artifact("a2", "renamed")}
+    assert list(utils._ARTIFACT_OBJECT_CACHE) == ["artifacts/a2.json"]
+
+
+def test_remove_from_index(fake_s3):
+    """Test that deleted artifacts are dropped from the index."""
+    utils.save_artifact_to_s3("a1", _artifact("a1", "bert"))
+    utils.save_artifact_to_s3("a2", _artifact("a2", "gpt"))
+
+    utils.remove_artifact_from_name_index("a1")
+
+    assert list(_index_entries(fake_s3)) == ["a2"]
+    assert list(_index_document(fake_s3)["name_lc"]) == ["a2"]
+
+
+def test_update_retries_on_conflict(fake_s3, monkeypatch):
+    """Test that a concurrent writer's entry survives an optimistic-lock conflict."""
+    utils.save_artifact_to_s3("a1", _artifact("a1", "bert"))
+    real_read = utils._read_name_index
+    raced = []
+
+    def racing_read():
+        entries, etag = real_read()
+        if not raced:
+            # Another container updates the index between our read and write
+            raced.append(True)
+            other = {
+                "artifacts": dict(
+                    entries["artifacts"],
+                    a2={"name": "gpt", "id": "a2", "type": "model"},
+                ),
+                "name_lc": dict(entries["name_lc"], a2="gpt"),
+            }
+            fake_s3.put_object(
+                Bucket="test-bucket",
+                Key=utils.NAME_INDEX_KEY,
+                Body=json.dumps(other),
+                ContentType="application/json",
+            )
+        return entries, etag
+
+    monkeypatch.setattr(utils, "_read_name_index", racing_read)
+    utils.save_artifact_to_s3("a3", _artifact("a3", "t5"))
+
+    assert sorted(_index_entries(fake_s3)) == ["a1", "a2", "a3"]
+
+
+def test_reset_clears_index(fake_s3):
+    """Test that resetting the registry removes the index object too."""
+    utils.save_artifact_to_s3("a1", _artifact("a1", "bert"))
+
+    utils.delete_all_artifacts_from_s3()
+
+    assert utils.NAME_INDEX_KEY not in fake_s3.objects
+    assert utils.load_name_index() == {"artifacts": {}, "name_lc": {}}
+
+
+def test_reset_drops_index_rebuilt_mid_reset(fake_s3, monkeypatch):
+    """Test that an index rebuilt by a reader mid-reset does not survive it."""
+    for artifact_id in ("a1", "a2"):
+        utils.save_artifact_to_s3(artifact_id, _artifact(artifact_id, artifact_id))
+    delete_key_batch = utils._delete_key_batch
+
+    def delete_after_concurrent_read(keys):
+        # A reader arrives after the index is gone but before any artifact is
+        rebuilt = utils.load_name_index()
+        assert sorted(rebuilt["artifacts"]) == ["a1", "a2"]
+        assert utils.NAME_INDEX_KEY in fake_s3.objects
+        return delete_key_batch(keys)
+
+    monkeypatch.setattr(utils, "_delete_key_batch", delete_after_concurrent_read)
+
+    assert utils.delete_all_artifacts_from_s3() == 2
+    assert utils.NAME_INDEX_KEY not in fake_s3.objects
+    assert utils.load_name_index() == {"artifacts": {}, "name_lc": {}}
+
+
+def test_reset_deletes_in_page_batches_and_counts_failures(fake_s3, monkeypatch):
+    """Test that reset issues one delete_objects per listing page.
+
+    Keys reported as failed are left out of the deleted count.
+    """
+    for artifact_id in ("a1", "a2", "a3"):
+        utils.save_artifact_to_s3(artifact_id, _artifact(artifact_id, artifact_id))
+    batches = []
+    delete_objects = fake_s3.delete_objects
+
+    def recording_delete_objects(Bucket, Delete):
+        keys = [obj["Key"] for obj in Delete["Objects"]]
+        batches.append(keys)
+        kept = [obj for obj in Delete["Objects"] if obj["Key"] != "artifacts/a2.json"]
+        delete_objects(Bucket, {"Objects": kept})
+        if "artifacts/a2.json" in keys:
+            return {"Errors": [{"Key": "artifacts/a2.json", "Code": "AccessDenied"}]}
+        return {}
+
+    monkeypatch.setattr(fake_s3, "delete_objects", recording_delete_objects)
+    fake_s3.max_page_size = 2
+
+    assert utils.delete_all_artifacts_from_s3() == 2
+    assert sorted(batches) == [
+        ["artifacts/a1.json", "artifacts/a2.json"],
+        ["artifacts/a3.json"],
+    ]
+    assert list(fake_s3.objects) == ["artifacts/a2.json"]
+
+
+def test_load_artifacts_from_s3_fetches_requested_ids(fake_s3):
+    """Test that only the requested artifacts are read and missing ones are skipped."""
+    for artifact_id, name in (("a1", "bert"), ("a2", "gpt2"), ("a3", "t5")):
+        utils.save_artifact_to_s3(artifact_id, _artifact(artifact_id, name))
+    fake_s3.gets.clear()
+
+    loaded = utils.load_artifacts_from_s3(["a3", "missing", "a1"])
+
+    assert loaded == {"a3": _artifact("a3", "t5"), "a1": _artifact("a1", "bert")}
+    assert sorted(fake_s3.gets) == [
+        "artifacts/a1.json",
+        "artifacts/a3.json",
+        "artifacts/missing.json",
+    ]
+    assert utils.load_artifacts_from_s3([]) == {}
+
+
+def test_fetch_pool_reused_across_calls(fake_s3, monkeypatch):
+    """Test that artifact fetches share one worker pool for the container's lifetime."""
+    monkeypatch.setattr(utils, "_S3_FETCH_EXECUTOR", {"executor": None})
+    utils.save_artifact_to_s3("a1", _artifact("a1", "bert"))
+
+    utils.load_artifacts_from_s3(["a1"])
+    executor = utils._S3_FETCH_EXECUTOR["executor"]
+    assert dict(utils.iter_all_artifacts_from_s3()) == {"a1": _artifact("a1", "bert")}
+
+    assert executor is not None
+    assert utils._s3_fetch_executor() is executor
+
+
+def test_name_index_ids_by_name_memoized_per_index(monkeypatch):
+    """Test that ids are grouped by lowercased name and rebuilt only for a new index."""
+    monkeypatch.setattr(utils, "_NAME_LOOKUP_CACHE", {"source": None, "by_name": {}})
+    index = {
+        "artifacts": {
+            "a1": {"name": "BERT"},
+            "a2": {"name": "bert"},
+            "a3": {"name": "T5"},
+        },
+        "name_lc": {"a1": "bert", "a2": "bert"},  # a3 predates "name_lc"
+    }
+
+    by_name = utils.name_index_ids_by_name(index)
+
+    assert by_name == {"bert": ["a1", "a2"], "t5": ["a3"]}
+    assert utils.name_index_ids_by_name(index) is by_name
+    assert utils.name_index_ids_by_name(utils._empty_name_index()) == {}
+
+
+def test_load_artifact_with_etag_revalidates(fake_s3):
+    """Test conditional artifact reads: unchanged, changed and deleted objects."""
+    utils.save_artifact_to_s3("a1", {"metadata": {"id": "a1", "name": "alpha"}})
+
+    data, etag = utils.load_artifact_with_etag("a1")
+    assert data["metadata"]["name"] == "alpha"
+    assert utils.load_artifact_with_etag("a1", etag) == (None, etag)
+
+    utils.save_artifact_to_s3("a1", {"metadata": {"id": "a1", "name": "beta"}})
+    data, new_etag = utils.load_artifact_with_etag("a1", etag)
+    assert data["metadata"]["name"] == "beta" and new_etag != etag
+
+    fake_s3.delete_object(Bucket="test-bucket", Key="artifacts/a1.json")
+    assert utils.load_artifact_with_etag("a1", new_etag) == (None, None)
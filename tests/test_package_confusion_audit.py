@@ -0,0 +1,163 @@
+"""Tests for package_confusion_audit Lambda handler."""
+
+import json
+
+import pytest
+
+from lambda_handlers import package_confusion_audit as audit
+
+
+def _artifact(artifact_id, name, artifact_type="code", metrics=None):
+    return {
+        "metadata": {"id": artifact_id, "name": name, "type": artifact_type},
+        "metrics": metrics or {},
+    }
+
+
+@pytest.fixture
+def stored(monkeypatch):
+    artifacts = {}
+    monkeypatch.setattr(audit, "list_all_artifacts_from_s3", lambda: artifacts)
+    monkeypatch.setattr(audit, "TOP_PACKAGE_NAMES", ("requests", "numpy"))
+    monkeypatch.setattr(audit, "_AUDIT_ROWS", {})
+    return artifacts
+
+
+@pytest.mark.parametrize("a, b, expected", [
+    ("", "", 0),
+    ("", "abc", 3),
+    ("requests", "requests", 0),
+    ("requests", "reqeusts", 2),
+    ("numpy", "numpyy", 1),
+    ("kitten", "sitting", 3),
+    ("pandas", "pandas-dev", 4),
+    ("xtorch", "torch", 1),
+    ("flask", "flaks", 2),
+])
+@pytest.mark.parametrize("use_rapidfuzz", [True, False])
+def test_levenshtein(monkeypatch, a, b, expected, use_rapidfuzz):
+    """Test edit distances with and without the rapidfuzz fast path."""
+    if not use_rapidfuzz:
+        monkeypatch.setattr(audit, "_rf_levenshtein", None)
+    elif audit._rf_levenshtein is None:
+        pytest.skip("rapidfuzz not installed")
+
+    assert audit._levenshtein(a, b) == expected
+    assert audit._levenshtein(b, a) == expected
+
+
+def test_audit_flags_typosquat(stored):
+    """Test that a spiking near-copy of a top package name is reported."""
+    spiking = {"downloads_timeseries_30d": [0] * 29 + [50]}
+    stored["1"] = _artifact("1", "requestss", metrics=spiking)
+    stored["2"] = _artifact("2", "totally-unrelated", metrics=spiking)
+    stored["3"] = _artifact("3", "numpyy", artifact_type="model", metrics=spiking)
+
+    response = audit.handler({"httpMethod": "GET"}, None)
+
+    assert response["statusCode"] == 200
+    body = json.loads(response["body"])
+    assert [entry["id"] for entry in body] == ["1"]
+    assert body[0]["score"] == 1.0
+    assert body[0]["metrics"]["similarity_to_top"] == 0.889
+
+
+def test_best_similarity_skips_names_that_cannot_win(monkeypatch):
+    """Test that the length bound prunes Levenshtein calls, not the result."""
+    monkeypatch.setattr(
+        audit, "TOP_PACKAGE_NAMES", ("requests", "np", "tensorflow-datasets", "Numpy")
+    )
+    calls = []
+    levenshtein = audit._levenshtein
+
+    def counting_levenshtein(a, b):
+        calls.append(b)
+        return levenshtein(a, b)
+
+    monkeypatch.setattr(audit, "_levenshtein", counting_levenshtein)
+    audit._similarity_to_names.cache_clear()
+
+    assert audit._best_similarity_to_top("numpyy") == pytest.approx(5 / 6)
+    assert calls == ["numpy"]
+    assert audit._best_similarity_to_top("flask") == max(
+        audit._normalized_similarity("flask", base) for base in audit.TOP_PACKAGE_NAMES
+    )
+
+
+@pytest.mark.parametrize("ts, expected", [
+    ([], 0.0),
+    ([7], 7 / 8),
+    ([0] * 29 + [50], 50.0),
+    ([4, 1, 3, 2], 4 / 3.5),
+    ([5, 1, 9], 9 / 6),
+])
+def test_spike_factor(ts, expected):
+    """Test max / (median + 1) for odd, even and empty series."""
+    assert audit._spike_factor(ts) == pytest.approx(expected)
+
+
+def test_best_similarity_cached_per_name_and_top_names(monkeypatch):
+    """Test that repeat names are served from the cache until the top names change."""
+    audit._similarity_to_names.cache_clear()
+    monkeypatch.setattr(audit, "TOP_PACKAGE_NAMES", ("requests",))
+
+    assert audit._best_similarity_to_top("Requestss") == (
+        audit._best_similarity_to_top(" requestss ")
+    )
+    assert audit._similarity_to_names.cache_info().hits == 1
+
+    monkeypatch.setattr(audit, "TOP_PACKAGE_NAMES", ("requestss",))
+    assert audit._best_similarity_to_top("requestss") == 1.0
+
+
+def test_audit_rescores_only_changed_artifacts(stored, monkeypatch):
+    """Test that warm calls reuse rows until the listed artifact object changes."""
+    spiking = {"downloads_timeseries_30d": [0] * 29 + [50]}
+    stored["1"] = _artifact("1", "requestss", metrics=spiking)
+    stored["2"] = _artifact("2", "numpyy")
+    scored = []
+    audit_row = audit._audit_row
+
+    def counting_audit_row(art):
+        scored.append(art["metadata"]["id"])
+        return audit_row(art)
+
+    monkeypatch.setattr(audit, "_audit_row", counting_audit_row)
+
+    audit.handler({"httpMethod": "GET"}, None)
+    response = audit.handler(
+        {"httpMethod": "GET", "queryStringParameters": {"threshold": "0.5"}}, None
+    )
+    assert scored == ["1", "2"]
+    assert [entry["id"] for entry in json.loads(response["body"])] == ["1", "2"]
+
+    stored["2"] = _artifact("2", "unrelated-name")
+    del stored["1"]
+    response = audit.handler(
+        {"httpMethod": "GET", "queryStringParameters": {"threshold": "0.5"}}, None
+    )
+
+    assert scored == ["1", "2", "2"]
+    assert json.loads(response["body"]) == []
+    assert list(audit._AUDIT_ROWS) == ["2"]
+
+
+def test_audit_limit_keeps_highest_scores_in_order(stored):
+    """Test that limit returns the top rows by score, ties in listing order."""
+    spiking = {"downloads_timeseries_30d": [0] * 29 + [50]}
+    stored["1"] = _artifact("1", "numpyy")
+    stored["2"] = _artifact("2", "requestss", metrics=spiking)
+    stored["3"] = _artifact("3", "numpy2")
+    stored["4"] = _artifact("4", "numpy3")
+
+    event = {
+        "httpMethod": "GET",
+        "queryStringParameters": {"threshold": "0.5", "limit": "3"},
+    }
+    body = json.loads(audit.handler(event, None)["body"])
+
+    assert [(entry["id"], entry["score"]) for entry in body] == [
+        ("2", 1.0),
+        ("1", 0.55),
+        ("3", 0.55),
+    ]
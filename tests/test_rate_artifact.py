@@ -0,0 +1,151 @@
+"""Tests for rate_artifact Lambda handler."""
+
+import json
+
+import pytest
+
+from lambda_handlers import rate_artifact
+
+
+@pytest.fixture
+def stored(monkeypatch, tmp_path):
+    artifacts = {}
+    loaded = []
+
+    def load(artifact_id, if_none_match=None):
+        # ETag stands in for the object's content
+        loaded.append((artifact_id, if_none_match))
+        artifact = artifacts.get(artifact_id)
+        if artifact is None:
+            return None, None
+        etag = json.dumps(artifact, sort_keys=True)
+        if etag == if_none_match:
+            return None, etag
+        return json.loads(etag), etag
+
+    monkeypatch.setattr(rate_artifact, "load_artifact_with_etag", load)
+    monkeypatch.setattr(rate_artifact, "_STORED_RATINGS", {})
+    monkeypatch.setattr(
+        rate_artifact, "RATING_LOCAL_PATH", str(tmp_path / "stored_ratings.json")
+    )
+    monkeypatch.setattr(
+        rate_artifact, "_LOCAL_SAVE_STATE", {"changes": 0, "saved_at": float("-inf")}
+    )
+    artifacts["_loaded"] = loaded
+    return artifacts
+
+
+def _rate(artifact_id):
+    return rate_artifact.handler(
+        {"httpMethod": "GET", "pathParameters": {"id": artifact_id}}, None
+    )
+
+
+def _model(net_score=0.8):
+    return {
+        "type": "model",
+        "url": "https://huggingface.co/x/y",
+        "rating": {"net_score": net_score},
+    }
+
+
+def test_rate_artifact_returns_stored_rating(stored):
+    """Test that an existing rating is returned without re-evaluating."""
+    artifact_id = "0f8fad5b-d9cb-469f-a165-70867728950e"
+    stored[artifact_id] = _model()
+
+    response = _rate(artifact_id)
+
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"]) == {"net_score": 0.8}
+
+
+@pytest.mark.parametrize(
+    "artifact_id", [None, "", "a/b", "../index/name_index", "id with space"]
+)
+def test_rate_artifact_rejects_malformed_id(stored, artifact_id):
+    """Test that missing or malformed ids return 400 without an S3 read."""
+    assert _rate(artifact_id)["statusCode"] == 400
+    assert stored["_loaded"] == []
+
+
+def test_rate_artifact_revalidates_cached_rating(stored):
+    """Test that repeat calls send the cached ETag and still see changes and deletes."""
+    artifact_id = "0f8fad5b-d9cb-469f-a165-70867728950e"
+    stored[artifact_id] = _model()
+
+    _rate(artifact_id)
+    assert json.loads(_rate(artifact_id)["body"]) == {"net_score": 0.8}
+    assert stored["_loaded"][1][1] is not None
+
+    stored[artifact_id]["rating"] = {"net_score": 0.4}
+    assert json.loads(_rate(artifact_id)["body"]) == {"net_score": 0.4}
+
+    del stored[artifact_id]
+    assert _rate(artifact_id)["statusCode"] == 404
+    assert rate_artifact._STORED_RATINGS == {}
+
+
+def test_rate_artifact_reuses_local_copy_after_reinit(stored, monkeypatch):
+    """Test that a re-initialized container revalidates the ratings saved in /tmp."""
+    artifact_id = "0f8fad5b-d9cb-469f-a165-70867728950e"
+    stored[artifact_id] = _model()
+    _rate(artifact_id)
+
+    monkeypatch.setattr(
+        rate_artifact, "_STORED_RATINGS", rate_artifact._load_local_ratings()
+    )
+    response = _rate(artifact_id)
+
+    assert json.loads(response["body"]) == {"net_score": 0.8}
+    assert stored["_loaded"][-1][1] is not None
+
+
+def test_rate_artifact_batches_local_copy_writes(stored, monkeypatch):
+    """Test that a cold fill rewrites the /tmp copy once per batch of changes."""
+    monkeypatch.setattr(rate_artifact, "RATING_LOCAL_SAVE_CHANGES", 3)
+    saves = []
+    save = rate_artifact._save_local_ratings
+    monkeypatch.setattr(
+        rate_artifact, "_save_local_ratings", lambda: saves.append(1) or save()
+    )
+
+    for n in range(7):
+        stored[f"model-{n}"] = _model(n)
+        _rate(f"model-{n}")
+    _rate("model-0")
+
+    # The first change is written at once, then every third one
+    assert len(saves) == 3
+
+
+def test_rate_artifact_local_copy_drops_evicted_ratings(stored, monkeypatch):
+    """Test that ratings evicted from the cache are also dropped from /tmp."""
+    monkeypatch.setattr(rate_artifact, "RATING_LOOKUP_MAX_ENTRIES", 1)
+    monkeypatch.setattr(rate_artifact, "RATING_LOCAL_SAVE_CHANGES", 1)
+    for artifact_id in ("model-a", "model-b"):
+        stored[artifact_id] = _model()
+        _rate(artifact_id)
+
+    assert list(rate_artifact._load_local_ratings()) == ["model-b"]
+
+
+def test_rate_artifact_ignores_corrupt_local_copy(stored):
+    """Test that an unreadable /tmp copy starts an empty cache."""
+    with open(rate_artifact.RATING_LOCAL_PATH, "w") as f:
+        f.write("{not json")
+
+    assert rate_artifact._load_local_ratings() == {}
+
+
+def test_rate_artifact_preflight_skips_invocation_log(stored, monkeypatch):
+    """Test that OPTIONS returns before the invocation is logged or S3 is read."""
+    def fail_log(*args, **kwargs):
+        raise AssertionError("preflight logged as an invocation")
+
+    monkeypatch.setattr(rate_artifact, "log_invocation", fail_log)
+
+    response = rate_artifact.handler({"httpMethod": "OPTIONS"}, None)
+
+    assert response["statusCode"] == 200
+    assert stored["_loaded"] == []
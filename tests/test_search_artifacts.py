@@ -0,0 +1,285 @@
+"""Tests for search_artifacts (byRegEx) Lambda handler."""
+
+import json
+
+import pytest
+
+from lambda_handlers import search_artifacts
+from lambda_handlers.search_artifacts import (
+    UnsafeRegexError,
+    _anchored_literal_prefix,
+    _required_literal,
+    _compile_search_pattern,
+    _search_artifacts_by_regex,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_pattern_cache():
+    """Compiled patterns depend on the engine selected per test."""
+    _compile_search_pattern.cache_clear()
+    yield
+    _compile_search_pattern.cache_clear()
+
+
+def _artifact(artifact_id, name, artifact_type="model"):
+    """Name index entry, as _search_artifacts_by_regex receives it."""
+    return {"name": name, "id": artifact_id, "type": artifact_type}
+
+
+def _name_index(entries):
+    return {
+        "artifacts": {md["id"]: md for md in entries},
+        "name_lc": {md["id"]: md["name"].lower() for md in entries},
+    }
+
+
+ARTIFACTS = [
+    _artifact("1", "bert-base"),
+    _artifact("2", "BERT-large"),
+    _artifact("3", "gpt2"),
+    _artifact("4", "roberta", "dataset"),
+    _artifact("5", "ſtable"),
+]
+
+
+@pytest.mark.parametrize("pattern, prefix", [
+    ("^bert", "bert"),
+    ("^BERT-.*", "bert-"),
+    ("^berts?", "bert"),
+    ("^bert+", "bert"),
+    ("^ab{2}", "a"),
+    ("bert", ""),
+    ("^bert|gpt", ""),
+    ("(?i)^bert", ""),
+    ("^[bB]ert", ""),
+    ("^\\w+", ""),
+])
+def test_anchored_literal_prefix(pattern, prefix):
+    """Test extraction of the literal prefix used to prefilter names."""
+    assert _anchored_literal_prefix(pattern) == prefix
+
+
+@pytest.mark.parametrize("pattern, literal", [
+    ("bert", "bert"),
+    (".*BERT-large.*", "bert-large"),
+    ("^ro.erta$", "erta"),
+    ("berts?-l", "bert"),
+    ("ab{2}cd", "cd"),
+    ("x(bert)+y", "x"),
+    ("[bert]+-base\\d", "-base"),
+    ("\\(tiny\\)gpt", "tiny"),
+    ("bert|gpt", ""),
+    ("(?i)bert", ""),
+    ("\\w+", ""),
+])
+def test_required_literal(pattern, literal):
+    """Test extraction of the substring every match must contain."""
+    assert _required_literal(pattern) == literal
+
+
+@pytest.mark.parametrize("pattern, expected_ids", [
+    ("^bert", ["1", "2"]),
+    ("bert", ["1", "2", "4"]),
+    ("^berts?-l", ["2"]),
+    ("^gpt|roberta", ["3", "4"]),
+    ("^stable", ["5"]),
+    ("^nothing", []),
+    ("e.t-", ["1", "2"]),
+    ("r?o?berta$", ["4"]),
+    ("[a-z]table", ["5"]),
+])
+def test_search_matches_full_regex_semantics(engine, pattern, expected_ids):
+    """Test that prefiltering never changes which artifacts match."""
+    results = _search_artifacts_by_regex(ARTIFACTS, pattern)
+    assert sorted(r["id"] for r in results) == expected_ids
+
+
+def test_compiled_patterns_are_reused():
+    """Test that repeated patterns reuse the compiled object."""
+    assert _compile_search_pattern("^bert") is _compile_search_pattern("^bert")
+
+
+@pytest.mark.parametrize("pattern, is_literal", [
+    ("bert", True),
+    ("bert base_v2", True),
+    ("bert.base", False),
+    ("^bert", False),
+    ("a|b", False),
+    ("\\d", False),
+    ("[ab]", False),
+])
+def test_pure_literal_detection(pattern, is_literal):
+    """Test which patterns take the substring fast path."""
+    assert bool(search_artifacts._PURE_LITERAL.match(pattern)) is is_literal
+
+
+def test_literal_search_matches_regex_results(monkeypatch):
+    """Test that the literal fast path agrees with the regex engine."""
+    artifacts = ARTIFACTS + [
+        _artifact("6", "my-BERT-tiny"),
+        _artifact("7", "beRT\u212a"),
+    ]
+    fast = _search_artifacts_by_regex(artifacts, "bert")
+
+    monkeypatch.setattr(
+        search_artifacts, "_PURE_LITERAL", search_artifacts.re.compile(r"(?!)")
+    )
+    slow = _search_artifacts_by_regex(artifacts, "bert")
+
+    assert fast == slow
+    assert sorted(r["id"] for r in fast) == ["1", "2", "4", "6", "7"]
+
+
+def test_search_results_sorted_by_name():
+    """Test that results are sorted case-insensitively by name."""
+    results = _search_artifacts_by_regex(ARTIFACTS, "^bert")
+    assert [r["name"] for r in results] == ["bert-base", "BERT-large"]
+
+
+@pytest.fixture
+def without_re2(monkeypatch):
+    """Force the backtracking `re` fallback."""
+    monkeypatch.setattr(search_artifacts, "re2", None)
+
+
+@pytest.fixture(params=["re2", "re"])
+def engine(request, monkeypatch):
+    """Run a test against both regex engines (re2 only when installed)."""
+    if request.param == "re2":
+        pytest.importorskip("re2")
+    else:
+        monkeypatch.setattr(search_artifacts, "re2", None)
+    return request.param
+
+
+def test_search_rejects_nested_quantifiers(without_re2):
+    """Test that catastrophic-backtracking shapes are refused by the re fallback."""
+    with pytest.raises(UnsafeRegexError):
+        _search_artifacts_by_regex(ARTIFACTS, "(a+)+$")
+
+
+@pytest.mark.parametrize("pattern", [
+    "((a+))+",
+    "(?:a+)+",
+    "(x(a*)y)*",
+    "((ab|c)+)+",
+])
+def test_check_complexity_rejects_deep_nested_quantifiers(pattern):
+    """Test that quantifiers nested through several groups are refused."""
+    with pytest.raises(UnsafeRegexError):
+        search_artifacts._check_regex_complexity(pattern)
+
+
+@pytest.mark.parametrize(
+    "pattern", ["(a+)+", "(a*)*", "(a+b)*", "(ab{1,3})+", "(a?){2}"]
+)
+def test_check_complexity_rejects_nested_quantifiers(pattern):
+    """Test the single-scan nested-quantifier guardrail."""
+    with pytest.raises(UnsafeRegexError):
+        search_artifacts._check_regex_complexity(pattern)
+
+
+@pytest.mark.parametrize("pattern", [
+    "^bert(-base)?$",
+    "[+*](ab)+",
+    "(a)(b+)",
+])
+def test_check_complexity_allows_safe_groups(pattern):
+    """Test that quantified groups without inner quantifiers are allowed."""
+    search_artifacts._check_regex_complexity(pattern)
+
+
+def test_search_time_budget(monkeypatch):
+    """Test that exceeding the aggregate matching budget aborts the search."""
+    monkeypatch.setattr(search_artifacts, "MATCH_TIME_BUDGET_SECONDS", -1.0)
+    with pytest.raises(UnsafeRegexError):
+        _search_artifacts_by_regex(ARTIFACTS, "bert")
+
+
+def test_search_text_is_truncated(monkeypatch):
+    """Test that only the first MAX_SEARCH_TEXT_LENGTH characters are matched."""
+    monkeypatch.setattr(search_artifacts, "MAX_SEARCH_TEXT_LENGTH", 4)
+    artifacts = [_artifact("1", "abcdTAIL")]
+    assert _search_artifacts_by_regex(artifacts, "abcd")
+    assert not _search_artifacts_by_regex(artifacts, "TAIL")
+
+
+def test_search_allows_nested_quantifiers_with_re2():
+    """Test that RE2 runs shapes that would backtrack catastrophically in re."""
+    pytest.importorskip("re2")
+    results = _search_artifacts_by_regex(ARTIFACTS, "^(b+e+r+t+)+-base$")
+    assert [r["id"] for r in results] == ["1"]
+
+
+def test_search_falls_back_for_backreferences(engine):
+    """Test that patterns RE2 cannot express still work through re."""
+    results = _search_artifacts_by_regex([_artifact("9", "abab")], "^(ab)\\1$")
+    assert [r["id"] for r in results] == ["9"]
+
+
+def test_search_rejects_long_pattern(engine):
+    """Test that overly long patterns are refused by either engine."""
+    with pytest.raises(UnsafeRegexError):
+        _search_artifacts_by_regex(ARTIFACTS, "a" * 201)
+
+
+def test_search_rejects_invalid_regex(engine):
+    """Test that an invalid pattern raises ValueError."""
+    with pytest.raises(ValueError):
+        _search_artifacts_by_regex(ARTIFACTS, "[unclosed")
+
+
+def test_handler_returns_matches(monkeypatch):
+    """Test the handler end to end against mocked storage."""
+    monkeypatch.setattr(
+        search_artifacts, "load_name_index", lambda: _name_index(ARTIFACTS)
+    )
+    event = {"httpMethod": "POST", "body": json.dumps({"regex": "^gpt"})}
+
+    response = search_artifacts.handler(event, None)
+
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"]) == [
+        {"name": "gpt2", "id": "3", "type": "model"}
+    ]
+
+
+def test_handler_no_match_returns_404(monkeypatch):
+    """Test that no matches yields 404."""
+    monkeypatch.setattr(search_artifacts, "load_name_index", lambda: _name_index([]))
+    event = {"httpMethod": "POST", "body": json.dumps({"regex": "^gpt"})}
+
+    assert search_artifacts.handler(event, None)["statusCode"] == 404
+
+
+def test_handler_missing_regex_returns_400():
+    """Test that a missing regex field yields 400."""
+    event = {"httpMethod": "POST", "body": json.dumps({})}
+
+    assert search_artifacts.handler(event, None)["statusCode"] == 400
+
+
+def test_handler_preflight_skips_search(monkeypatch):
+    """Test that OPTIONS is answered without touching storage."""
+    def fail():
+        raise AssertionError("storage read on preflight")
+
+    monkeypatch.setattr(search_artifacts, "load_name_index", fail)
+
+    response = search_artifacts.handler({"httpMethod": "OPTIONS"}, None)
+
+    assert response["statusCode"] == 200
+
+
+def test_handler_without_http_method_runs_search(monkeypatch):
+    """Test that HTTP API v2 events (no httpMethod) still reach the search."""
+    monkeypatch.setattr(
+        search_artifacts, "load_name_index", lambda: _name_index(ARTIFACTS)
+    )
+    event = {
+        "requestContext": {"http": {"method": "POST"}},
+        "body": json.dumps({"regex": "^gpt"}),
+    }
+
+    assert search_artifacts.handler(event, None)["statusCode"] == 200
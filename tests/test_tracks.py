@@ -80,3 +80,19 @@ def test_response_body_is_valid_json():
     # Should not raise an exception
     body = json.loads(response["body"])
     assert isinstance(body, dict)
+
+
+def test_body_encoded_once(monkeypatch):
+    """Test that requests reuse the body encoded at import."""
+    import lambda_handlers.tracks as tracks
+
+    def fail_dumps(*args, **kwargs):
+        raise AssertionError("tracks body re-encoded")
+
+    monkeypatch.setattr("lambda_handlers.utils.json_dumps", fail_dumps)
+
+    first = tracks.handler({"httpMethod": "GET", "headers": {}}, Mock())
+    second = tracks.handler({"httpMethod": "GET", "headers": {}}, Mock())
+
+    assert first["body"] == second["body"]
+    assert first["headers"] is not second["headers"]
@@ -0,0 +1,131 @@
+"""Tests for the structured logging helpers in lambda_handlers.utils."""
+
+import json
+import logging
+
+import pytest
+
+import lambda_handlers.utils as utils
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def captured(monkeypatch):
+    handler = ListHandler()
+    utils.logger.addHandler(handler)
+    original_level = utils.logger.level
+    yield handler
+    utils.logger.removeHandler(handler)
+    utils.logger.setLevel(original_level)
+
+
+def test_log_invocation_skips_event_dump_at_info(captured, monkeypatch):
+    """Test that the event is not serialized when DEBUG is disabled."""
+    utils.logger.setLevel(logging.INFO)
+
+    def fail_dumps(*args, **kwargs):
+        raise AssertionError("event serialized at INFO")
+
+    monkeypatch.setattr(utils, "json_dumps", fail_dumps)
+    utils.log_invocation("handler_x", {"httpMethod": "POST", "body": "abcd"}, None)
+
+    assert [r.getMessage() for r in captured.records] == ["handler_x invoked"]
+    assert captured.records[0].event_size == 4
+
+
+def test_log_invocation_dumps_event_at_debug(captured):
+    """Test that the full event is logged when DEBUG is enabled."""
+    utils.logger.setLevel(logging.DEBUG)
+
+    utils.log_invocation("handler_x", {"httpMethod": "GET"}, None)
+
+    messages = [r.getMessage() for r in captured.records]
+    assert messages[0] == "handler_x invoked"
+    assert messages[1].startswith("handler_x event: ")
+    assert json.loads(messages[1][len("handler_x event: "):]) == {"httpMethod": "GET"}
+
+
+def test_log_event_skips_disabled_levels(captured):
+    """Test that a filtered-out level returns before reading the event."""
+    utils.logger.setLevel(logging.WARNING)
+
+    class UnreadableEvent(dict):
+        def get(self, *args, **kwargs):
+            raise AssertionError("event read for a disabled level")
+
+    utils.log_event("info", "handler_x invoked", event=UnreadableEvent())
+
+    assert captured.records == []
+    with pytest.raises(ValueError):
+        utils.log_event("loud", "bad level")
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_helpers_round_trip(monkeypatch, use_orjson):
+    """Test that the JSON helpers behave the same with and without orjson."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(utils, "orjson", None)
+
+    payload = {"regex": "^bert", "n": [1, 2.5, None, True], "s": "caf\u00e9"}
+    assert json.loads(utils.json_dumps(payload)) == payload
+    assert utils.json_loads(utils.json_dumps(payload)) == payload
+    with pytest.raises(json.JSONDecodeError):
+        utils.json_loads("{not json")
+
+    # Same output as stdlib json for non-string keys and very large integers
+    assert json.loads(utils.json_dumps({1: "a"})) == {"1": "a"}
+    assert json.loads(utils.json_dumps({"big": 2 ** 70})) == {"big": 2 ** 70}
+    response = utils.create_response(200, {"ok": True})
+    assert json.loads(response["body"]) == {"ok": True}
+
+
+def test_timed_log_logs_outcome_once_on_exit(captured):
+    """Test that TimedLog logs the recorded outcome once, after the block."""
+    utils.logger.setLevel(logging.INFO)
+
+    with utils.TimedLog({"httpMethod": "POST"}, None) as timed:
+        response = timed.respond(
+            400,
+            {"error": "bad"},
+            "Bad input",
+            level="warning",
+            error_code="bad_input",
+            model_id="m1",
+        )
+        assert captured.records == []
+
+    assert response["statusCode"] == 400
+    assert json.loads(response["body"]) == {"error": "bad"}
+    [record] = captured.records
+    assert record.getMessage() == "Bad input"
+    assert record.levelno == logging.WARNING
+    assert record.status == 400
+    assert record.error_code == "bad_input"
+    assert record.model_id == "m1"
+    assert record.latency >= 0
+
+
+def test_timed_log_keeps_exception_info(captured):
+    """Test that exc_info captured in an except block survives to the exit log."""
+    utils.logger.setLevel(logging.INFO)
+
+    with utils.TimedLog({}, None) as timed:
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            timed.respond(
+                500, {"error": "boom"}, "Unexpected error", level="error", exc_info=True
+            )
+
+    [record] = captured.records
+    assert record.exc_info[0] is RuntimeError